@@ -0,0 +1,123 @@
+"""
+Client overhead benchmark.
+
+Runs the SDK against the in-process MockTransport (no network, no server),
+so the numbers are the client's own cost and its concurrency behaviour:
+
+- per-call overhead of compress() / compress_async() / compress_stream()
+  with zero simulated latency
+- throughput of compress_many() / compress_many_async() at a fixed simulated
+  latency, against the ideal concurrency * 1000 / latency_ms
+
+Usage:
+    python benchmarks/client_overhead.py [--calls 2000] [--latency-ms 20] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, List
+
+from compresr import CompressionClient
+from compresr.services.mock import MockConfig, MockTransport
+
+API_KEY = "cmp_benchmark"
+CONTEXT = " ".join(f"word{i}" for i in range(200))
+
+
+def _client(transport: MockTransport, pool_size: int = 10) -> CompressionClient:
+    return CompressionClient(
+        api_key=API_KEY, transport=transport, async_transport=transport, pool_size=pool_size
+    )
+
+
+def _report(name: str, samples: List[float]) -> None:
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(
+        f"{name:<24} p50 {statistics.median(samples) * 1e6:8.1f} us"
+        f"   p99 {p99 * 1e6:8.1f} us   ({len(samples)} calls)"
+    )
+
+
+def _time_calls(fn: Callable[[], object], calls: int) -> List[float]:
+    samples = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def bench_overhead(calls: int) -> None:
+    print("== Per-call overhead (0 ms simulated latency) ==")
+    with _client(MockTransport()) as client:
+        client.compress(context=CONTEXT)  # warm up pool and imports
+        _report("compress", _time_calls(lambda: client.compress(context=CONTEXT), calls))
+        _report(
+            "compress_stream",
+            _time_calls(lambda: list(client.compress_stream(context=CONTEXT)), calls // 4),
+        )
+
+        async def run_async() -> List[float]:
+            samples = []
+            for _ in range(calls):
+                started = time.perf_counter()
+                await client.compress_async(context=CONTEXT)
+                samples.append(time.perf_counter() - started)
+            await client.close()
+            return samples
+
+        _report("compress_async", asyncio.run(run_async()))
+
+
+def bench_concurrency(calls: int, latency_ms: float, concurrency: int) -> None:
+    print(f"\n== Concurrency ({latency_ms:g} ms simulated latency, {concurrency} in flight) ==")
+    ideal = concurrency * 1000 / latency_ms
+    config = MockConfig(latency_ms=latency_ms)
+
+    transport = MockTransport(config)
+    with _client(transport, pool_size=concurrency) as client:
+        started = time.perf_counter()
+        for _ in client.compress_many([CONTEXT] * calls, max_concurrency=concurrency):
+            pass
+        elapsed = time.perf_counter() - started
+    print(
+        f"{'compress_many':<24} {calls / elapsed:8.0f} req/s"
+        f"   ({calls / elapsed / ideal:5.1%} of ideal, "
+        f"max in flight {transport.stats.max_in_flight})"
+    )
+
+    transport = MockTransport(config)
+
+    async def run_async() -> float:
+        async with _client(transport, pool_size=concurrency) as client:
+            started = time.perf_counter()
+            async for _ in client.compress_many_async(
+                [CONTEXT] * calls, max_concurrency=concurrency
+            ):
+                pass
+            return time.perf_counter() - started
+
+    elapsed = asyncio.run(run_async())
+    print(
+        f"{'compress_many_async':<24} {calls / elapsed:8.0f} req/s"
+        f"   ({calls / elapsed / ideal:5.1%} of ideal, "
+        f"max in flight {transport.stats.max_in_flight})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    bench_overhead(args.calls)
+    bench_concurrency(args.calls, args.latency_ms, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
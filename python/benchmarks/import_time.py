@@ -0,0 +1,113 @@
+"""
+Import time benchmark.
+
+Times ``import compresr`` in fresh interpreters against a baseline that
+imports what the SDK cannot avoid (asyncio, and pydantic with one model
+built), so the difference is the SDK's own cold-start cost. Also checks
+that modules deferred until first use (httpx, sqlite3, the optional numpy,
+orjson, msgspec and zstandard, the opt-in features, batch and lean result
+helpers, and the tool discovery, usage and error response schemas) are not
+imported with the package.
+
+Exits with status 1 if the median overhead exceeds --budget-ms or a
+deferred module was imported, so it can guard against regressions in CI.
+The default budget is the overhead measured before any of the deferral
+work (about 100 ms) plus a 20% margin for noisy machines.
+
+Usage:
+    python benchmarks/import_time.py [--runs 15] [--budget-ms 120]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import List
+
+BASELINE = "import asyncio, pydantic\nclass M(pydantic.BaseModel): x: int = 0"
+DEFERRED = [
+    "httpx",
+    "sqlite3",
+    "numpy",
+    "orjson",
+    "msgspec",
+    "zstandard",
+    "compresr.services.balancer",
+    "compresr.services.batching",
+    "compresr.services.cache",
+    "compresr.services.circuit",
+    "compresr.services.coalescer",
+    "compresr.services.codec",
+    "compresr.services.concurrency",
+    "compresr.services.disk_cache",
+    "compresr.services.encoding",
+    "compresr.services.hedging",
+    "compresr.services.incremental",
+    "compresr.services.lean",
+    "compresr.services.metrics",
+    "compresr.services.rate_limit",
+    "compresr.services.retry",
+    "compresr.services.single_flight",
+    "compresr.schemas.tool_discovery",
+    "compresr.schemas.usage",
+    "compresr.exceptions.responses",
+]
+
+
+def _time(statement: str) -> float:
+    """Seconds to run statement in a fresh interpreter."""
+    code = (
+        "import time\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - started)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(out.stdout)
+
+
+def imported_deferred() -> List[str]:
+    """Deferred modules that ``import compresr`` imported anyway."""
+    code = (
+        "import sys, json, compresr\n"
+        f"print(json.dumps([m for m in {DEFERRED!r} if m in sys.modules]))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    loaded: List[str] = json.loads(out.stdout)
+    return loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=120.0)
+    args = parser.parse_args()
+
+    # Alternate the two so machine load drifts affect both alike, and take the
+    # overhead from pairs of neighbouring runs
+    totals: List[float] = []
+    baselines: List[float] = []
+    for _ in range(args.runs):
+        totals.append(_time("import compresr"))
+        baselines.append(_time(BASELINE))
+    total = statistics.median(totals)
+    baseline = statistics.median(baselines)
+    overhead = statistics.median(t - b for t, b in zip(totals, baselines))
+    print(f"import compresr          {total * 1000:8.1f} ms (median of {args.runs})")
+    print(f"asyncio + pydantic       {baseline * 1000:8.1f} ms")
+    print(f"SDK overhead             {overhead * 1000:8.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    loaded = imported_deferred()
+    if loaded:
+        print(f"FAIL: imported at import time: {', '.join(loaded)}")
+        failed = True
+    if overhead * 1000 > args.budget_ms:
+        print("FAIL: over budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+JSON codec benchmark.
+
+Compares the per-request serialization cost of the previous path
+(model_dump -> json.dumps -> encode, then bytes -> json.loads ->
+model_validate) with the codec path (codec.dumps straight to bytes, then
+model_validate_json straight from bytes), for every installed codec and a
+range of context sizes. The response echoes the context back in
+original_context, as the API does.
+
+Reports CPU time per request (encode + decode) and peak memory allocated
+while handling one request.
+
+Usage:
+    python benchmarks/json_codec.py [--sizes 1000,100000,1000000] [--repeat 50]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from compresr.schemas import CompressRequest, CompressResponse
+from compresr.services.codec import CODECS, JsonCodec
+
+WORD = "token "
+
+
+def _payloads(size: int) -> Tuple[CompressRequest, bytes]:
+    context = (WORD * (size // len(WORD) + 1))[:size]
+    compressed = context[: size // 2]
+    req = CompressRequest(context=context, compression_model_name="espresso_v1")
+    response = {
+        "success": True,
+        "data": {
+            "original_context": context,
+            "compressed_context": compressed,
+            "original_tokens": size // len(WORD),
+            "compressed_tokens": size // len(WORD) // 2,
+            "actual_compression_ratio": 0.5,
+            "tokens_saved": size // len(WORD) // 2,
+            "duration_ms": 12,
+        },
+    }
+    return req, json.dumps(response).encode("utf-8")
+
+
+def _stdlib_path(req: CompressRequest, response: bytes) -> None:
+    json.dumps(req.model_dump(exclude_none=True)).encode("utf-8")
+    CompressResponse.model_validate(json.loads(response.decode("utf-8")))
+
+
+def _codec_path(codec: JsonCodec) -> Callable[[CompressRequest, bytes], None]:
+    def run(req: CompressRequest, response: bytes) -> None:
+        codec.dumps(req.model_dump(exclude_none=True))
+        CompressResponse.model_validate_json(response)
+
+    return run
+
+
+def _measure(
+    fn: Callable[[CompressRequest, bytes], None], req: CompressRequest, response: bytes, repeat: int
+) -> Tuple[float, int]:
+    fn(req, response)  # warm up
+    started = time.process_time()
+    for _ in range(repeat):
+        fn(req, response)
+    cpu = (time.process_time() - started) / repeat
+
+    tracemalloc.start()
+    fn(req, response)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    sizes: List[int] = [int(s) for s in args.sizes.split(",")]
+
+    paths: List[Tuple[str, Callable[[CompressRequest, bytes], None]]] = [
+        ("previous (stdlib)", _stdlib_path)
+    ]
+    for name, codec_type in CODECS.items():
+        try:
+            paths.append((f"codec {name}", _codec_path(codec_type())))
+        except ImportError:
+            print(f"(skipping {name}: not installed)")
+
+    for size in sizes:
+        req, response = _payloads(size)
+        print(f"\n== context {size:,} bytes ==")
+        baseline = None
+        for name, fn in paths:
+            cpu, peak = _measure(fn, req, response, args.repeat)
+            baseline = baseline or cpu
+            print(
+                f"{name:<20} {cpu * 1e6:10.1f} us/request ({baseline / cpu:4.1f}x)"
+                f"   peak alloc {peak / 1024:10.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -28,18 +28,68 @@ Quick Start - Compression:
     )
 """
 
-from importlib.metadata import PackageNotFoundError, version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .clients import CompressionClient
-from .config import MODELS
+from .config import MODELS, sdk_version
+from .services.deadline import Timeouts
+
+if TYPE_CHECKING:
+    from .services.balancer import BalancingStrategy, LoadBalancing
+    from .services.cache import ResultCache
+    from .services.circuit import CircuitBreakerConfig
+    from .services.coalescer import CoalescingConfig
+    from .services.codec import JsonCodec
+    from .services.concurrency import AdaptiveConcurrency
+    from .services.disk_cache import DiskCache
+    from .services.encoding import BodyCompression
+    from .services.hedging import HedgingPolicy
+    from .services.rate_limit import RateLimit
+    from .services.retry import RetryPolicy
+
+# Opt-in features whose modules are imported on first access
+_LAZY = {
+    "BalancingStrategy": ".services.balancer",
+    "LoadBalancing": ".services.balancer",
+    "ResultCache": ".services.cache",
+    "CircuitBreakerConfig": ".services.circuit",
+    "CoalescingConfig": ".services.coalescer",
+    "JsonCodec": ".services.codec",
+    "AdaptiveConcurrency": ".services.concurrency",
+    "DiskCache": ".services.disk_cache",
+    "BodyCompression": ".services.encoding",
+    "HedgingPolicy": ".services.hedging",
+    "RateLimit": ".services.rate_limit",
+    "RetryPolicy": ".services.retry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # __version__ is resolved on first access to keep importlib.metadata off the import path
+    if name == "__version__":
+        return sdk_version()
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    __version__ = version("compresr")
-except PackageNotFoundError:
-    # Package not installed (e.g., running from source)
-    __version__ = "0.0.0-dev"
 
 __all__ = [
     "CompressionClient",
+    "CoalescingConfig",
+    "ResultCache",
+    "DiskCache",
+    "Timeouts",
+    "RetryPolicy",
+    "RateLimit",
+    "AdaptiveConcurrency",
+    "CircuitBreakerConfig",
+    "HedgingPolicy",
+    "LoadBalancing",
+    "BalancingStrategy",
+    "BodyCompression",
+    "JsonCodec",
     "MODELS",
 ]
@@ -4,6 +4,7 @@ SDK Configuration
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 def _get_base_url() -> str:
@@ -11,6 +12,19 @@ def _get_base_url() -> str:
     return os.getenv("COMPRESR_BASE_URL", "https://api.compresr.ai")
 
 
+@lru_cache(maxsize=None)
+def sdk_version() -> str:
+    """Installed package version, looked up once and only when first needed."""
+    # importlib.metadata is slow to import and to query, so not done at import time
+    from importlib.metadata import version
+
+    try:
+        return version("compresr")
+    except Exception:
+        # Package not installed (e.g., running from source)
+        return "0.0.0-dev"
+
+
 @dataclass(frozen=True)
 class APIConfig:
     """API configuration."""
@@ -18,6 +32,15 @@ class APIConfig:
     API_KEY_PREFIX: str = "cmp_"
     DEFAULT_TIMEOUT: int = 60
     STREAM_TIMEOUT: int = 300
+    # httpx's own defaults, so pooling does not cap existing concurrency
+    DEFAULT_POOL_SIZE: int = 100
+    DEFAULT_KEEPALIVE_CONNECTIONS: int = 20
+    MAX_BATCH_SIZE: int = 100
+    DEFAULT_BATCH_CONCURRENCY: int = 4
+    DEFAULT_MANY_CONCURRENCY: int = 10
+    # Liveness probe used to re-admit ejected endpoints (outside /api/)
+    HEALTH_PATH: str = "/health"
+    HEALTH_PROBE_TIMEOUT: float = 2.0
 
     @property
     def BASE_URL(self) -> str:
@@ -46,6 +69,7 @@ class Headers:
 
     API_KEY: str = "X-API-Key"
     CONTENT_TYPE: str = "Content-Type"
+    CONTENT_ENCODING: str = "Content-Encoding"
     ACCEPT: str = "Accept"
     JSON: str = "application/json"
     SSE: str = "text/event-stream"
@@ -5,35 +5,67 @@ Exact copies of exceptions from backend.
 Single source of truth maintained in backend.
 """
 
-from .exceptions import (  # Response models; Exception classes
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import (  # Exception classes
     ApiKeyBudgetError,
     AuthenticationError,
-    AuthenticationErrorResponse,
     BudgetLimitError,
+    CircuitOpenError,
     CompresrError,
     ConnectionError,
-    ConnectionErrorResponse,
     ContentPolicyError,
     ContextWindowExceededError,
     DailyLimitError,
-    ErrorResponse,
+    DeadlineExceededError,
     InsufficientCreditsError,
     ModelNotFoundError,
     NotFoundError,
-    NotFoundErrorResponse,
     RateLimitError,
-    RateLimitErrorResponse,
     ScopeError,
-    ScopeErrorResponse,
     ServerError,
-    ServerErrorResponse,
     ServiceUnavailableError,
     TargetAuthenticationError,
     TimeoutError,
     ValidationError,
-    ValidationErrorResponse,
 )
 
+if TYPE_CHECKING:
+    from .responses import (
+        AuthenticationErrorResponse,
+        ConnectionErrorResponse,
+        ErrorResponse,
+        NotFoundErrorResponse,
+        RateLimitErrorResponse,
+        ScopeErrorResponse,
+        ServerErrorResponse,
+        ValidationErrorResponse,
+    )
+
+# Response models are only for documentation, so they are imported on first access
+_RESPONSE_MODELS = frozenset(
+    {
+        "ErrorResponse",
+        "ValidationErrorResponse",
+        "AuthenticationErrorResponse",
+        "RateLimitErrorResponse",
+        "ScopeErrorResponse",
+        "ServerErrorResponse",
+        "NotFoundErrorResponse",
+        "ConnectionErrorResponse",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _RESPONSE_MODELS:
+        value = getattr(import_module(".responses", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Response models
     "ErrorResponse",
@@ -65,5 +97,7 @@ __all__ = [
     "ContentPolicyError",
     # Service
     "TimeoutError",
+    "DeadlineExceededError",
     "ServiceUnavailableError",
+    "CircuitOpenError",
 ]
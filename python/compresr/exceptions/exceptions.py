@@ -1,85 +1,12 @@
 """
 Compresr SDK Exceptions
 
-Exception classes and response models for API error handling.
+Exception classes for API error handling. The error response models are
+in responses.py.
 """
 
 from typing import Optional
 
-from pydantic import BaseModel
-
-# =============================================================================
-# Response Models (for documentation)
-# =============================================================================
-
-
-class ErrorResponse(BaseModel):
-    """Generic error response."""
-
-    success: bool = False
-    error: str
-    detail: Optional[str] = None
-    code: Optional[str] = None
-
-
-class ValidationErrorResponse(BaseModel):
-    """Validation error - invalid input."""
-
-    success: bool = False
-    error: str
-    code: str = "validation_error"
-    field: Optional[str] = None
-
-
-class AuthenticationErrorResponse(BaseModel):
-    """Authentication error - invalid/missing API key."""
-
-    success: bool = False
-    error: str = "Authentication failed"
-    code: str = "authentication_error"
-
-
-class RateLimitErrorResponse(BaseModel):
-    """Rate limit error - too many requests."""
-
-    success: bool = False
-    error: str = "Rate limit exceeded"
-    code: str = "rate_limit_exceeded"
-    retry_after: Optional[int] = None
-
-
-class ScopeErrorResponse(BaseModel):
-    """Scope error - API key lacks permission."""
-
-    success: bool = False
-    error: str = "Insufficient permissions"
-    code: str = "scope_error"
-
-
-class ServerErrorResponse(BaseModel):
-    """Server error - internal error."""
-
-    success: bool = False
-    error: str = "Internal server error"
-    code: str = "server_error"
-
-
-class NotFoundErrorResponse(BaseModel):
-    """Not found error - resource doesn't exist."""
-
-    success: bool = False
-    error: str = "Resource not found"
-    code: str = "not_found"
-
-
-class ConnectionErrorResponse(BaseModel):
-    """Connection error - failed to connect."""
-
-    success: bool = False
-    error: str = "Connection failed"
-    code: str = "connection_error"
-
-
 # =============================================================================
 # Exception Classes
 # =============================================================================
@@ -289,19 +216,40 @@ class ContentPolicyError(CompresrError):
 # =============================================================================
 
 
-class TimeoutError(CompresrError):
-    """Request timed out."""
+class TimeoutError(ConnectionError):
+    """Request timed out (a ConnectionError, as HTTP timeouts always were)."""
 
     def __init__(
         self,
         message: str = "Request timed out",
-        timeout_seconds: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
         response_data: Optional[dict] = None,
     ):
-        super().__init__(message, response_data, "timeout")
+        super().__init__(message, response_data=response_data)
+        self.code = "timeout"
         self.timeout_seconds = timeout_seconds
 
 
+class DeadlineExceededError(TimeoutError):
+    """The caller's deadline ran out before the call completed.
+
+    Raised client-side, and a TimeoutError so existing timeout handlers
+    catch it. Unlike other timeouts it says nothing about the service's
+    health, so retries, the circuit breaker, the load balancer and
+    adaptive concurrency ignore it.
+    """
+
+    def __init__(
+        self,
+        message: str = "Deadline exceeded",
+        deadline_seconds: Optional[float] = None,
+        response_data: Optional[dict] = None,
+    ):
+        super().__init__(message, timeout_seconds=deadline_seconds, response_data=response_data)
+        self.code = "deadline_exceeded"
+        self.deadline_seconds = deadline_seconds
+
+
 class ServiceUnavailableError(CompresrError):
     """Service is temporarily unavailable."""
 
@@ -317,6 +265,18 @@ class ServiceUnavailableError(CompresrError):
         self.retry_after = retry_after
 
 
+class CircuitOpenError(ServiceUnavailableError):
+    """Raised client-side without calling the API while the circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        retry_after: Optional[int] = None,
+    ):
+        super().__init__(message, service="compresr", retry_after=retry_after)
+        self.code = "circuit_open"
+
+
 class TargetAuthenticationError(CompresrError):
     """User's target LLM API key is invalid."""
 
@@ -0,0 +1,82 @@
+"""
+Compresr SDK Error Responses
+
+Response models for API errors (for documentation). Kept apart from the
+exception classes and imported on first access, so importing the SDK does
+not build them.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+# =============================================================================
+# Response Models (for documentation)
+# =============================================================================
+
+
+class ErrorResponse(BaseModel):
+    """Generic error response."""
+
+    success: bool = False
+    error: str
+    detail: Optional[str] = None
+    code: Optional[str] = None
+
+
+class ValidationErrorResponse(BaseModel):
+    """Validation error - invalid input."""
+
+    success: bool = False
+    error: str
+    code: str = "validation_error"
+    field: Optional[str] = None
+
+
+class AuthenticationErrorResponse(BaseModel):
+    """Authentication error - invalid/missing API key."""
+
+    success: bool = False
+    error: str = "Authentication failed"
+    code: str = "authentication_error"
+
+
+class RateLimitErrorResponse(BaseModel):
+    """Rate limit error - too many requests."""
+
+    success: bool = False
+    error: str = "Rate limit exceeded"
+    code: str = "rate_limit_exceeded"
+    retry_after: Optional[int] = None
+
+
+class ScopeErrorResponse(BaseModel):
+    """Scope error - API key lacks permission."""
+
+    success: bool = False
+    error: str = "Insufficient permissions"
+    code: str = "scope_error"
+
+
+class ServerErrorResponse(BaseModel):
+    """Server error - internal error."""
+
+    success: bool = False
+    error: str = "Internal server error"
+    code: str = "server_error"
+
+
+class NotFoundErrorResponse(BaseModel):
+    """Not found error - resource doesn't exist."""
+
+    success: bool = False
+    error: str = "Resource not found"
+    code: str = "not_found"
+
+
+class ConnectionErrorResponse(BaseModel):
+    """Connection error - failed to connect."""
+
+    success: bool = False
+    error: str = "Connection failed"
+    code: str = "connection_error"
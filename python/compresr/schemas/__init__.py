@@ -5,23 +5,18 @@ Exact copies of schemas from backend.
 Single source of truth maintained in backend.
 """
 
-from ..exceptions import (  # Response models; Exception classes
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict
+
+from ..exceptions import (  # Exception classes
     AuthenticationError,
-    AuthenticationErrorResponse,
     CompresrError,
     ConnectionError,
-    ConnectionErrorResponse,
-    ErrorResponse,
     NotFoundError,
-    NotFoundErrorResponse,
     RateLimitError,
-    RateLimitErrorResponse,
     ScopeError,
-    ScopeErrorResponse,
     ServerError,
-    ServerErrorResponse,
     ValidationError,
-    ValidationErrorResponse,
 )
 
 # Import local schemas
@@ -39,12 +34,51 @@ from .inference import (  # Streaming; Compression; Agnostic Batch; Query-Specif
     CompressResult,
     StreamChunk,
 )
-from .tool_discovery import (
-    DeferredTool,
-    ToolDiscoverySearchRequest,
-    ToolDiscoverySearchResponse,
-)
-from .usage import MoneyBalanceResponse, MoneyBalanceResult
+
+if TYPE_CHECKING:
+    from ..exceptions.responses import (
+        AuthenticationErrorResponse,
+        ConnectionErrorResponse,
+        ErrorResponse,
+        NotFoundErrorResponse,
+        RateLimitErrorResponse,
+        ScopeErrorResponse,
+        ServerErrorResponse,
+        ValidationErrorResponse,
+    )
+    from .tool_discovery import (
+        DeferredTool,
+        ToolDiscoverySearchRequest,
+        ToolDiscoverySearchResponse,
+    )
+    from .usage import MoneyBalanceResponse, MoneyBalanceResult
+
+# Schemas the client itself never uses are imported on first access
+_LAZY: Dict[str, str] = {
+    "ErrorResponse": "..exceptions.responses",
+    "ValidationErrorResponse": "..exceptions.responses",
+    "AuthenticationErrorResponse": "..exceptions.responses",
+    "RateLimitErrorResponse": "..exceptions.responses",
+    "ScopeErrorResponse": "..exceptions.responses",
+    "ServerErrorResponse": "..exceptions.responses",
+    "NotFoundErrorResponse": "..exceptions.responses",
+    "ConnectionErrorResponse": "..exceptions.responses",
+    "DeferredTool": ".tool_discovery",
+    "ToolDiscoverySearchRequest": ".tool_discovery",
+    "ToolDiscoverySearchResponse": ".tool_discovery",
+    "MoneyBalanceResponse": ".usage",
+    "MoneyBalanceResult": ".usage",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Base
@@ -24,8 +24,104 @@ Usage:
     )
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .compression import CompressionClient
+from .deadline import Timeouts
+from .transport import PoolStats, StreamTiming
+
+if TYPE_CHECKING:
+    from .balancer import BalancingStrategy, EndpointStats, LoadBalancing
+    from .batching import MeasuredBatchResponse, MeasuredBatchResult
+    from .cache import CacheStats, ResultCache
+    from .circuit import CircuitBreakerConfig, CircuitState, CircuitStats
+    from .coalescer import CoalescingConfig, CoalescingStats
+    from .codec import JsonCodec
+    from .concurrency import AdaptiveConcurrency, ConcurrencyStats
+    from .disk_cache import DiskCache
+    from .encoding import BodyCompression, WireRecord, WireStats
+    from .hedging import HedgingPolicy, HedgingStats
+    from .lean import LeanBatchResult, LeanResult
+    from .metrics import BatchMetrics
+    from .rate_limit import RateLimit, RateLimiterStats
+    from .retry import RetryPolicy, RetryStats
+    from .single_flight import SingleFlightStats
+
+# Opt-in features and batch results, whose modules are imported on first access
+_LAZY = {
+    "BalancingStrategy": ".balancer",
+    "EndpointStats": ".balancer",
+    "LoadBalancing": ".balancer",
+    "MeasuredBatchResponse": ".batching",
+    "MeasuredBatchResult": ".batching",
+    "CacheStats": ".cache",
+    "ResultCache": ".cache",
+    "CircuitBreakerConfig": ".circuit",
+    "CircuitState": ".circuit",
+    "CircuitStats": ".circuit",
+    "CoalescingConfig": ".coalescer",
+    "CoalescingStats": ".coalescer",
+    "JsonCodec": ".codec",
+    "AdaptiveConcurrency": ".concurrency",
+    "ConcurrencyStats": ".concurrency",
+    "DiskCache": ".disk_cache",
+    "BodyCompression": ".encoding",
+    "WireRecord": ".encoding",
+    "WireStats": ".encoding",
+    "HedgingPolicy": ".hedging",
+    "HedgingStats": ".hedging",
+    "LeanBatchResult": ".lean",
+    "LeanResult": ".lean",
+    "BatchMetrics": ".metrics",
+    "RateLimit": ".rate_limit",
+    "RateLimiterStats": ".rate_limit",
+    "RetryPolicy": ".retry",
+    "RetryStats": ".retry",
+    "SingleFlightStats": ".single_flight",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CompressionClient",
+    "CoalescingConfig",
+    "CoalescingStats",
+    "ResultCache",
+    "CacheStats",
+    "DiskCache",
+    "SingleFlightStats",
+    "Timeouts",
+    "RetryPolicy",
+    "RetryStats",
+    "RateLimit",
+    "RateLimiterStats",
+    "AdaptiveConcurrency",
+    "ConcurrencyStats",
+    "CircuitBreakerConfig",
+    "CircuitState",
+    "CircuitStats",
+    "HedgingPolicy",
+    "HedgingStats",
+    "LoadBalancing",
+    "BalancingStrategy",
+    "EndpointStats",
+    "BodyCompression",
+    "WireStats",
+    "WireRecord",
+    "JsonCodec",
+    "LeanResult",
+    "LeanBatchResult",
+    "BatchMetrics",
+    "MeasuredBatchResponse",
+    "MeasuredBatchResult",
+    "PoolStats",
+    "StreamTiming",
 ]
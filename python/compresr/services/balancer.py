@@ -0,0 +1,163 @@
+"""
+Balancer - Client-side load balancing across several API replicas.
+
+Internal module. Each request is routed to one base URL, picked by
+least-outstanding-requests or power-of-two-choices. An endpoint that
+fails with a connection error or 5xx is ejected; once its ejection time
+is up it is re-probed through /health in the background and only
+returns to rotation when the probe succeeds.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, List, Optional, Sequence
+
+from ..exceptions import ConnectionError as CompresrConnectionError
+from ..exceptions import DeadlineExceededError, ServerError, ServiceUnavailableError, TimeoutError
+
+# Errors that say "this replica is unhealthy", as opposed to "this request is bad"
+EJECT_ON = (CompresrConnectionError, TimeoutError, ServerError, ServiceUnavailableError)
+
+
+class BalancingStrategy(str, Enum):
+    LEAST_OUTSTANDING = "least_outstanding"
+    POWER_OF_TWO = "power_of_two"
+
+
+@dataclass(frozen=True)
+class LoadBalancing:
+    """Load balancing settings.
+
+    An ejected endpoint is re-probed after ejection_seconds; each failed
+    probe doubles the wait, up to max_ejection_seconds.
+    """
+
+    strategy: BalancingStrategy = BalancingStrategy.LEAST_OUTSTANDING
+    ejection_seconds: float = 5.0
+    max_ejection_seconds: float = 60.0
+    latency_smoothing: float = 0.2
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """Snapshot of one endpoint."""
+
+    url: str
+    healthy: bool
+    outstanding: int
+    requests: int
+    failures: int
+    ejections: int
+    latency_ms: Optional[float]
+
+
+class Endpoint:
+    """Mutable routing state of one base URL (guarded by the balancer's lock)."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.ejections = 0
+        self.ejected = False
+        self.ejected_until = 0.0
+        self.ejection_seconds = 0.0
+        self.probing = False
+        self.latency_ms: Optional[float] = None
+
+
+class LoadBalancer:
+    """Routes requests across endpoints and tracks their health."""
+
+    def __init__(self, urls: Sequence[str], config: LoadBalancing, probe: Callable[[str], bool]):
+        self.config = config
+        self._endpoints = [Endpoint(url) for url in urls]
+        self._probe = probe
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> List[EndpointStats]:
+        with self._lock:
+            return [
+                EndpointStats(
+                    url=ep.url,
+                    healthy=not ep.ejected,
+                    outstanding=ep.outstanding,
+                    requests=ep.requests,
+                    failures=ep.failures,
+                    ejections=ep.ejections,
+                    latency_ms=ep.latency_ms,
+                )
+                for ep in self._endpoints
+            ]
+
+    def acquire(self) -> Endpoint:
+        """Pick an endpoint for one request and count it as outstanding."""
+        now = time.monotonic()
+        with self._lock:
+            due = [ep for ep in self._endpoints if ep.ejected and not ep.probing]
+            due = [ep for ep in due if ep.ejected_until <= now]
+            for ep in due:
+                ep.probing = True
+
+            healthy = [ep for ep in self._endpoints if not ep.ejected]
+            if healthy:
+                chosen = self._choose(healthy)
+            else:
+                # Everything is ejected: fail open to the one closest to re-probing
+                chosen = min(self._endpoints, key=lambda ep: ep.ejected_until)
+            chosen.outstanding += 1
+            chosen.requests += 1
+
+        for ep in due:
+            threading.Thread(
+                target=self._run_probe, args=(ep,), name="compresr-probe", daemon=True
+            ).start()
+        return chosen
+
+    def _choose(self, candidates: List[Endpoint]) -> Endpoint:
+        if self.config.strategy is BalancingStrategy.POWER_OF_TWO and len(candidates) > 2:
+            candidates = random.sample(candidates, 2)
+        # Random tie-break so idle endpoints share the load evenly
+        return min(candidates, key=lambda ep: (ep.outstanding, random.random()))
+
+    def release(self, ep: Endpoint, started: float, error: Optional[BaseException]) -> None:
+        """Record the outcome of a request routed to ep."""
+        with self._lock:
+            ep.outstanding -= 1
+            if error is None:
+                latency_ms = (time.monotonic() - started) * 1000
+                alpha = self.config.latency_smoothing
+                ep.latency_ms = (
+                    latency_ms
+                    if ep.latency_ms is None
+                    else ep.latency_ms + alpha * (latency_ms - ep.latency_ms)
+                )
+            elif isinstance(error, EJECT_ON) and not isinstance(error, DeadlineExceededError):
+                # The caller's own deadline says nothing about the replica
+                ep.failures += 1
+                if not ep.ejected:
+                    self._eject(ep, self.config.ejection_seconds)
+
+    def _eject(self, ep: Endpoint, seconds: float) -> None:
+        ep.ejected = True
+        ep.ejections += 1
+        ep.ejection_seconds = min(seconds, self.config.max_ejection_seconds)
+        ep.ejected_until = time.monotonic() + ep.ejection_seconds
+
+    def _run_probe(self, ep: Endpoint) -> None:
+        try:
+            healthy = self._probe(ep.url)
+        except Exception:
+            healthy = False
+        with self._lock:
+            ep.probing = False
+            if healthy:
+                ep.ejected = False
+            else:
+                ep.ejections -= 1  # still the same ejection, just extended
+                self._eject(ep, ep.ejection_seconds * 2)
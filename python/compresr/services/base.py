@@ -5,18 +5,70 @@ Contains shared logic for HTTP calls and response handling.
 Do not use directly - use CompressionClient or FilterClient.
 """
 
-from typing import Generator, Optional, Tuple
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from pydantic import ValidationError as PydanticValidationError
 
-from ..config import ENDPOINTS
-from ..exceptions import ValidationError
+if TYPE_CHECKING:
+    import httpx
+
+    from .cache import CacheStats, CompressionCache
+    from .coalescer import BatchKey, CoalescingConfig, CoalescingStats, RequestCoalescer
+    from .hedging import Hedger, HedgingPolicy, HedgingStats
+    from .lean import LeanResult
+    from .single_flight import SingleFlight, SingleFlightStats
+
+from ..config import API_CONFIG, ENDPOINTS
+from ..exceptions import CircuitOpenError, CompresrError, ValidationError
 from ..schemas import (
+    AgnosticBatchInput,
+    AgnosticBatchRequest,
+    CompressBatchInput,
+    CompressBatchItemResult,
+    CompressBatchRequest,
+    CompressBatchResponse,
     CompressRequest,
     CompressResponse,
+    CompressResult,
     StreamChunk,
 )
+from .deadline import Timeouts
+from .lazy import lazy_import
 from .proxy import HTTPClient
+from .transport import StreamTiming
+
+# Batching, lean results and the opt-in features are imported on first use
+if TYPE_CHECKING:
+    from . import batching, cache, coalescer, lean
+else:
+    batching = lazy_import(f"{__package__}.batching")
+    cache = lazy_import(f"{__package__}.cache")
+    coalescer = lazy_import(f"{__package__}.coalescer")
+    lean = lazy_import(f"{__package__}.lean")
+
+T = TypeVar("T")
+Payload = Tuple[str, Dict[str, Any]]
+
+# Where the per-item results sit in a /batch response body
+_RESULTS_PATH = ("data", "results")
 
 
 class BaseCompressionClient(HTTPClient):
@@ -27,6 +79,57 @@ class BaseCompressionClient(HTTPClient):
     Subclasses (CompressionClient, FilterClient) implement user-facing methods.
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[Union[str, Sequence[str]]] = None,
+        timeout: Optional[Union[float, Timeouts]] = None,
+        *,
+        coalescing: Optional["CoalescingConfig"] = None,
+        cache: Optional["CompressionCache"] = None,
+        single_flight: bool = False,
+        hedging: Optional["HedgingPolicy"] = None,
+        **http_options: Any,
+    ):
+        super().__init__(api_key, base_url, timeout, **http_options)
+        self._cache = cache
+        self._single_flight: Optional["SingleFlight"] = None
+        if single_flight:
+            from .single_flight import SingleFlight  # only when single-flight is enabled
+
+            self._single_flight = SingleFlight()
+        self._hedger: Optional["Hedger"] = None
+        if hedging is not None:
+            from .hedging import Hedger  # only when hedging is enabled
+
+            # Sync losers keep running in the background; leave room for them
+            self._hedger = Hedger(hedging, max_workers=2 * self._pool_size)
+        self._coalescer: Optional["RequestCoalescer"] = None
+        if coalescing is not None:
+            self._coalescer = coalescer.RequestCoalescer(
+                coalescing, self._send_coalesced, self._send_coalesced_async
+            )
+
+    @property
+    def cache_stats(self) -> Optional["CacheStats"]:
+        """Hit/miss/eviction counters of the result cache (None if disabled)."""
+        return self._cache.stats if self._cache is not None else None
+
+    @property
+    def single_flight_stats(self) -> Optional["SingleFlightStats"]:
+        """Calls vs. calls that joined an identical in-flight request (None if disabled)."""
+        return self._single_flight.stats if self._single_flight is not None else None
+
+    @property
+    def hedging_stats(self) -> Optional["HedgingStats"]:
+        """Requests, hedges sent and hedges won (None if hedging is disabled)."""
+        return self._hedger.stats if self._hedger is not None else None
+
+    @property
+    def coalescing_stats(self) -> Optional["CoalescingStats"]:
+        """Calls vs. HTTP dispatches of the micro-batching coalescer (None if disabled)."""
+        return self._coalescer.stats if self._coalescer is not None else None
+
     def _build_request(
         self,
         context: str,
@@ -61,6 +164,155 @@ class BaseCompressionClient(HTTPClient):
         except PydanticValidationError as e:
             raise ValidationError(str(e)) from e
 
+    def _resolve_batch_queries(
+        self, contexts: List[str], queries: Optional[Union[str, List[str]]]
+    ) -> Optional[List[str]]:
+        """Expand queries to one per context (None for agnostic batches)."""
+        if not contexts:
+            raise ValidationError("At least one context is required", field="contexts")
+        if queries is None:
+            return None
+        if isinstance(queries, str):
+            return [queries] * len(contexts)
+        if len(queries) != len(contexts):
+            raise ValidationError(
+                f"Number of queries ({len(queries)}) must match number of contexts ({len(contexts)})"
+            )
+        return list(queries)
+
+    def _build_batch_payloads(
+        self,
+        contexts: List[str],
+        query_list: Optional[List[str]],
+        compression_model_name: str,
+        target_compression_ratio: Optional[float] = None,
+        coarse: Optional[bool] = None,
+        heuristic_chunking: Optional[bool] = None,
+        disable_placeholders: Optional[bool] = None,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Build one (endpoint, payload) per server-sized shard of the batch."""
+        size = API_CONFIG.MAX_BATCH_SIZE
+        payloads: List[Tuple[str, Dict[str, Any]]] = []
+        try:
+            if query_list is None:
+                # Agnostic batch (no queries)
+                for ctx_shard in batching.shard(contexts, size):
+                    agnostic_req = AgnosticBatchRequest(
+                        inputs=[AgnosticBatchInput(context=ctx) for ctx in ctx_shard],
+                        compression_model_name=compression_model_name,
+                        target_compression_ratio=target_compression_ratio,
+                    )
+                    payloads.append(
+                        (
+                            ENDPOINTS.COMPRESS_AGNOSTIC_BATCH,
+                            agnostic_req.model_dump(exclude_none=True),
+                        )
+                    )
+            else:
+                # Query-specific batch
+                for ctx_shard, query_shard in zip(
+                    batching.shard(contexts, size), batching.shard(query_list, size)
+                ):
+                    qs_req = CompressBatchRequest(
+                        inputs=[
+                            CompressBatchInput(context=ctx, query=q)
+                            for ctx, q in zip(ctx_shard, query_shard)
+                        ],
+                        compression_model_name=compression_model_name,
+                        target_compression_ratio=target_compression_ratio,
+                        coarse=coarse,
+                        heuristic_chunking=heuristic_chunking,
+                        disable_placeholders=disable_placeholders,
+                    )
+                    payloads.append(
+                        (ENDPOINTS.COMPRESS_QS_BATCH, qs_req.model_dump(exclude_none=True))
+                    )
+        except PydanticValidationError as e:
+            raise ValidationError(str(e)) from e
+        return payloads
+
+    def _do_batch(
+        self, payloads: List[Payload], max_concurrency: Optional[int] = None
+    ) -> CompressBatchResponse:
+        """Send batch shards (concurrently when there are several) and merge them in order."""
+
+        def send(payload: Payload) -> CompressBatchResponse:
+            try:
+                return self.post_model(*payload, CompressBatchResponse)
+            except CircuitOpenError:
+                if not self._passthrough_on_open:
+                    raise
+                return self._passthrough_batch(payload[1])
+
+        return batching.merge_batch_responses(self._run_shards(send, payloads, max_concurrency))
+
+    def _run_shards(
+        self,
+        send: Callable[[Payload], T],
+        payloads: List[Payload],
+        max_concurrency: Optional[int] = None,
+    ) -> List[T]:
+        """Send batch shards, concurrently when there are several; results in shard order."""
+        if len(payloads) == 1:
+            return [send(payloads[0])]
+
+        workers = min(max_concurrency or API_CONFIG.DEFAULT_BATCH_CONCURRENCY, len(payloads))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Each shard runs in a copy of the caller's context so the deadline applies
+            futures = [
+                pool.submit(contextvars.copy_context().run, send, payload) for payload in payloads
+            ]
+            try:
+                responses = [future.result() for future in futures]
+            except BaseException:
+                # Don't keep sending shards of a batch that already failed
+                for future in futures:
+                    future.cancel()
+                raise
+        return responses
+
+    async def _do_batch_async(
+        self, payloads: List[Payload], max_concurrency: Optional[int] = None
+    ) -> CompressBatchResponse:
+        """Send batch shards concurrently (bounded) and merge them in order (async)."""
+
+        async def send(payload: Payload) -> CompressBatchResponse:
+            try:
+                return await self.post_model_async(*payload, CompressBatchResponse)
+            except CircuitOpenError:
+                if not self._passthrough_on_open:
+                    raise
+                return self._passthrough_batch(payload[1])
+
+        return batching.merge_batch_responses(
+            await self._run_shards_async(send, payloads, max_concurrency)
+        )
+
+    async def _run_shards_async(
+        self,
+        send: Callable[[Payload], Awaitable[T]],
+        payloads: List[Payload],
+        max_concurrency: Optional[int] = None,
+    ) -> List[T]:
+        """Send batch shards concurrently (bounded); results in shard order (async)."""
+        if len(payloads) == 1:
+            return [await send(payloads[0])]
+
+        semaphore = asyncio.Semaphore(max_concurrency or API_CONFIG.DEFAULT_BATCH_CONCURRENCY)
+
+        async def bounded_send(payload: Payload) -> T:
+            async with semaphore:
+                return await send(payload)
+
+        tasks = [asyncio.ensure_future(bounded_send(payload)) for payload in payloads]
+        try:
+            responses = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return list(responses)
+
     def _resolve_endpoints(self, model_name: str, query: Optional[str] = None) -> Tuple[str, str]:
         """Resolve base and stream endpoints based on whether query is provided.
 
@@ -74,16 +326,356 @@ class BaseCompressionClient(HTTPClient):
 
     def _do_request(self, endpoint: str, req: CompressRequest) -> CompressResponse:
         """Execute compression request (sync)."""
-        data = self.post(endpoint, req.model_dump(exclude_none=True))
-        return CompressResponse.model_validate(data)
+        try:
+            return self._do_request_cached(endpoint, req)
+        except CircuitOpenError:
+            if not self._passthrough_on_open:
+                raise
+            return self._passthrough_response(req)
+
+    def _do_request_cached(self, endpoint: str, req: CompressRequest) -> CompressResponse:
+        if self._cache is None and self._single_flight is None:
+            return self._fetch(endpoint, req, None)
+
+        key = cache.request_cache_key(req)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        if self._single_flight is not None:
+            return self._single_flight.do(key, lambda: self._fetch(endpoint, req, key))
+        return self._fetch(endpoint, req, key)
+
+    def _fetch(self, endpoint: str, req: CompressRequest, key: Optional[str]) -> CompressResponse:
+        """Send a request past the cache and store its result."""
+        if self._coalescer is not None:
+            response = self._coalescer.submit(coalescer.coalesce_key(endpoint, req), req)
+        elif self._hedger is not None:
+            response = self._hedger.run(partial(self._send_request, endpoint, req))
+        else:
+            response = self._send_request(endpoint, req)
+
+        if self._cache is not None and key is not None:
+            self._cache.set(key, response)
+        return response
+
+    def _send_request(self, endpoint: str, req: CompressRequest) -> CompressResponse:
+        return self.post_model(endpoint, req.model_dump(exclude_none=True), CompressResponse)
 
-    def _do_stream(self, endpoint: str, req: CompressRequest) -> Generator[StreamChunk, None, None]:
+    def _do_stream(
+        self,
+        endpoint: str,
+        req: CompressRequest,
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> Generator[StreamChunk, None, None]:
         """Execute stream compression request (sync)."""
-        for content in self.stream(endpoint, req.model_dump(exclude_none=True)):
-            yield StreamChunk(content=content, done=False)
+        try:
+            for content in self.stream(endpoint, req.model_dump(exclude_none=True), on_timing):
+                yield StreamChunk(content=content, done=False)
+        except CircuitOpenError:
+            # Only raised before the first chunk, so the context can stand in whole
+            if not self._passthrough_on_open:
+                raise
+            yield StreamChunk(content=req.context, done=False)
         yield StreamChunk(content="", done=True)
 
     async def _do_request_async(self, endpoint: str, req: CompressRequest) -> CompressResponse:
         """Execute compression request (async)."""
-        data = await self.post_async(endpoint, req.model_dump(exclude_none=True))
-        return CompressResponse.model_validate(data)
+        try:
+            return await self._do_request_cached_async(endpoint, req)
+        except CircuitOpenError:
+            if not self._passthrough_on_open:
+                raise
+            return self._passthrough_response(req)
+
+    async def _do_request_cached_async(
+        self, endpoint: str, req: CompressRequest
+    ) -> CompressResponse:
+        if self._cache is None and self._single_flight is None:
+            return await self._fetch_async(endpoint, req, None)
+
+        key = cache.request_cache_key(req)
+        if self._cache is not None:
+            cached = await self._cache_call_async(self._cache.get, key)
+            if cached is not None:
+                return cached
+        if self._single_flight is not None:
+            return await self._single_flight.do_async(
+                key, lambda: self._fetch_async(endpoint, req, key)
+            )
+        return await self._fetch_async(endpoint, req, key)
+
+    async def _fetch_async(
+        self, endpoint: str, req: CompressRequest, key: Optional[str]
+    ) -> CompressResponse:
+        """Send a request past the cache and store its result (async)."""
+        if self._coalescer is not None:
+            response = await self._coalescer.submit_async(
+                coalescer.coalesce_key(endpoint, req), req
+            )
+        elif self._hedger is not None:
+            response = await self._hedger.run_async(
+                partial(self._send_request_async, endpoint, req)
+            )
+        else:
+            response = await self._send_request_async(endpoint, req)
+
+        if self._cache is not None and key is not None:
+            await self._cache_call_async(self._cache.set, key, response)
+        return response
+
+    async def _cache_call_async(self, method: Callable[..., T], *args: Any) -> T:
+        """Call a cache method, in a worker thread if the cache blocks on I/O."""
+        if getattr(self._cache, "blocking", False):
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def _send_request_async(self, endpoint: str, req: CompressRequest) -> CompressResponse:
+        return await self.post_model_async(
+            endpoint, req.model_dump(exclude_none=True), CompressResponse
+        )
+
+    # ==================== Incremental Batches ====================
+
+    def _iter_batch(
+        self, payloads: List[Payload]
+    ) -> Generator[CompressBatchItemResult, None, None]:
+        """Stream shards one after another, yielding each item as it is decoded (sync)."""
+        for endpoint, data in payloads:
+            count = 0
+            try:
+                for raw in self.stream_array(endpoint, data, _RESULTS_PATH):
+                    count += 1
+                    yield CompressBatchItemResult.model_validate_json(raw)
+            except CircuitOpenError:
+                # Only raised before the first item of a shard
+                if not self._passthrough_on_open:
+                    raise
+                yield from self._passthrough_items(data)
+                continue
+            if count != len(data["inputs"]):
+                raise CompresrError("Batch response does not match the request")
+
+    async def _iter_batch_async(
+        self, payloads: List[Payload]
+    ) -> AsyncGenerator[CompressBatchItemResult, None]:
+        """Stream shards one after another, yielding each item as it is decoded (async)."""
+        for endpoint, data in payloads:
+            count = 0
+            stream = self.stream_array_async(endpoint, data, _RESULTS_PATH)
+            try:
+                async for raw in stream:
+                    count += 1
+                    yield CompressBatchItemResult.model_validate_json(raw)
+            except CircuitOpenError:
+                if not self._passthrough_on_open:
+                    raise
+                for item in self._passthrough_items(data):
+                    yield item
+                continue
+            finally:
+                await stream.aclose()
+            if count != len(data["inputs"]):
+                raise CompresrError("Batch response does not match the request")
+
+    # ==================== Lean Results ====================
+    # Lean calls go through retries, rate limiting and the circuit breaker, but
+    # not the result cache, single-flight, coalescing or hedging, which all
+    # share full CompressResponse objects.
+
+    def _parse_lean(self, resp: "httpx.Response", req: CompressRequest) -> "LeanResult":
+        data = lean.response_data(self._parse_response(resp))
+        return lean.lean_result(data, req.context, req.target_compression_ratio)
+
+    def _parse_lean_batch(self, resp: "httpx.Response", data: Dict[str, Any]) -> List["LeanResult"]:
+        contexts = [item["context"] for item in data["inputs"]]
+        return lean.lean_batch_items(self._parse_response(resp), contexts)
+
+    def _do_request_lean(self, endpoint: str, req: CompressRequest) -> "LeanResult":
+        """Execute compression request, returning a LeanResult (sync)."""
+        decode = partial(self._parse_lean, req=req)
+        try:
+            return self._request("POST", endpoint, req.model_dump(exclude_none=True), decode)
+        except CircuitOpenError:
+            if not self._passthrough_on_open:
+                raise
+            return lean.passthrough_result(req.context, req.target_compression_ratio)
+
+    def _send_lean_shard(self, payload: Payload) -> List["LeanResult"]:
+        endpoint, data = payload
+        try:
+            return self._request("POST", endpoint, data, partial(self._parse_lean_batch, data=data))
+        except CircuitOpenError:
+            if not self._passthrough_on_open:
+                raise
+            return [lean.passthrough_result(item["context"]) for item in data["inputs"]]
+
+    def _do_batch_lean(
+        self, payloads: List[Payload], max_concurrency: Optional[int] = None
+    ) -> List["LeanResult"]:
+        """Send batch shards, returning lean results in input order (sync)."""
+        shards = self._run_shards(self._send_lean_shard, payloads, max_concurrency)
+        return [result for results in shards for result in results]
+
+    async def _do_request_lean_async(self, endpoint: str, req: CompressRequest) -> "LeanResult":
+        """Execute compression request, returning a LeanResult (async)."""
+        decode = partial(self._parse_lean, req=req)
+        try:
+            return await self._request_async(
+                "POST", endpoint, req.model_dump(exclude_none=True), decode
+            )
+        except CircuitOpenError:
+            if not self._passthrough_on_open:
+                raise
+            return lean.passthrough_result(req.context, req.target_compression_ratio)
+
+    async def _send_lean_shard_async(self, payload: Payload) -> List["LeanResult"]:
+        endpoint, data = payload
+        try:
+            return await self._request_async(
+                "POST", endpoint, data, partial(self._parse_lean_batch, data=data)
+            )
+        except CircuitOpenError:
+            if not self._passthrough_on_open:
+                raise
+            return [lean.passthrough_result(item["context"]) for item in data["inputs"]]
+
+    async def _do_batch_lean_async(
+        self, payloads: List[Payload], max_concurrency: Optional[int] = None
+    ) -> List["LeanResult"]:
+        """Send batch shards, returning lean results in input order (async)."""
+        shards = await self._run_shards_async(
+            self._send_lean_shard_async, payloads, max_concurrency
+        )
+        return [result for results in shards for result in results]
+
+    # ==================== Lifecycle ====================
+
+    def close_sync(self) -> None:
+        """Close the pooled sync client and stop the hedging worker threads."""
+        if self._hedger is not None:
+            self._hedger.close()
+        super().close_sync()
+
+    # ==================== Circuit Breaker Fallback ====================
+
+    @property
+    def _passthrough_on_open(self) -> bool:
+        breaker = self._circuit_breaker
+        return breaker is not None and breaker.config.passthrough
+
+    @staticmethod
+    def _passthrough_response(req: CompressRequest) -> CompressResponse:
+        """Uncompressed stand-in result (ratio 1.0) used while the circuit is open."""
+        return CompressResponse(
+            message="Compression skipped: circuit breaker open",
+            data=CompressResult(
+                original_context=req.context,
+                compressed_context=req.context,
+                original_tokens=0,
+                compressed_tokens=0,
+                actual_compression_ratio=1.0,
+                tokens_saved=0,
+                duration_ms=0,
+                target_compression_ratio=req.target_compression_ratio,
+            ),
+        )
+
+    @staticmethod
+    def _passthrough_items(payload: Dict[str, Any]) -> List[CompressBatchItemResult]:
+        """Uncompressed stand-ins for the inputs of one batch shard."""
+        return [
+            CompressBatchItemResult(
+                original_context=item["context"],
+                compressed_context=item["context"],
+                original_tokens=0,
+                compressed_tokens=0,
+                actual_compression_ratio=1.0,
+                tokens_saved=0,
+                duration_ms=0,
+            )
+            for item in payload["inputs"]
+        ]
+
+    @classmethod
+    def _passthrough_batch(cls, payload: Dict[str, Any]) -> CompressBatchResponse:
+        """Uncompressed stand-in for one batch shard while the circuit is open."""
+        return CompressBatchResponse(
+            message="Compression skipped: circuit breaker open",
+            data=batching.build_batch_result(cls._passthrough_items(payload)),
+        )
+
+    # ==================== Coalescing ====================
+
+    def _coalesced_payloads(
+        self, endpoint: str, reqs: List[CompressRequest]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        first = reqs[0]
+        query_list = None
+        if endpoint == ENDPOINTS.COMPRESS_QS:
+            query_list = [req.query or "" for req in reqs]
+        return self._build_batch_payloads(
+            [req.context for req in reqs],
+            query_list,
+            first.compression_model_name,
+            first.target_compression_ratio,
+            first.coarse,
+            first.heuristic_chunking,
+            first.disable_placeholders,
+        )
+
+    @staticmethod
+    def _split_batch(
+        batch: CompressBatchResponse, reqs: List[CompressRequest]
+    ) -> List[CompressResponse]:
+        """Turn a batch response back into one CompressResponse per request."""
+        if batch.data is None or len(batch.data.results) != len(reqs):
+            raise CompresrError("Batch response does not match the coalesced requests")
+        return [
+            CompressResponse(
+                success=batch.success,
+                message=batch.message,
+                data=CompressResult(
+                    **item.model_dump(), target_compression_ratio=req.target_compression_ratio
+                ),
+            )
+            for req, item in zip(reqs, batch.data.results)
+        ]
+
+    def _send_coalesced(
+        self, key: "BatchKey", reqs: List[CompressRequest]
+    ) -> List[CompressResponse]:
+        endpoint = key[0]
+        if len(reqs) == 1:
+            return [self._send_request(endpoint, reqs[0])]
+        batch = self._do_batch(self._coalesced_payloads(endpoint, reqs))
+        return self._split_batch(batch, reqs)
+
+    async def _send_coalesced_async(
+        self, key: "BatchKey", reqs: List[CompressRequest]
+    ) -> List[CompressResponse]:
+        endpoint = key[0]
+        if len(reqs) == 1:
+            return [await self._send_request_async(endpoint, reqs[0])]
+        batch = await self._do_batch_async(self._coalesced_payloads(endpoint, reqs))
+        return self._split_batch(batch, reqs)
+
+    async def _do_stream_async(
+        self,
+        endpoint: str,
+        req: CompressRequest,
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Execute stream compression request (async)."""
+        stream = self.stream_async(endpoint, req.model_dump(exclude_none=True), on_timing)
+        try:
+            async for content in stream:
+                yield StreamChunk(content=content, done=False)
+        except CircuitOpenError:
+            if not self._passthrough_on_open:
+                raise
+            yield StreamChunk(content=req.context, done=False)
+        finally:
+            # Propagate early exit / cancellation to the HTTP stream right away
+            await stream.aclose()
+        yield StreamChunk(content="", done=True)
@@ -0,0 +1,141 @@
+"""
+Batching - Sharding and merging helpers for batch compression.
+
+Internal module. The /batch endpoints accept at most
+API_CONFIG.MAX_BATCH_SIZE inputs per call, so larger batches are split
+into shards, sent separately and merged back into one response.
+Duplicate (context, query) pairs are collapsed before sending and expanded
+back to their original positions afterwards. The final batch result
+carries its columnar metrics, computed once after merging and expanding.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from pydantic import ConfigDict, Field
+
+from ..schemas import CompressBatchItemResult, CompressBatchResponse, CompressBatchResult
+from .metrics import BatchMetrics
+
+T = TypeVar("T")
+
+
+class MeasuredBatchResult(CompressBatchResult):
+    """CompressBatchResult with the per-item metrics of its results as typed arrays.
+
+    metrics is derived from results by measure_batch_response(), once for the
+    final result of a batch (shards and merges stay plain), and is left out of
+    serialization and repr.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    metrics: BatchMetrics = Field(default_factory=BatchMetrics, exclude=True, repr=False)
+
+
+class MeasuredBatchResponse(CompressBatchResponse):
+    """Batch response whose data is a MeasuredBatchResult."""
+
+    data: Optional[MeasuredBatchResult] = None
+
+
+def shard(items: Sequence[T], size: int) -> List[Sequence[T]]:
+    """Split items into consecutive shards of at most ``size`` elements."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def build_batch_result(results: List[CompressBatchItemResult]) -> CompressBatchResult:
+    """Build a batch result with aggregates recomputed from the item results.
+
+    average_compression_ratio is the mean of the per-item ratios.
+    """
+    count = len(results)
+    total_original = sum(r.original_tokens for r in results)
+    total_compressed = sum(r.compressed_tokens for r in results)
+    return CompressBatchResult(
+        results=results,
+        total_original_tokens=total_original,
+        total_compressed_tokens=total_compressed,
+        total_tokens_saved=sum(r.tokens_saved for r in results),
+        average_compression_ratio=(
+            sum(r.actual_compression_ratio for r in results) / count if count else 0.0
+        ),
+        count=count,
+    )
+
+
+def merge_batch_responses(responses: List[CompressBatchResponse]) -> CompressBatchResponse:
+    """Merge per-shard responses (in shard order) into one response."""
+    if len(responses) == 1:
+        return responses[0]
+
+    results: List[CompressBatchItemResult] = []
+    for response in responses:
+        if response.data is not None:
+            results.extend(response.data.results)
+
+    return CompressBatchResponse(
+        success=all(r.success for r in responses),
+        message=next((r.message for r in responses if r.message), None),
+        data=build_batch_result(results),
+    )
+
+
+def measure_batch_response(response: CompressBatchResponse) -> MeasuredBatchResponse:
+    """The final response of a batch, with metrics computed from its results."""
+    data = None
+    if response.data is not None:
+        # Fields were validated when the response was parsed or built
+        data = MeasuredBatchResult.model_construct(
+            **dict(response.data), metrics=BatchMetrics.from_results(response.data.results)
+        )
+    return MeasuredBatchResponse(success=response.success, message=response.message, data=data)
+
+
+def deduplicate_inputs(
+    contexts: List[str], query_list: Optional[List[str]]
+) -> Tuple[List[str], Optional[List[str]], Optional[List[int]]]:
+    """Collapse duplicate (context, query) pairs, keeping first-seen order.
+
+    Returns:
+        (unique_contexts, unique_queries, positions) where positions[i] is the
+        index of input i among the unique pairs, or None if nothing repeated
+    """
+    seen: Dict[Tuple[str, Optional[str]], int] = {}
+    first: List[int] = []  # input index of each unique pair
+    positions: List[int] = []
+    for i, context in enumerate(contexts):
+        pair = (context, query_list[i] if query_list is not None else None)
+        position = seen.get(pair)
+        if position is None:
+            position = seen[pair] = len(first)
+            first.append(i)
+        positions.append(position)
+
+    if len(first) == len(contexts):
+        return contexts, query_list, None
+    unique_queries = [query_list[i] for i in first] if query_list is not None else None
+    return [contexts[i] for i in first], unique_queries, positions
+
+
+def expand_batch_response(
+    response: CompressBatchResponse, positions: List[int]
+) -> CompressBatchResponse:
+    """Map results of the unique pairs back onto every original position.
+
+    Aggregates are recomputed over the expanded (logical) batch.
+    """
+    if response.data is None:
+        return response
+    unique = response.data.results
+    results = []
+    used = set()
+    for position in positions:
+        item = unique[position]
+        # Repeats get their own copy so results stay independent objects
+        results.append(item.model_copy() if position in used else item)
+        used.add(position)
+    return CompressBatchResponse(
+        success=response.success,
+        message=response.message,
+        data=build_batch_result(results),
+    )
@@ -0,0 +1,159 @@
+"""
+Cache - Content-addressed in-memory cache for compression results.
+
+Requests are keyed by a hash of every field that affects the result, so an
+identical CompressRequest is answered locally instead of calling the API.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Protocol, Tuple
+
+from ..schemas import CompressRequest, CompressResponse
+
+
+def request_cache_key(req: CompressRequest) -> str:
+    """SHA-256 over the request fields that determine the compression result."""
+    fields = [
+        req.context,
+        req.compression_model_name,
+        req.query,
+        req.target_compression_ratio,
+        req.coarse,
+        req.heuristic_chunking,
+        req.disable_placeholders,
+    ]
+    encoded = json.dumps(fields, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def response_size(response: CompressResponse) -> int:
+    """Approximate memory held by a cached response (dominated by its strings)."""
+    size = sys.getsizeof(response)
+    if response.data is not None:
+        size += sys.getsizeof(response.data.original_context)
+        size += sys.getsizeof(response.data.compressed_context)
+    return size
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CompressionCache(Protocol):
+    """Interface the client uses to look up and store compression results.
+
+    A cache whose get/set do I/O can set ``blocking = True``; async calls
+    then run them in a worker thread instead of on the event loop.
+    """
+
+    def get(self, key: str) -> Optional[CompressResponse]: ...
+
+    def set(self, key: str, response: CompressResponse) -> None: ...
+
+    @property
+    def stats(self) -> CacheStats: ...
+
+
+class ResultCache:
+    """Thread-safe LRU cache of CompressResponses, bounded by entries and bytes.
+
+    Args:
+        max_entries: Maximum number of cached responses
+        max_bytes: Maximum approximate memory held by cached responses
+        ttl: Seconds an entry stays valid (None = no expiry)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (response, size, expires_at)
+        self._entries: "OrderedDict[str, Tuple[CompressResponse, int, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Optional[CompressResponse]:
+        """Return a copy of the cached response, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            response, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return response.model_copy(deep=True)
+
+    def set(self, key: str, response: CompressResponse) -> None:
+        """Cache a successful response, evicting least-recently-used entries to fit."""
+        if not response.success or response.data is None:
+            return
+        size = response_size(response)
+        if size > self._max_bytes:
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        stored = response.model_copy(deep=True)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (stored, size, expires_at)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
@@ -0,0 +1,164 @@
+"""
+Circuit - Circuit breaker that fails fast while the API is down.
+
+Internal module. After failure_threshold consecutive failed calls the
+circuit opens and calls fail immediately with CircuitOpenError (or are
+answered by the client's passthrough fallback). After reset_timeout it
+half-opens: a limited number of probe calls go through, and the first
+outcome closes or re-opens the circuit.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from ..exceptions import CircuitOpenError, CompresrError
+from ..exceptions import ConnectionError as CompresrConnectionError
+from ..exceptions import DeadlineExceededError, ServerError, ServiceUnavailableError, TimeoutError
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Circuit breaker settings.
+
+    Only failure_on errors count as failures; any other outcome (including
+    4xx errors, which prove the API is reachable) resets the count, except
+    a caller's DeadlineExceededError, which leaves it unchanged. With
+    passthrough=True, compress calls made while the circuit is open return
+    the original context uncompressed (ratio 1.0) instead of raising.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    passthrough: bool = False
+    failure_on: Tuple[Type[CompresrError], ...] = (
+        CompresrConnectionError,
+        TimeoutError,
+        ServerError,
+        ServiceUnavailableError,
+    )
+    on_state_change: Optional[Callable[[CircuitState, CircuitState], None]] = None
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    """Snapshot of circuit breaker state."""
+
+    state: CircuitState
+    consecutive_failures: int
+    times_opened: int
+    rejected: int
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker guarding one API endpoint."""
+
+    def __init__(self, config: CircuitBreakerConfig):
+        self.config = config
+        # Re-entrant so on_state_change callbacks may read state/stats
+        self._lock = threading.RLock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state
+
+    @property
+    def stats(self) -> CircuitStats:
+        with self._lock:
+            return CircuitStats(
+                state=self._state,
+                consecutive_failures=self._failures,
+                times_opened=self._times_opened,
+                rejected=self._rejected,
+            )
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run fn through the breaker (sync)."""
+        self.before_call()
+        try:
+            result = fn()
+        except BaseException as e:
+            self.record(e)
+            raise
+        self.record(None)
+        return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn through the breaker (async)."""
+        self.before_call()
+        try:
+            result = await fn()
+        except BaseException as e:
+            self.record(e)
+            raise
+        self.record(None)
+        return result
+
+    def before_call(self) -> None:
+        """Admit a call, or raise CircuitOpenError if the circuit rejects it."""
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                remaining = self._opened_at + self.config.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    self._rejected += 1
+                    raise CircuitOpenError(
+                        f"Circuit breaker is open; retrying in {remaining:.1f}s",
+                        retry_after=math.ceil(remaining),
+                    )
+                self._transition(CircuitState.HALF_OPEN)
+                self._probes = 0
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probes >= self.config.half_open_max_calls:
+                    self._rejected += 1
+                    raise CircuitOpenError("Circuit breaker is half-open; probe in progress")
+                self._probes += 1
+
+    def record(self, error: Optional[BaseException]) -> None:
+        """Record the outcome of an admitted call (None = success)."""
+        with self._lock:
+            if isinstance(error, DeadlineExceededError) or (
+                isinstance(error, BaseException) and not isinstance(error, Exception)
+            ):
+                # Caller's deadline, cancelled or interrupted: no verdict on the
+                # service, just free the probe slot
+                if self._state is CircuitState.HALF_OPEN:
+                    self._probes -= 1
+                return
+            if error is None or not isinstance(error, self.config.failure_on):
+                self._failures = 0
+                if self._state is not CircuitState.CLOSED:
+                    self._transition(CircuitState.CLOSED)
+                return
+
+            self._failures += 1
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED
+                and self._failures >= self.config.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._times_opened += 1
+                self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        previous, self._state = self._state, state
+        if self.config.on_state_change is not None and previous is not state:
+            self.config.on_state_change(previous, state)
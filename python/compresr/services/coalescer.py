@@ -0,0 +1,278 @@
+"""
+Coalescer - Micro-batching of concurrent single compress() calls.
+
+Internal module. Concurrent calls that share a batch key (endpoint, model
+and options) are buffered for a short window and sent as one /batch
+request; each caller then receives its own item of the batch result.
+
+A call made while no other call is in progress is sent at once, without
+waiting for company. If a batch fails for a reason other than a transient
+service error (e.g. a 422 caused by one caller's input), each caller
+re-sends its own request alone, so it only ever sees its own outcome.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from ..config import API_CONFIG
+from ..exceptions import CompresrError
+from ..schemas import CompressRequest, CompressResponse
+from .deadline import no_deadline, remaining, result_within
+from .retry import TRANSIENT_ERRORS
+
+# (endpoint, model, target ratio, coarse, heuristic_chunking, disable_placeholders)
+BatchKey = Tuple[Any, ...]
+SendBatch = Callable[[BatchKey, List[CompressRequest]], List[CompressResponse]]
+SendBatchAsync = Callable[[BatchKey, List[CompressRequest]], Awaitable[List[CompressResponse]]]
+
+
+@dataclass(frozen=True)
+class CoalescingConfig:
+    """Micro-batching settings.
+
+    A batch is sent once max_batch_size calls are buffered or max_wait_ms
+    has passed since the first one, whichever comes first.
+    """
+
+    max_wait_ms: float = 5.0
+    max_batch_size: int = API_CONFIG.MAX_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class CoalescingStats:
+    """Snapshot of coalescer activity."""
+
+    calls: int
+    dispatches: int
+
+    @property
+    def requests_saved(self) -> int:
+        return self.calls - self.dispatches
+
+
+# A None result tells the caller to send its request alone (see _resend_alone)
+_Items = List[Tuple[CompressRequest, "Future[Optional[CompressResponse]]"]]
+_AsyncItems = List[Tuple[CompressRequest, "asyncio.Future[Optional[CompressResponse]]"]]
+
+
+def _resend_alone(error: BaseException, items: List[Any]) -> bool:
+    """Whether a failed batch should be retried as one request per caller.
+
+    Transient service errors would fail the single requests too, so they
+    are shared; any other API error may be down to one caller's input.
+    """
+    return (
+        len(items) > 1
+        and isinstance(error, CompresrError)
+        and not isinstance(error, TRANSIENT_ERRORS)
+    )
+
+
+class _Group:
+    """Calls buffered under one batch key (sync path)."""
+
+    def __init__(self) -> None:
+        self.items: _Items = []
+        self.full = threading.Event()
+
+
+class _AsyncGroup:
+    """Calls buffered under one batch key (async path)."""
+
+    def __init__(self) -> None:
+        self.items: _AsyncItems = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class RequestCoalescer:
+    """Buffers concurrent compress calls per batch key and dispatches them together."""
+
+    def __init__(self, config: CoalescingConfig, send: SendBatch, send_async: SendBatchAsync):
+        self._config = config
+        self._send = send
+        self._send_async = send_async
+        self._lock = threading.Lock()
+        self._groups: Dict[BatchKey, _Group] = {}
+        self._async_groups: Dict[Tuple[int, BatchKey], _AsyncGroup] = {}
+        # The loop only keeps weak references to tasks; hold in-flight dispatches here
+        self._dispatch_tasks: "Set[asyncio.Future[None]]" = set()
+        self._calls = 0
+        self._dispatches = 0
+        self._in_progress = 0  # calls submitted and not yet answered (sync + async)
+
+    @property
+    def stats(self) -> CoalescingStats:
+        with self._lock:
+            return CoalescingStats(calls=self._calls, dispatches=self._dispatches)
+
+    # ==================== Sync ====================
+
+    def submit(self, key: BatchKey, req: CompressRequest) -> CompressResponse:
+        """Queue a call and block until its batch completes.
+
+        The first caller of a group leads it: it waits for the window to
+        close (or the group to fill) and then sends the batch from its own
+        thread. Everyone else just waits for their result. A call with no
+        other call in progress is sent straight away.
+        """
+        with self._lock:
+            self._calls += 1
+            self._in_progress += 1
+            alone = self._in_progress == 1 and key not in self._groups
+            if alone:
+                self._dispatches += 1
+        try:
+            if alone:
+                return self._send(key, [req])[0]
+            return self._submit_grouped(key, req)
+        finally:
+            with self._lock:
+                self._in_progress -= 1
+
+    def _submit_grouped(self, key: BatchKey, req: CompressRequest) -> CompressResponse:
+        future: "Future[Optional[CompressResponse]]" = Future()
+        with self._lock:
+            group = self._groups.get(key)
+            leader = group is None
+            if group is None:
+                group = self._groups[key] = _Group()
+            group.items.append((req, future))
+            if len(group.items) >= self._config.max_batch_size:
+                # Full: close it to new joiners and wake the leader
+                del self._groups[key]
+                group.full.set()
+
+        if leader:
+            group.full.wait(self._config.max_wait_ms / 1000)
+            with self._lock:
+                if self._groups.get(key) is group:
+                    del self._groups[key]
+                self._dispatches += 1
+            if remaining() is None:
+                self._dispatch(key, group.items)
+            else:
+                # The batch serves every caller in it: send it unbounded on its own
+                # thread (new threads start without a deadline) and only bound the wait
+                threading.Thread(
+                    target=self._dispatch,
+                    args=(key, group.items),
+                    name="compresr-coalesce",
+                    daemon=True,
+                ).start()
+        response = result_within(future)
+        if response is None:
+            with self._lock:
+                self._dispatches += 1
+            response = self._send(key, [req])[0]
+        return response
+
+    def _dispatch(self, key: BatchKey, items: _Items) -> None:
+        try:
+            responses = self._send(key, [req for req, _ in items])
+        except BaseException as e:
+            for _, future in items:
+                if _resend_alone(e, items):
+                    future.set_result(None)
+                else:
+                    future.set_exception(e)
+            return
+        for (_, future), response in zip(items, responses):
+            future.set_result(response)
+
+    # ==================== Async ====================
+
+    async def submit_async(self, key: BatchKey, req: CompressRequest) -> CompressResponse:
+        """Queue a call and await its batch result.
+
+        The batch is flushed by a loop timer, so cancelling one caller never
+        strands the others. A call with no other call in progress is sent
+        straight away.
+        """
+        loop = asyncio.get_running_loop()
+        group_key = (id(loop), key)
+        with self._lock:
+            self._calls += 1
+            self._in_progress += 1
+            alone = self._in_progress == 1 and group_key not in self._async_groups
+            if alone:
+                self._dispatches += 1
+        try:
+            if alone:
+                return (await self._send_async(key, [req]))[0]
+            return await self._submit_grouped_async(loop, group_key, req)
+        finally:
+            with self._lock:
+                self._in_progress -= 1
+
+    async def _submit_grouped_async(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        group_key: Tuple[int, BatchKey],
+        req: CompressRequest,
+    ) -> CompressResponse:
+        future: "asyncio.Future[Optional[CompressResponse]]" = loop.create_future()
+        group = self._async_groups.get(group_key)
+        if group is None:
+            group = self._async_groups[group_key] = _AsyncGroup()
+            group.timer = loop.call_later(
+                self._config.max_wait_ms / 1000, self._flush_async, group_key, group
+            )
+        group.items.append((req, future))
+        if len(group.items) >= self._config.max_batch_size:
+            self._flush_async(group_key, group)
+        response = await future
+        if response is None:
+            with self._lock:
+                self._dispatches += 1
+            response = (await self._send_async(group_key[1], [req]))[0]
+        return response
+
+    def _flush_async(self, group_key: Tuple[int, BatchKey], group: _AsyncGroup) -> None:
+        if self._async_groups.get(group_key) is not group:
+            return  # already flushed
+        del self._async_groups[group_key]
+        if group.timer is not None:
+            group.timer.cancel()
+        with self._lock:
+            self._dispatches += 1
+        task = asyncio.ensure_future(self._dispatch_async(group_key[1], group.items))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch_async(self, key: BatchKey, items: _AsyncItems) -> None:
+        # Callers cancelled while waiting still get sent; their result is dropped
+        try:
+            # Shared by every caller in the batch, so no one caller's deadline applies
+            with no_deadline():
+                responses = await self._send_async(key, [req for req, _ in items])
+        except Exception as e:
+            for _, future in items:
+                if future.done():
+                    continue
+                if _resend_alone(e, items):
+                    future.set_result(None)
+                else:
+                    future.set_exception(e)
+            return
+        except BaseException:
+            for _, future in items:
+                future.cancel()
+            raise
+        for (_, future), response in zip(items, responses):
+            if not future.done():
+                future.set_result(response)
+
+
+def coalesce_key(endpoint: str, req: CompressRequest) -> BatchKey:
+    """Batch key: calls may share a batch only if everything but context/query matches."""
+    return (
+        endpoint,
+        req.compression_model_name,
+        req.target_compression_ratio,
+        req.coarse,
+        req.heuristic_chunking,
+        req.disable_placeholders,
+    )
@@ -0,0 +1,107 @@
+"""
+Codec - JSON serialization of request and response bodies.
+
+Internal module. Payloads are serialized straight to UTF-8 bytes and
+parsed straight from them with the fastest JSON library installed
+(orjson, then msgspec, then the standard library). Typed responses skip
+the intermediate dict entirely and are validated from the raw bytes with
+pydantic's model_validate_json. The library is only checked for at import
+time; it is imported by the first body that is encoded or decoded.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, Dict, Type, Union
+
+from .lazy import lazy_import, module_available
+
+if TYPE_CHECKING:
+    import msgspec
+    import orjson
+else:
+    orjson = lazy_import("orjson")
+    msgspec = lazy_import("msgspec")
+
+ORJSON_AVAILABLE = module_available("orjson")
+MSGSPEC_AVAILABLE = module_available("msgspec")
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """Standard-library codec; subclass it to plug in another JSON library.
+
+    dumps returns compact UTF-8 bytes; loads raises ValueError on invalid
+    JSON.
+    """
+
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+            "utf-8"
+        )
+
+    def loads(self, data: JsonInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not ORJSON_AVAILABLE:
+            raise ImportError("The orjson codec requires orjson: pip install orjson")
+
+    def dumps(self, data: Any) -> bytes:
+        result: bytes = orjson.dumps(data)
+        return result
+
+    def loads(self, data: JsonInput) -> Any:
+        # orjson.JSONDecodeError is a ValueError
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """Codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("The msgspec codec requires msgspec: pip install msgspec")
+
+    def dumps(self, data: Any) -> bytes:
+        result: bytes = msgspec.json.encode(data)
+        return result
+
+    def loads(self, data: JsonInput) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+}
+
+
+def get_codec(codec: Union[str, JsonCodec] = "auto") -> JsonCodec:
+    """Resolve a codec instance or name ("auto" = fastest installed)."""
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "auto":
+        if ORJSON_AVAILABLE:
+            return OrjsonCodec()
+        if MSGSPEC_AVAILABLE:
+            return MsgspecCodec()
+        return JsonCodec()
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec {codec!r}; expected 'auto' or one of {list(CODECS)}")
+    return CODECS[codec]()
@@ -20,20 +20,87 @@ Endpoints:
         /compress/question-specific/stream - context: str, query: str
 """
 
-from typing import Generator, List, Optional, Union
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
-from ..config import ENDPOINTS
-from ..exceptions import ValidationError
+from ..config import API_CONFIG
+from ..exceptions import CompresrError, ValidationError
 from ..schemas import (
-    AgnosticBatchInput,
-    AgnosticBatchRequest,
-    CompressBatchInput,
-    CompressBatchRequest,
-    CompressBatchResponse,
+    CompressBatchItemResult,
     CompressResponse,
     StreamChunk,
 )
 from .base import BaseCompressionClient
+from .deadline import bounded, bounded_async, deadline_scope, run_within
+from .lazy import lazy_import
+from .transport import StreamTiming
+
+# Batching and lean results are imported on first use
+if TYPE_CHECKING:
+    from . import batching
+    from .batching import MeasuredBatchResponse
+    from .lean import LeanBatchResult, LeanResult
+else:
+    batching = lazy_import(f"{__package__}.batching")
+
+# An input for compress_many: a context string, or a mapping of compress() arguments
+CompressInput = Union[str, Mapping[str, Any]]
+# (input index, response or the CompresrError raised for that input)
+CompressOutcome = Tuple[int, Union[CompressResponse, CompresrError]]
+
+_COMPRESS_ARGS = frozenset(
+    {
+        "context",
+        "compression_model_name",
+        "query",
+        "target_compression_ratio",
+        "coarse",
+        "heuristic_chunking",
+        "disable_placeholders",
+        "deadline",
+    }
+)
+
+
+def _compress_kwargs(item: CompressInput) -> Dict[str, Any]:
+    """Normalize a compress_many input into compress() keyword arguments."""
+    if isinstance(item, str):
+        return {"context": item}
+    kwargs = dict(item)
+    unknown = set(kwargs) - _COMPRESS_ARGS
+    if unknown:
+        raise ValidationError(f"Unknown compress() arguments: {', '.join(sorted(unknown))}")
+    if "context" not in kwargs:
+        raise ValidationError("Each input requires a 'context'", field="context")
+    return kwargs
+
+
+async def _aiter_inputs(
+    inputs: Union[Iterable[CompressInput], AsyncIterable[CompressInput]],
+) -> AsyncGenerator[CompressInput, None]:
+    if isinstance(inputs, AsyncIterable):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
 
 
 class CompressionClient(BaseCompressionClient):
@@ -48,7 +115,38 @@ class CompressionClient(BaseCompressionClient):
         api_key: Your Compresr API key (required) - "cmp_..."
         base_url: API base URL (optional) - defaults to https://api.compresr.ai
                   Use for on-prem deployments, e.g., "http://localhost:8000"
-        timeout: Request timeout in seconds (optional)
+                  or "unix:///run/compresr.sock" for a sidecar on a Unix socket.
+                  A list of URLs balances requests across several replicas
+        timeout: Request timeout in seconds, or Timeouts with separate connect/read/
+                 write/pool timeouts and a total stream duration (optional)
+        pool_size: Max concurrent (and keep-alive) connections (optional) - defaults
+                   to httpx's limits, 100 connections with 20 kept alive
+        transport / async_transport: httpx transports to send sync / async requests
+                                     through instead of the network (optional)
+        body_compression: BodyCompression gzip/zstd-encoding request bodies above a
+                          size threshold; see wire_stats for bytes on the wire (optional)
+        json_codec: "orjson", "msgspec", "json" or a JsonCodec instance used to encode
+                    request bodies and decode responses (default "auto": fastest
+                    installed)
+        retry: RetryPolicy for transient errors (429, 5xx, connection failures);
+               retries are disabled unless given (optional)
+        rate_limit: RateLimit smoothing requests/s and context bytes/s across all
+                    calls on this client (optional)
+        adaptive_concurrency: AdaptiveConcurrency (AIMD) limit on in-flight async
+                              requests, raised while latency is stable and cut on
+                              429/503/timeouts or latency spikes (optional)
+        circuit_breaker: CircuitBreakerConfig to fail fast (or pass contexts through
+                         uncompressed) after repeated failures (optional)
+        load_balancing: LoadBalancing strategy and ejection settings used when
+                        base_url is a list (optional)
+        hedging: HedgingPolicy sending a backup copy of compress() requests that
+                 are slower than a percentile of recent latency (optional)
+        coalescing: CoalescingConfig to micro-batch concurrent compress() calls that
+                    share a model and options into /batch requests (optional)
+        cache: ResultCache or DiskCache answering repeated identical
+               compress() requests locally (optional)
+        single_flight: Share one HTTP call among identical concurrent
+                       compress() requests (default False)
 
     Example:
         from compresr import CompressionClient
@@ -80,6 +178,36 @@ class CompressionClient(BaseCompressionClient):
 
     # ==================== Single Compression ====================
 
+    @overload
+    def compress(
+        self,
+        context: str,
+        compression_model_name: str = ...,
+        query: Optional[str] = ...,
+        target_compression_ratio: Optional[float] = ...,
+        coarse: Optional[bool] = ...,
+        heuristic_chunking: Optional[bool] = ...,
+        disable_placeholders: Optional[bool] = ...,
+        deadline: Optional[float] = ...,
+        *,
+        lean: Literal[False] = ...,
+    ) -> CompressResponse: ...
+
+    @overload
+    def compress(
+        self,
+        context: str,
+        compression_model_name: str = ...,
+        query: Optional[str] = ...,
+        target_compression_ratio: Optional[float] = ...,
+        coarse: Optional[bool] = ...,
+        heuristic_chunking: Optional[bool] = ...,
+        disable_placeholders: Optional[bool] = ...,
+        deadline: Optional[float] = ...,
+        *,
+        lean: Literal[True],
+    ) -> "LeanResult": ...
+
     def compress(
         self,
         context: str,
@@ -89,7 +217,10 @@ class CompressionClient(BaseCompressionClient):
         coarse: Optional[bool] = None,
         heuristic_chunking: Optional[bool] = None,
         disable_placeholders: Optional[bool] = None,
-    ) -> CompressResponse:
+        deadline: Optional[float] = None,
+        *,
+        lean: bool = False,
+    ) -> Union[CompressResponse, "LeanResult"]:
         """
         Compress a single context (sync).
 
@@ -111,9 +242,15 @@ class CompressionClient(BaseCompressionClient):
                     Only for query-specific models. Ignored for agnostic.
             disable_placeholders: Disable placeholder tokens in output.
                     Only for query-specific models. Ignored for agnostic.
+            deadline: Max seconds for the whole call, including retries and
+                    client-side waits; DeadlineExceededError is raised when exceeded.
+            lean: Return a LeanResult built without validation, whose
+                    original_context is the context passed in rather than the
+                    server's copy. Bypasses the cache, single-flight, coalescing
+                    and hedging (default False).
 
         Returns:
-            CompressResponse with compressed context and metrics
+            CompressResponse with compressed context and metrics (LeanResult if lean)
         """
         req = self._build_request(
             context,
@@ -125,7 +262,40 @@ class CompressionClient(BaseCompressionClient):
             disable_placeholders,
         )
         endpoint, _ = self._resolve_endpoints(compression_model_name, query)
-        return self._do_request(endpoint, req)
+        with deadline_scope(deadline):
+            if lean:
+                return self._do_request_lean(endpoint, req)
+            return self._do_request(endpoint, req)
+
+    @overload
+    async def compress_async(
+        self,
+        context: str,
+        compression_model_name: str = ...,
+        query: Optional[str] = ...,
+        target_compression_ratio: Optional[float] = ...,
+        coarse: Optional[bool] = ...,
+        heuristic_chunking: Optional[bool] = ...,
+        disable_placeholders: Optional[bool] = ...,
+        deadline: Optional[float] = ...,
+        *,
+        lean: Literal[False] = ...,
+    ) -> CompressResponse: ...
+
+    @overload
+    async def compress_async(
+        self,
+        context: str,
+        compression_model_name: str = ...,
+        query: Optional[str] = ...,
+        target_compression_ratio: Optional[float] = ...,
+        coarse: Optional[bool] = ...,
+        heuristic_chunking: Optional[bool] = ...,
+        disable_placeholders: Optional[bool] = ...,
+        deadline: Optional[float] = ...,
+        *,
+        lean: Literal[True],
+    ) -> "LeanResult": ...
 
     async def compress_async(
         self,
@@ -136,7 +306,10 @@ class CompressionClient(BaseCompressionClient):
         coarse: Optional[bool] = None,
         heuristic_chunking: Optional[bool] = None,
         disable_placeholders: Optional[bool] = None,
-    ) -> CompressResponse:
+        deadline: Optional[float] = None,
+        *,
+        lean: bool = False,
+    ) -> Union[CompressResponse, "LeanResult"]:
         """
         Compress a single context (async).
 
@@ -151,9 +324,15 @@ class CompressionClient(BaseCompressionClient):
                     Ignored for agnostic compression (no query).
             heuristic_chunking: Use heuristic chunking for structure preservation.
             disable_placeholders: Disable placeholder tokens in output.
+            deadline: Max seconds for the whole call, including retries and
+                    client-side waits; DeadlineExceededError is raised when exceeded.
+            lean: Return a LeanResult built without validation, whose
+                    original_context is the context passed in rather than the
+                    server's copy. Bypasses the cache, single-flight, coalescing
+                    and hedging (default False).
 
         Returns:
-            CompressResponse with compressed context and metrics
+            CompressResponse with compressed context and metrics (LeanResult if lean)
         """
         req = self._build_request(
             context,
@@ -165,7 +344,9 @@ class CompressionClient(BaseCompressionClient):
             disable_placeholders,
         )
         endpoint, _ = self._resolve_endpoints(compression_model_name, query)
-        return await self._do_request_async(endpoint, req)
+        if lean:
+            return await run_within(self._do_request_lean_async(endpoint, req), deadline)
+        return await run_within(self._do_request_async(endpoint, req), deadline)
 
     def compress_stream(
         self,
@@ -176,10 +357,15 @@ class CompressionClient(BaseCompressionClient):
         coarse: Optional[bool] = None,
         heuristic_chunking: Optional[bool] = None,
         disable_placeholders: Optional[bool] = None,
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+        deadline: Optional[float] = None,
     ) -> Generator[StreamChunk, None, None]:
         """
         Stream compression (sync).
 
+        Streams share the client's pooled keep-alive connections, so only the
+        first stream pays for TCP/TLS setup.
+
         Args:
             context: Context text to compress (single string)
             compression_model_name: Compression model to use
@@ -189,6 +375,11 @@ class CompressionClient(BaseCompressionClient):
                     Ignored for agnostic compression (no query).
             heuristic_chunking: Use heuristic chunking for structure preservation.
             disable_placeholders: Disable placeholder tokens in output.
+            on_timing: Optional callback receiving a StreamTiming (connect, TLS and
+                    first-byte time in ms) once the response headers arrive.
+            deadline: Max seconds until the stream is fully consumed, including
+                    retries before the first chunk; DeadlineExceededError is raised when
+                    exceeded.
 
         Yields:
             StreamChunk objects with compressed content
@@ -203,10 +394,98 @@ class CompressionClient(BaseCompressionClient):
             disable_placeholders,
         )
         _, stream_endpoint = self._resolve_endpoints(compression_model_name, query)
-        yield from self._do_stream(stream_endpoint, req)
+        yield from bounded(self._do_stream(stream_endpoint, req, on_timing), deadline)
+
+    async def compress_stream_async(
+        self,
+        context: str,
+        compression_model_name: str = "espresso_v1",
+        query: Optional[str] = None,
+        target_compression_ratio: Optional[float] = None,
+        coarse: Optional[bool] = None,
+        heuristic_chunking: Optional[bool] = None,
+        disable_placeholders: Optional[bool] = None,
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """
+        Stream compression (async).
+
+        Uses the same pooled httpx.AsyncClient as compress_async(), so no thread
+        is tied up per open stream. If you stop iterating early, close the
+        generator (``await stream.aclose()``) to hand the connection
+        back to the pool immediately; cancelling the consuming task does the same.
+
+        Args:
+            context: Context text to compress (single string)
+            compression_model_name: Compression model to use
+            query: Query for query-specific compression (required for latte_v1)
+            target_compression_ratio: Target ratio (optional)
+            coarse: Paragraph-level compression (only for query-specific with latte_v1).
+                    Ignored for agnostic compression (no query).
+            heuristic_chunking: Use heuristic chunking for structure preservation.
+            disable_placeholders: Disable placeholder tokens in output.
+            on_timing: Optional callback receiving a StreamTiming once the
+                    response headers arrive.
+            deadline: Max seconds until the stream is fully consumed;
+                    DeadlineExceededError is raised when exceeded.
+
+        Yields:
+            StreamChunk objects with compressed content
+        """
+        req = self._build_request(
+            context,
+            compression_model_name,
+            query,
+            target_compression_ratio,
+            coarse,
+            heuristic_chunking,
+            disable_placeholders,
+        )
+        _, stream_endpoint = self._resolve_endpoints(compression_model_name, query)
+        stream = bounded_async(self._do_stream_async(stream_endpoint, req, on_timing), deadline)
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
 
     # ==================== Batch Compression ====================
 
+    @overload
+    def compress_batch(
+        self,
+        contexts: List[str],
+        queries: Optional[Union[str, List[str]]] = ...,
+        compression_model_name: str = ...,
+        target_compression_ratio: Optional[float] = ...,
+        coarse: Optional[bool] = ...,
+        heuristic_chunking: Optional[bool] = ...,
+        disable_placeholders: Optional[bool] = ...,
+        max_concurrency: Optional[int] = ...,
+        deduplicate: bool = ...,
+        deadline: Optional[float] = ...,
+        *,
+        lean: Literal[False] = ...,
+    ) -> "MeasuredBatchResponse": ...
+
+    @overload
+    def compress_batch(
+        self,
+        contexts: List[str],
+        queries: Optional[Union[str, List[str]]] = ...,
+        compression_model_name: str = ...,
+        target_compression_ratio: Optional[float] = ...,
+        coarse: Optional[bool] = ...,
+        heuristic_chunking: Optional[bool] = ...,
+        disable_placeholders: Optional[bool] = ...,
+        max_concurrency: Optional[int] = ...,
+        deduplicate: bool = ...,
+        deadline: Optional[float] = ...,
+        *,
+        lean: Literal[True],
+    ) -> "LeanBatchResult": ...
+
     def compress_batch(
         self,
         contexts: List[str],
@@ -216,7 +495,12 @@ class CompressionClient(BaseCompressionClient):
         coarse: Optional[bool] = None,
         heuristic_chunking: Optional[bool] = None,
         disable_placeholders: Optional[bool] = None,
-    ) -> CompressBatchResponse:
+        max_concurrency: Optional[int] = None,
+        deduplicate: bool = True,
+        deadline: Optional[float] = None,
+        *,
+        lean: bool = False,
+    ) -> Union["MeasuredBatchResponse", "LeanBatchResult"]:
         """
         Batch compress multiple contexts (sync).
 
@@ -224,7 +508,9 @@ class CompressionClient(BaseCompressionClient):
         - If queries is provided: uses query-specific endpoint
 
         Args:
-            contexts: List of context strings to compress (1-100 items)
+            contexts: List of context strings to compress (any number of items).
+                    Batches larger than the server limit (100) are split into
+                    shards, sent concurrently and merged back in input order.
             queries: Either:
                 - None: agnostic compression (no queries)
                 - Single query string (same for all contexts)
@@ -237,9 +523,21 @@ class CompressionClient(BaseCompressionClient):
                     Only for query-specific batch. Ignored for agnostic.
             disable_placeholders: Disable placeholder tokens in output.
                     Only for query-specific batch. Ignored for agnostic.
+            max_concurrency: Max shards in flight at once (default 4). Only
+                    used when the batch is larger than one shard.
+            deduplicate: Send each distinct (context, query) pair once and copy its
+                    result to every position it appears at (default True).
+            deadline: Max seconds for the whole batch, all shards and retries
+                    included; DeadlineExceededError is raised when exceeded.
+            lean: Return a LeanBatchResult of LeanResults built without validation,
+                    each referencing its input string instead of the server's copy,
+                    so large batches hold every context once (default False).
 
         Returns:
-            CompressBatchResponse with results for each context and aggregated metrics
+            MeasuredBatchResponse (a CompressBatchResponse whose data also carries
+            the per-item metrics) with results for each context and aggregated metrics
+            (totals and average_compression_ratio are recomputed across shards and
+            count every position, duplicates included); LeanBatchResult if lean
 
         Example - agnostic batch:
             response = client.compress_batch(
@@ -260,42 +558,63 @@ class CompressionClient(BaseCompressionClient):
                 compression_model_name="latte_v1",
             )
         """
-        if queries is None:
-            # Agnostic batch (no queries)
-            agnostic_inputs = [AgnosticBatchInput(context=ctx) for ctx in contexts]
-            agnostic_req = AgnosticBatchRequest(
-                inputs=agnostic_inputs,
-                compression_model_name=compression_model_name,
-                target_compression_ratio=target_compression_ratio,
-            )
-            data = self.post(
-                ENDPOINTS.COMPRESS_AGNOSTIC_BATCH, agnostic_req.model_dump(exclude_none=True)
-            )
-        else:
-            # Query-specific batch
-            if isinstance(queries, str):
-                query_list = [queries] * len(contexts)
-            else:
-                if len(queries) != len(contexts):
-                    raise ValidationError(
-                        f"Number of queries ({len(queries)}) must match number of contexts ({len(contexts)})"
-                    )
-                query_list = queries
-
-            qs_inputs = [
-                CompressBatchInput(context=ctx, query=q) for ctx, q in zip(contexts, query_list)
-            ]
-            qs_req = CompressBatchRequest(
-                inputs=qs_inputs,
-                compression_model_name=compression_model_name,
-                target_compression_ratio=target_compression_ratio,
-                coarse=coarse,
-                heuristic_chunking=heuristic_chunking,
-                disable_placeholders=disable_placeholders,
-            )
-            data = self.post(ENDPOINTS.COMPRESS_QS_BATCH, qs_req.model_dump(exclude_none=True))
-
-        return CompressBatchResponse.model_validate(data)
+        query_list = self._resolve_batch_queries(contexts, queries)
+        positions = None
+        if deduplicate:
+            contexts, query_list, positions = batching.deduplicate_inputs(contexts, query_list)
+        payloads = self._build_batch_payloads(
+            contexts,
+            query_list,
+            compression_model_name,
+            target_compression_ratio,
+            coarse,
+            heuristic_chunking,
+            disable_placeholders,
+        )
+        with deadline_scope(deadline):
+            if lean:
+                from .lean import build_lean_batch, expand_lean_results
+
+                results = self._do_batch_lean(payloads, max_concurrency)
+                return build_lean_batch(expand_lean_results(results, positions))
+            response = self._do_batch(payloads, max_concurrency)
+        if positions is not None:
+            response = batching.expand_batch_response(response, positions)
+        return batching.measure_batch_response(response)
+
+    @overload
+    async def compress_batch_async(
+        self,
+        contexts: List[str],
+        queries: Optional[Union[str, List[str]]] = ...,
+        compression_model_name: str = ...,
+        target_compression_ratio: Optional[float] = ...,
+        coarse: Optional[bool] = ...,
+        heuristic_chunking: Optional[bool] = ...,
+        disable_placeholders: Optional[bool] = ...,
+        max_concurrency: Optional[int] = ...,
+        deduplicate: bool = ...,
+        deadline: Optional[float] = ...,
+        *,
+        lean: Literal[False] = ...,
+    ) -> "MeasuredBatchResponse": ...
+
+    @overload
+    async def compress_batch_async(
+        self,
+        contexts: List[str],
+        queries: Optional[Union[str, List[str]]] = ...,
+        compression_model_name: str = ...,
+        target_compression_ratio: Optional[float] = ...,
+        coarse: Optional[bool] = ...,
+        heuristic_chunking: Optional[bool] = ...,
+        disable_placeholders: Optional[bool] = ...,
+        max_concurrency: Optional[int] = ...,
+        deduplicate: bool = ...,
+        deadline: Optional[float] = ...,
+        *,
+        lean: Literal[True],
+    ) -> "LeanBatchResult": ...
 
     async def compress_batch_async(
         self,
@@ -306,7 +625,12 @@ class CompressionClient(BaseCompressionClient):
         coarse: Optional[bool] = None,
         heuristic_chunking: Optional[bool] = None,
         disable_placeholders: Optional[bool] = None,
-    ) -> CompressBatchResponse:
+        max_concurrency: Optional[int] = None,
+        deduplicate: bool = True,
+        deadline: Optional[float] = None,
+        *,
+        lean: bool = False,
+    ) -> Union["MeasuredBatchResponse", "LeanBatchResult"]:
         """
         Batch compress multiple contexts (async).
 
@@ -314,7 +638,9 @@ class CompressionClient(BaseCompressionClient):
         - If queries is provided: uses query-specific endpoint
 
         Args:
-            contexts: List of context strings to compress (1-100 items)
+            contexts: List of context strings to compress (any number of items).
+                    Batches larger than the server limit (100) are split into
+                    shards, sent concurrently and merged back in input order.
             queries: Either:
                 - None: agnostic compression (no queries)
                 - Single query string (same for all contexts)
@@ -325,45 +651,266 @@ class CompressionClient(BaseCompressionClient):
                     Ignored for agnostic batch (queries=None).
             heuristic_chunking: Use heuristic chunking for structure preservation.
             disable_placeholders: Disable placeholder tokens in output.
+            max_concurrency: Max shards in flight at once (default 4).
+            deduplicate: Send each distinct (context, query) pair once (default True).
+            deadline: Max seconds for the whole batch; DeadlineExceededError is raised
+                    when exceeded.
+            lean: Return a LeanBatchResult (see compress_batch()) (default False).
 
         Returns:
-            CompressBatchResponse with results for each context and aggregated metrics
+            MeasuredBatchResponse with results for each context and aggregated metrics
+            (LeanBatchResult if lean)
         """
-        if queries is None:
-            # Agnostic batch (no queries)
-            agnostic_inputs = [AgnosticBatchInput(context=ctx) for ctx in contexts]
-            agnostic_req = AgnosticBatchRequest(
-                inputs=agnostic_inputs,
-                compression_model_name=compression_model_name,
-                target_compression_ratio=target_compression_ratio,
-            )
-            data = await self.post_async(
-                ENDPOINTS.COMPRESS_AGNOSTIC_BATCH, agnostic_req.model_dump(exclude_none=True)
-            )
-        else:
-            # Query-specific batch
-            if isinstance(queries, str):
-                query_list = [queries] * len(contexts)
-            else:
-                if len(queries) != len(contexts):
-                    raise ValidationError(
-                        f"Number of queries ({len(queries)}) must match number of contexts ({len(contexts)})"
-                    )
-                query_list = queries
-
-            qs_inputs = [
-                CompressBatchInput(context=ctx, query=q) for ctx, q in zip(contexts, query_list)
-            ]
-            qs_req = CompressBatchRequest(
-                inputs=qs_inputs,
-                compression_model_name=compression_model_name,
-                target_compression_ratio=target_compression_ratio,
-                coarse=coarse,
-                heuristic_chunking=heuristic_chunking,
-                disable_placeholders=disable_placeholders,
-            )
-            data = await self.post_async(
-                ENDPOINTS.COMPRESS_QS_BATCH, qs_req.model_dump(exclude_none=True)
+        query_list = self._resolve_batch_queries(contexts, queries)
+        positions = None
+        if deduplicate:
+            contexts, query_list, positions = batching.deduplicate_inputs(contexts, query_list)
+        payloads = self._build_batch_payloads(
+            contexts,
+            query_list,
+            compression_model_name,
+            target_compression_ratio,
+            coarse,
+            heuristic_chunking,
+            disable_placeholders,
+        )
+        if lean:
+            from .lean import build_lean_batch, expand_lean_results
+
+            results = await run_within(
+                self._do_batch_lean_async(payloads, max_concurrency), deadline
             )
+            return build_lean_batch(expand_lean_results(results, positions))
+        response = await run_within(self._do_batch_async(payloads, max_concurrency), deadline)
+        if positions is not None:
+            response = batching.expand_batch_response(response, positions)
+        return batching.measure_batch_response(response)
+
+    def compress_batch_iter(
+        self,
+        contexts: List[str],
+        queries: Optional[Union[str, List[str]]] = None,
+        compression_model_name: str = "espresso_v1",
+        target_compression_ratio: Optional[float] = None,
+        coarse: Optional[bool] = None,
+        heuristic_chunking: Optional[bool] = None,
+        disable_placeholders: Optional[bool] = None,
+        deadline: Optional[float] = None,
+    ) -> Generator[CompressBatchItemResult, None, None]:
+        """
+        Batch compress, yielding each result as soon as it is decoded (sync).
+
+        Unlike compress_batch(), the response is parsed incrementally as it
+        arrives: processing can start before the whole body is received, and
+        only one result at a time is held by the client. Duplicate contexts
+        are not collapsed. Failures before a shard's first result are retried
+        per the retry policy.
+
+        Args:
+            contexts: List of context strings to compress (any number of items).
+                    Batches larger than the server limit (100) are split into
+                    shards that are sent one after another.
+            queries: None (agnostic), one query for all contexts, or one per context
+            compression_model_name: Compression model to use
+            target_compression_ratio: Target ratio (optional): 0-1 or >1 for Nx
+            coarse: Paragraph-level compression (only for query-specific batch).
+            heuristic_chunking: Use heuristic chunking for structure preservation.
+            disable_placeholders: Disable placeholder tokens in output.
+            deadline: Max seconds until the last result is yielded;
+                    DeadlineExceededError is raised when exceeded.
+
+        Yields:
+            CompressBatchItemResult for each context, in input order
+
+        Example:
+            for index, item in enumerate(client.compress_batch_iter(documents)):
+                store(index, item.compressed_context)
+        """
+        query_list = self._resolve_batch_queries(contexts, queries)
+        payloads = self._build_batch_payloads(
+            contexts,
+            query_list,
+            compression_model_name,
+            target_compression_ratio,
+            coarse,
+            heuristic_chunking,
+            disable_placeholders,
+        )
+        yield from bounded(self._iter_batch(payloads), deadline)
+
+    async def compress_batch_iter_async(
+        self,
+        contexts: List[str],
+        queries: Optional[Union[str, List[str]]] = None,
+        compression_model_name: str = "espresso_v1",
+        target_compression_ratio: Optional[float] = None,
+        coarse: Optional[bool] = None,
+        heuristic_chunking: Optional[bool] = None,
+        disable_placeholders: Optional[bool] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncGenerator[CompressBatchItemResult, None]:
+        """
+        Batch compress, yielding each result as soon as it is decoded (async).
+
+        See compress_batch_iter(). Close the generator (``await it.aclose()``)
+        when stopping early to release the connection right away.
+
+        Args:
+            contexts: List of context strings to compress (any number of items).
+                    Batches larger than the server limit (100) are split into
+                    shards that are sent one after another.
+            queries: None (agnostic), one query for all contexts, or one per context
+            compression_model_name: Compression model to use
+            target_compression_ratio: Target ratio (optional): 0-1 or >1 for Nx
+            coarse: Paragraph-level compression (only for query-specific batch).
+            heuristic_chunking: Use heuristic chunking for structure preservation.
+            disable_placeholders: Disable placeholder tokens in output.
+            deadline: Max seconds until the last result is yielded;
+                    DeadlineExceededError is raised when exceeded.
+
+        Yields:
+            CompressBatchItemResult for each context, in input order
+        """
+        query_list = self._resolve_batch_queries(contexts, queries)
+        payloads = self._build_batch_payloads(
+            contexts,
+            query_list,
+            compression_model_name,
+            target_compression_ratio,
+            coarse,
+            heuristic_chunking,
+            disable_placeholders,
+        )
+        stream = bounded_async(self._iter_batch_async(payloads), deadline)
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
+
+    # ==================== Concurrent Compression ====================
+
+    def compress_many(
+        self,
+        inputs: Iterable[CompressInput],
+        max_concurrency: Optional[int] = None,
+    ) -> Generator[CompressOutcome, None, None]:
+        """
+        Compress many independent inputs concurrently (sync), yielding as each completes.
+
+        At most max_concurrency requests are in flight; inputs are pulled from
+        the iterable lazily as slots free up, so it may be a generator.
+
+        Args:
+            inputs: Iterable of context strings, or mappings of compress() arguments,
+                    e.g. {"context": "...", "query": "...", "compression_model_name": "latte_v1"}
+            max_concurrency: Max requests in flight (default 10)
 
-        return CompressBatchResponse.model_validate(data)
+        Yields:
+            (index, result) tuples in completion order, where index is the input's
+            position and result is a CompressResponse or the CompresrError it raised
+
+        Example:
+            for index, result in client.compress_many(documents, max_concurrency=16):
+                if isinstance(result, CompresrError):
+                    ...
+                else:
+                    start_llm_call(index, result.data.compressed_context)
+        """
+        limit = max_concurrency or API_CONFIG.DEFAULT_MANY_CONCURRENCY
+        items = enumerate(inputs)
+        pending: Dict["Future[CompressResponse]", int] = {}
+
+        def compress_item(item: CompressInput) -> CompressResponse:
+            response: CompressResponse = self.compress(**_compress_kwargs(item))
+            return response
+
+        with ThreadPoolExecutor(max_workers=limit) as pool:
+
+            def submit_next() -> None:
+                for index, item in items:
+                    pending[pool.submit(compress_item, item)] = index
+                    return
+
+            try:
+                for _ in range(limit):
+                    submit_next()
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = pending.pop(future)
+                        submit_next()
+                        outcome: Union[CompressResponse, CompresrError]
+                        try:
+                            outcome = future.result()
+                        except CompresrError as e:
+                            outcome = e
+                        yield index, outcome
+            finally:
+                # Consumer stopped early: drop work that has not started yet
+                for future in pending:
+                    future.cancel()
+
+    async def compress_many_async(
+        self,
+        inputs: Union[Iterable[CompressInput], AsyncIterable[CompressInput]],
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncGenerator[CompressOutcome, None]:
+        """
+        Compress many independent inputs concurrently (async), yielding as each completes.
+
+        Unlike asyncio.gather over compress_async(), in-flight requests are
+        bounded and early results are available before the slowest finishes.
+
+        Args:
+            inputs: Iterable or async iterable of context strings, or mappings of
+                    compress() arguments
+            max_concurrency: Max requests in flight (default 10)
+
+        Yields:
+            (index, result) tuples in completion order, where result is a
+            CompressResponse or the CompresrError raised for that input
+        """
+        limit = max_concurrency or API_CONFIG.DEFAULT_MANY_CONCURRENCY
+        items = _aiter_inputs(inputs)
+        pending: Dict["asyncio.Future[CompressResponse]", int] = {}
+        next_index = 0
+        exhausted = False
+
+        async def compress_item(item: CompressInput) -> CompressResponse:
+            response: CompressResponse = await self.compress_async(**_compress_kwargs(item))
+            return response
+
+        try:
+            while True:
+                while not exhausted and len(pending) < limit:
+                    try:
+                        item = await items.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.ensure_future(compress_item(item))] = next_index
+                    next_index += 1
+
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = pending.pop(task)
+                    outcome: Union[CompressResponse, CompresrError]
+                    try:
+                        outcome = task.result()
+                    except CompresrError as e:
+                        outcome = e
+                    yield index, outcome
+        finally:
+            # Consumer stopped early: stop the requests in flight and wait for
+            # them to unwind, then release the caller's input generator
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await items.aclose()
+            aclose = getattr(inputs, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -0,0 +1,171 @@
+"""
+Concurrency - Adaptive (AIMD) limit on in-flight async requests.
+
+Internal module. The limit grows by about one slot per round trip while
+latency stays stable. It is cut multiplicatively when the server pushes
+back (rate limit, service unavailable, timeouts) or when a response is
+much slower than recent ones.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Optional, TypeVar
+
+from ..exceptions import ConnectionError as CompresrConnectionError
+from ..exceptions import (
+    DeadlineExceededError,
+    RateLimitError,
+    ServiceUnavailableError,
+    TimeoutError,
+)
+
+T = TypeVar("T")
+
+# Errors meaning "send less", as opposed to errors about the request itself
+OVERLOAD_ERRORS = (RateLimitError, ServiceUnavailableError, TimeoutError, CompresrConnectionError)
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency:
+    """AIMD settings.
+
+    A response counts as slow when its latency exceeds latency_tolerance
+    times the latency_percentile of the last latency_window responses, or
+    target_latency_ms if one is given.
+    """
+
+    initial_limit: int = 8
+    min_limit: int = 1
+    max_limit: int = 256
+    decrease_factor: float = 0.5
+    latency_percentile: float = 0.9
+    latency_tolerance: float = 2.0
+    latency_window: int = 100
+    target_latency_ms: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ConcurrencyStats:
+    """Snapshot of the adaptive limiter, suitable for graphing."""
+
+    limit: int
+    in_flight: int
+    latency_ms: Optional[float]
+    latency_percentile_ms: Optional[float]
+    decreases: int
+
+
+class AdaptiveConcurrencyLimiter:
+    """Gates async calls on an AIMD-adjusted in-flight limit (one event loop)."""
+
+    # Fewer samples than this don't give a meaningful percentile
+    _MIN_SAMPLES = 20
+
+    def __init__(self, config: AdaptiveConcurrency):
+        self.config = config
+        self._limit = float(config.initial_limit)
+        self._in_flight = 0
+        self._waiters: "Deque[asyncio.Future[None]]" = deque()
+        self._latencies: Deque[float] = deque(maxlen=config.latency_window)
+        self._last_decrease = 0.0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def stats(self) -> ConcurrencyStats:
+        return ConcurrencyStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            latency_ms=self._latencies[-1] if self._latencies else None,
+            latency_percentile_ms=self._percentile(),
+            decreases=self._decreases,
+        )
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn within the limit and feed its outcome back into the limit."""
+        await self._acquire()
+        started = time.monotonic()
+        try:
+            result = await fn()
+        except DeadlineExceededError:
+            # The caller's own deadline, not a sign of overload
+            self._release()
+            raise
+        except OVERLOAD_ERRORS:
+            self._on_overload(started)
+            self._release()
+            raise
+        except BaseException:
+            self._release()
+            raise
+        self._on_success(started, (time.monotonic() - started) * 1000)
+        self._release()
+        return result
+
+    # ==================== Slots ====================
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before the cancel: pass it on
+                self._release()
+            elif waiter in self._waiters:
+                # Still queued (a popped, cancelled waiter was skipped by _release)
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    # ==================== Limit ====================
+
+    def _percentile(self) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(self.config.latency_percentile * len(ordered)))
+        return ordered[index]
+
+    def _is_slow(self, latency_ms: float) -> bool:
+        if self.config.target_latency_ms is not None:
+            return latency_ms > self.config.target_latency_ms
+        if len(self._latencies) < self._MIN_SAMPLES:
+            return False
+        threshold = self._percentile()
+        return threshold is not None and latency_ms > threshold * self.config.latency_tolerance
+
+    def _on_success(self, started: float, latency_ms: float) -> None:
+        slow = self._is_slow(latency_ms)
+        self._latencies.append(latency_ms)
+        if slow:
+            self._on_overload(started)
+        elif self._in_flight >= self._limit / 2:
+            # Additive increase: about +1 per limit's worth of completions (one round
+            # trip), and only while the limit is actually being used
+            self._limit = min(self.config.max_limit, self._limit + 1 / self._limit)
+
+    def _on_overload(self, started: float) -> None:
+        # Requests already in flight at the last cut report the same congestion;
+        # count it once
+        if started <= self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self._decreases += 1
+        self._limit = max(self.config.min_limit, self._limit * self.config.decrease_factor)
@@ -0,0 +1,213 @@
+"""
+Deadline - Fine-grained timeouts and per-call time budgets.
+
+Internal module. A deadline is kept in a context variable so that every
+layer a call passes through (retry back-off, rate-limiter waits, pooled
+connection waits, HTTP timeouts, stream reads) can cap its own wait at the
+time left and raise DeadlineExceededError once the budget is spent. The
+client's stream timeout uses the same mechanism but raises TimeoutError,
+since it is about the service rather than the caller. Nested scopes keep
+the earliest deadline. Work handed to another thread must be run in a
+copy of the caller's context (contextvars.copy_context) to stay bounded.
+"""
+
+import asyncio
+import concurrent.futures
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncGenerator, Awaitable, Generator, Iterator, Optional, Tuple, TypeVar
+
+from ..exceptions import CompresrError, DeadlineExceededError, TimeoutError
+
+T = TypeVar("T")
+
+# (expires_at on the time.monotonic() clock, budget in seconds, whether it is the
+# client's stream timeout rather than a caller's deadline)
+_DEADLINE: ContextVar[Optional[Tuple[float, float, bool]]] = ContextVar(
+    "compresr_deadline", default=None
+)
+
+# Socket timers may fire marginally before the deadline they were capped at
+_CLOCK_SLACK = 0.005
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """Per-phase timeouts in seconds (None = the client's single timeout).
+
+    connect, read, write and pool bound each network operation (read is
+    the longest gap between bytes, so it also bounds stalls inside a
+    stream). stream bounds the total duration of a streaming call and
+    defaults to APIConfig.STREAM_TIMEOUT.
+    """
+
+    connect: Optional[float] = None
+    read: Optional[float] = None
+    write: Optional[float] = None
+    pool: Optional[float] = None
+    stream: Optional[float] = None
+
+    def resolve(self, default: float, stream: float) -> "ResolvedTimeouts":
+        """Fill unset phases with default (and stream with stream)."""
+        return ResolvedTimeouts(
+            connect=default if self.connect is None else self.connect,
+            read=default if self.read is None else self.read,
+            write=default if self.write is None else self.write,
+            pool=default if self.pool is None else self.pool,
+            stream=stream if self.stream is None else self.stream,
+        )
+
+
+@dataclass(frozen=True)
+class ResolvedTimeouts:
+    """Timeouts with every phase filled in."""
+
+    connect: float
+    read: float
+    write: float
+    pool: float
+    stream: float
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """Bound everything run inside the block to ``seconds`` (None = no-op)."""
+    if seconds is None:
+        yield
+        return
+    with _scope(time.monotonic() + seconds, seconds, False):
+        yield
+
+
+@contextmanager
+def _scope(expires_at: float, budget: float, is_timeout: bool) -> Iterator[None]:
+    current = _DEADLINE.get()
+    if current is not None and current[0] <= expires_at:
+        yield
+        return
+    token = _DEADLINE.set((expires_at, budget, is_timeout))
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """Run the block unbounded, e.g. work shared by callers with different deadlines."""
+    token = _DEADLINE.set(None)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline (None if there is none)."""
+    current = _DEADLINE.get()
+    return None if current is None else current[0] - time.monotonic()
+
+
+def deadline_error() -> CompresrError:
+    """DeadlineExceededError for the current deadline (TimeoutError for the stream timeout)."""
+    current = _DEADLINE.get()
+    if current is not None and current[2]:
+        return TimeoutError(f"Stream timed out after {current[1]:g}s", timeout_seconds=current[1])
+    budget = current[1] if current is not None else 0.0
+    return DeadlineExceededError(f"Deadline of {budget:g}s exceeded", deadline_seconds=budget)
+
+
+def expired() -> bool:
+    """Whether the current deadline has run out (so it caused a timeout firing now)."""
+    left = remaining()
+    return left is not None and left <= _CLOCK_SLACK
+
+
+def cap(seconds: float) -> float:
+    """Limit a wait to the time left, raising deadline_error() if none is left."""
+    left = remaining()
+    if left is None:
+        return seconds
+    if left <= 0:
+        raise deadline_error()
+    return min(seconds, left)
+
+
+def has_time_for(seconds: float) -> bool:
+    """Whether waiting ``seconds`` still ends before the deadline."""
+    left = remaining()
+    return left is None or seconds < left
+
+
+def result_within(future: "concurrent.futures.Future[T]") -> T:
+    """Wait for a future from another thread, but no longer than the deadline."""
+    left = remaining()
+    if left is None:
+        return future.result()
+    try:
+        return future.result(timeout=max(left, 0.0))
+    except concurrent.futures.TimeoutError:
+        raise deadline_error() from None
+
+
+async def run_within(awaitable: Awaitable[T], seconds: Optional[float]) -> T:
+    """Await under a deadline, cancelling the work when it is exceeded."""
+    with deadline_scope(seconds):
+        left = remaining()
+        if left is None:
+            return await awaitable
+        error = deadline_error()
+        try:
+            # The task wait_for creates copies this context, deadline included
+            return await asyncio.wait_for(awaitable, timeout=max(left, 0.0))
+        except asyncio.TimeoutError:
+            raise error from None
+
+
+def bounded(
+    stream: Generator[T, None, None], seconds: Optional[float], is_timeout: bool = False
+) -> Generator[T, None, None]:
+    """Run each step of a sync stream under one deadline, closing it when done.
+
+    With is_timeout=True the bound is the client's stream timeout, and running
+    out of it raises TimeoutError instead of DeadlineExceededError.
+    """
+    if seconds is None:
+        yield from stream
+        return
+    expires_at = time.monotonic() + seconds
+    try:
+        while True:
+            with _scope(expires_at, seconds, is_timeout):
+                cap(seconds)
+                try:
+                    item = next(stream)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        stream.close()
+
+
+async def bounded_async(
+    stream: AsyncGenerator[T, None], seconds: Optional[float], is_timeout: bool = False
+) -> AsyncGenerator[T, None]:
+    """Run each step of an async stream under one deadline, closing it when done."""
+    try:
+        if seconds is None:
+            async for item in stream:
+                yield item
+            return
+        expires_at = time.monotonic() + seconds
+        while True:
+            with _scope(expires_at, seconds, is_timeout):
+                cap(seconds)
+                try:
+                    item = await stream.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        await stream.aclose()
@@ -0,0 +1,215 @@
+"""
+Disk Cache - Persistent compression result cache shared across processes.
+
+Backed by SQLite in WAL mode, so several worker processes on one host can
+read and write the same cache file concurrently and a restarted process
+starts warm. Triggers keep the payload total in a one-row table, so
+eviction checks never scan the cache, and access times of hits are
+buffered and written in batches, so lookups rarely take the write lock.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Union
+
+from ..schemas import CompressResponse
+from .cache import CacheStats
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+)
+"""
+_ACCESS_INDEX = "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at)"
+_TOTALS = (
+    "CREATE TABLE IF NOT EXISTS totals"
+    " (id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL, bytes INTEGER NOT NULL)",
+    # Seeded from the table so files written before the triggers existed stay correct
+    "INSERT OR IGNORE INTO totals SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM results",
+    "CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results BEGIN"
+    " UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size; END",
+    "CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results BEGIN"
+    " UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size; END",
+    "CREATE TRIGGER IF NOT EXISTS results_resize AFTER UPDATE OF size ON results BEGIN"
+    " UPDATE totals SET bytes = bytes + NEW.size - OLD.size; END",
+)
+# Buffered hit access times are written once this many have accumulated
+_ACCESS_FLUSH_SIZE = 64
+
+
+class DiskCache:
+    """SQLite-backed LRU cache of CompressResponses, bounded by bytes on disk.
+
+    Entries are evicted least-recently-used once the stored payloads exceed
+    max_bytes; freed pages are returned to the filesystem incrementally and
+    compact() rewrites the file completely. Recency is per process until its
+    buffered access times are flushed (on the next set(), every
+    64 hits, or on close()).
+
+    Args:
+        path: Cache file location (created if missing)
+        max_bytes: Maximum total size of stored payloads
+        ttl: Seconds an entry stays valid (None = no expiry)
+        busy_timeout: Seconds to wait for another process's write lock
+    """
+
+    blocking = True  # get/set do disk I/O; async callers run them in a thread
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        busy_timeout: float = 5.0,
+    ):
+        self._path = os.fspath(path)
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        import sqlite3  # only when a disk cache is actually used
+
+        self._conn = sqlite3.connect(
+            self._path, timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        # auto_vacuum only takes effect before the first table is created
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_ACCESS_INDEX)
+        self._conn.execute("BEGIN IMMEDIATE")
+        for statement in _TOTALS:
+            self._conn.execute(statement)
+        self._conn.execute("COMMIT")
+        self._accessed: Dict[str, float] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Optional[CompressResponse]:
+        """Return the cached response, or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._accessed[key] = now
+            if len(self._accessed) >= _ACCESS_FLUSH_SIZE:
+                self._flush_accessed_locked()
+            self._hits += 1
+        return CompressResponse.model_validate_json(value)
+
+    def _flush_accessed_locked(self) -> None:
+        """Write buffered hit access times in one transaction (the caller's, if open)."""
+        if not self._accessed:
+            return
+        updates = [(at, key) for key, at in self._accessed.items()]
+        self._accessed.clear()
+        if self._conn.in_transaction:
+            self._conn.executemany("UPDATE results SET accessed_at = ? WHERE key = ?", updates)
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany("UPDATE results SET accessed_at = ? WHERE key = ?", updates)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def set(self, key: str, response: CompressResponse) -> None:
+        """Store a successful response, evicting least-recently-used entries to fit."""
+        if not response.success or response.data is None:
+            return
+        value = response.model_dump_json().encode("utf-8")
+        if len(value) > self._max_bytes:
+            return
+        now = time.time()
+        expires_at = now + self._ttl if self._ttl is not None else None
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._flush_accessed_locked()
+                # An upsert rather than INSERT OR REPLACE, whose implicit delete
+                # would bypass the totals triggers
+                self._conn.execute(
+                    "INSERT INTO results (key, value, size, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET"
+                    " value = excluded.value, size = excluded.size,"
+                    " expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                    (key, value, len(value), expires_at, now),
+                )
+                evicted = self._evict_locked()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._evictions += evicted
+            if evicted:
+                self._conn.execute("PRAGMA incremental_vacuum")
+
+    def _evict_locked(self) -> int:
+        """Delete oldest-accessed entries until the payload total fits max_bytes."""
+        (total,) = self._conn.execute("SELECT bytes FROM totals").fetchone()
+        excess = total - self._max_bytes
+        if excess <= 0:
+            return 0
+
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY accessed_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM results WHERE key = ?", victims)
+        return len(victims)
+
+    def compact(self) -> None:
+        """Drop expired entries and rewrite the file to reclaim all free space."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM results WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            self._conn.execute("VACUUM")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._accessed.clear()
+            self._conn.execute("DELETE FROM results")
+            self._conn.execute("PRAGMA incremental_vacuum")
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_accessed_locked()
+            self._conn.close()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Lookup counters of this process plus the shared entry/byte totals."""
+        with self._lock:
+            entries, size = self._conn.execute("SELECT entries, bytes FROM totals").fetchone()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=entries,
+                bytes=size,
+            )
@@ -0,0 +1,149 @@
+"""
+Encoding - Request body compression and wire accounting.
+
+Internal module. Large JSON bodies (contexts of hundreds of KB, batches of
+them) are gzip- or zstd-compressed and sent with Content-Encoding; small
+ones go out as-is. Every request's uncompressed and on-the-wire sizes and
+compression CPU time are recorded. Compressed responses are decoded by
+httpx, which advertises the encodings it supports in Accept-Encoding.
+"""
+
+import gzip
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from ..config import HEADERS
+from .lazy import lazy_import, module_available
+
+if TYPE_CHECKING:
+    import zstandard
+else:
+    zstandard = lazy_import("zstandard")
+
+ZSTD_AVAILABLE = module_available("zstandard")
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+
+@dataclass(frozen=True)
+class WireRecord:
+    """Sizes and compression cost of one request."""
+
+    encoding: Optional[str]
+    body_bytes: int
+    sent_bytes: int
+    compress_ms: float
+    received_bytes: int = 0
+    response_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class BodyCompression:
+    """Request body compression settings.
+
+    Bodies of at least min_bytes are compressed with algorithm ("gzip" or
+    "zstd", which needs the zstandard package) at level (None = the
+    algorithm's default). on_request, if given, receives a WireRecord
+    after every request.
+    """
+
+    algorithm: str = GZIP
+    min_bytes: int = 32 * 1024
+    level: Optional[int] = None
+    on_request: Optional[Callable[[WireRecord], None]] = None
+
+
+@dataclass(frozen=True)
+class WireStats:
+    """Cumulative bytes on the wire and compression CPU time."""
+
+    requests: int
+    compressed_requests: int
+    body_bytes: int
+    sent_bytes: int
+    received_bytes: int
+    response_bytes: int
+    compress_seconds: float
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes kept off the wire in both directions."""
+        return self.body_bytes - self.sent_bytes + self.response_bytes - self.received_bytes
+
+
+class BodyEncoder:
+    """Encodes request bodies per a BodyCompression policy and keeps wire stats."""
+
+    def __init__(self, config: BodyCompression):
+        if config.algorithm not in (GZIP, ZSTD):
+            raise ValueError(f"Unsupported body compression: {config.algorithm!r}")
+        if config.algorithm == ZSTD and not ZSTD_AVAILABLE:
+            raise ImportError("zstd body compression requires zstandard: pip install zstandard")
+        self.config = config
+        self._local = threading.local()  # zstd compressors are not thread-safe
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._compressed = 0
+        self._body_bytes = 0
+        self._sent_bytes = 0
+        self._received_bytes = 0
+        self._response_bytes = 0
+        self._compress_seconds = 0.0
+
+    @property
+    def stats(self) -> WireStats:
+        with self._lock:
+            return WireStats(
+                requests=self._requests,
+                compressed_requests=self._compressed,
+                body_bytes=self._body_bytes,
+                sent_bytes=self._sent_bytes,
+                received_bytes=self._received_bytes,
+                response_bytes=self._response_bytes,
+                compress_seconds=self._compress_seconds,
+            )
+
+    def _compress(self, body: bytes) -> bytes:
+        level = self.config.level
+        if self.config.algorithm == GZIP:
+            # mtime=0 keeps output deterministic for identical bodies
+            return gzip.compress(body, compresslevel=6 if level is None else level, mtime=0)
+        compressor = getattr(self._local, "zstd", None)
+        if compressor is None:
+            compressor = self._local.zstd = zstandard.ZstdCompressor(
+                level=3 if level is None else level
+            )
+        result: bytes = compressor.compress(body)
+        return result
+
+    def encode(self, body: bytes) -> Tuple[bytes, Dict[str, str], WireRecord]:
+        """Maybe compress a serialized body: (content, extra headers, record)."""
+        if len(body) < self.config.min_bytes:
+            return body, {}, WireRecord(None, len(body), len(body), 0.0)
+
+        started = time.perf_counter()
+        content = self._compress(body)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        headers = {HEADERS.CONTENT_ENCODING: self.config.algorithm}
+        return (
+            content,
+            headers,
+            WireRecord(self.config.algorithm, len(body), len(content), elapsed_ms),
+        )
+
+    def record(self, record: WireRecord, received_bytes: int, response_bytes: int) -> None:
+        """Add a finished request (with its response sizes) to the stats."""
+        record = replace(record, received_bytes=received_bytes, response_bytes=response_bytes)
+        with self._lock:
+            self._requests += 1
+            self._compressed += record.encoding is not None
+            self._body_bytes += record.body_bytes
+            self._sent_bytes += record.sent_bytes
+            self._received_bytes += received_bytes
+            self._response_bytes += response_bytes
+            self._compress_seconds += record.compress_ms / 1000
+        if self.config.on_request is not None:
+            self.config.on_request(record)
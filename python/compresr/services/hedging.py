@@ -0,0 +1,232 @@
+"""
+Hedging - Duplicate slow requests to cut tail latency.
+
+Internal module. If a request is still outstanding once it has taken
+longer than a percentile of recent latencies, an identical backup request
+is sent and whichever succeeds first is used. Hedges are capped to a
+fraction of all requests so a slow service isn't hit with double load.
+"""
+
+import asyncio
+import contextvars
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """Hedging settings.
+
+    A hedge is sent once a request has been outstanding for the given
+    percentile of the last latency_window latencies (never sooner than
+    min_delay_ms), provided hedges stay within max_extra_ratio of all
+    requests. No hedging happens until min_samples latencies are known.
+    """
+
+    percentile: float = 0.95
+    min_delay_ms: float = 10.0
+    max_extra_ratio: float = 0.05
+    latency_window: int = 200
+    min_samples: int = 20
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """Snapshot of hedging activity."""
+
+    requests: int
+    hedges_sent: int
+    hedges_won: int
+
+    @property
+    def extra_ratio(self) -> float:
+        return self.hedges_sent / self.requests if self.requests else 0.0
+
+
+class _DaemonPool:
+    """Minimal worker pool on daemon threads.
+
+    Unlike ThreadPoolExecutor, whose workers are joined at interpreter exit,
+    an abandoned slow request here never holds up process shutdown.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers = max_workers
+        self._work: "queue.SimpleQueue[Optional[Tuple[Future[Any], Callable[[], Any]]]]" = (
+            queue.SimpleQueue()
+        )
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._idle = 0
+
+    def submit(self, fn: Callable[[], T]) -> "Future[T]":
+        """Run fn on a worker, in a copy of the caller's context (deadline included)."""
+        future: "Future[T]" = Future()
+        fn = partial(contextvars.copy_context().run, fn)
+        with self._lock:
+            if self._idle:
+                self._idle -= 1
+            elif self._workers < self._max_workers:
+                self._workers += 1
+                threading.Thread(target=self._worker, name="compresr-hedge", daemon=True).start()
+        self._work.put((future, fn))
+        return future
+
+    def _worker(self) -> None:
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            future, fn = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn())
+                except BaseException as e:
+                    future.set_exception(e)
+            with self._lock:
+                self._idle += 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers, self._workers, self._idle = self._workers, 0, 0
+        for _ in range(workers):
+            self._work.put(None)
+
+
+class Hedger:
+    """Runs calls with a delayed backup copy and returns the first success.
+
+    Async losers are cancelled. A sync call can't be interrupted once it
+    runs, so sync losers are abandoned: they finish in the background and
+    their result is dropped.
+    """
+
+    def __init__(self, policy: HedgingPolicy, max_workers: int):
+        self.policy = policy
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=policy.latency_window)
+        self._pool: Optional[_DaemonPool] = None
+        self._requests = 0
+        self._hedges_sent = 0
+        self._hedges_won = 0
+
+    @property
+    def stats(self) -> HedgingStats:
+        with self._lock:
+            return HedgingStats(
+                requests=self._requests,
+                hedges_sent=self._hedges_sent,
+                hedges_won=self._hedges_won,
+            )
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging (None = not enough data yet)."""
+        with self._lock:
+            self._requests += 1
+            if len(self._latencies) < self.policy.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(self.policy.percentile * len(ordered)))
+        return max(ordered[index], self.policy.min_delay_ms / 1000)
+
+    def _spend_hedge(self) -> bool:
+        with self._lock:
+            if self._hedges_sent + 1 > self.policy.max_extra_ratio * self._requests:
+                return False
+            self._hedges_sent += 1
+            return True
+
+    def _record(self, started: float, hedge_won: bool) -> None:
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+            if hedge_won:
+                self._hedges_won += 1
+
+    # ==================== Sync ====================
+
+    def _get_pool(self) -> _DaemonPool:
+        with self._lock:
+            if self._pool is None:
+                self._pool = _DaemonPool(self._max_workers)
+            return self._pool
+
+    def run(self, fn: Callable[[], T]) -> T:
+        """Call fn, hedging it if it is slow (sync)."""
+        delay = self._hedge_delay()
+        if delay is None:
+            started = time.monotonic()
+            result = fn()
+            self._record(started, hedge_won=False)
+            return result
+
+        pool = self._get_pool()
+        starts = [time.monotonic()]
+        futures: List["Future[T]"] = [pool.submit(fn)]
+        done, _ = wait(futures, timeout=delay)
+        if not done and self._spend_hedge():
+            starts.append(time.monotonic())
+            futures.append(pool.submit(fn))
+
+        pending = set(futures)
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # A success beats a failure that completed at the same time
+            for future in sorted(done, key=lambda f: f.exception() is not None):
+                if future.exception() is None or not pending:
+                    for loser in pending:
+                        loser.cancel()
+                    index = futures.index(future)
+                    if future.exception() is None:
+                        self._record(starts[index], hedge_won=index == 1)
+                    return future.result()
+
+    # ==================== Async ====================
+
+    async def run_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn, hedging it if it is slow; the losing request is cancelled."""
+        delay = self._hedge_delay()
+        if delay is None:
+            started = time.monotonic()
+            result = await fn()
+            self._record(started, hedge_won=False)
+            return result
+
+        starts = [time.monotonic()]
+        tasks: "List[asyncio.Future[T]]" = [asyncio.ensure_future(fn())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self._spend_hedge():
+                starts.append(time.monotonic())
+                tasks.append(asyncio.ensure_future(fn()))
+
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: t.exception() is not None):
+                    if task.exception() is None or not pending:
+                        index = tasks.index(task)
+                        if task.exception() is None:
+                            self._record(starts[index], hedge_won=index == 1)
+                        return task.result()
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                # Let the cancellation unwind so the loser's connection is released
+                await asyncio.wait(losers)
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
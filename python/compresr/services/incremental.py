@@ -0,0 +1,183 @@
+"""
+Incremental - Streaming extraction of array elements from a JSON body.
+
+Internal module. ArrayItemParser is fed a response body chunk by chunk and
+returns each element of the array at a given key path (e.g. data.results
+of a batch response) as raw JSON bytes as soon as its closing bracket
+arrives. Only the element being read and the unparsed tail of the current
+chunk are buffered, so memory is bounded by one element rather than the
+whole body. String contents are skipped with bytes.find, so per-byte Python
+work is limited to the (small) structural parts of the document.
+"""
+
+import json
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Sequence
+
+from ..exceptions import CompresrError
+
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPEN = frozenset(b"{[")
+_CLOSE = frozenset(b"}]")
+_LBRACE = ord("{")
+_LBRACKET = ord("[")
+_RBRACKET = ord("]")
+_COMMA = ord(",")
+_COLON = ord(":")
+_WHITESPACE = frozenset(b" \t\r\n")
+
+
+class _Container:
+    """An open object or array; objects track the key of their current member."""
+
+    __slots__ = ("is_object", "key", "expect_key")
+
+    def __init__(self, is_object: bool):
+        self.is_object = is_object
+        self.key: Optional[str] = None
+        self.expect_key = is_object
+
+
+class ArrayItemParser:
+    """Incrementally extract the elements of the JSON array at ``path``.
+
+    path is the sequence of object keys leading from the top-level object
+    to the array, e.g. ("data", "results"). Elements must be objects or
+    arrays.
+    """
+
+    def __init__(self, path: Sequence[str]):
+        self.path = tuple(path)
+        self.found = False  # the array was opened
+        self.done = False  # the array was closed
+        self._buf = bytearray()
+        self._pos = 0
+        self._stack: List[_Container] = []
+        self._target_depth = -1
+        self._item_start: Optional[int] = None
+        self._string_start: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Consume the next chunk of the body, returning the elements it completed."""
+        if self.done:
+            return []
+        self._buf += chunk
+        items = self._scan()
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """Check the body ended after the array was read completely."""
+        if not self.found:
+            raise CompresrError(f"Response has no {'.'.join(self.path)} array")
+        if not self.done:
+            raise CompresrError("Response ended before the batch results were complete")
+
+    def _scan(self) -> List[bytes]:
+        buf = self._buf
+        stack = self._stack
+        items: List[bytes] = []
+        pos = self._pos
+        end = len(buf)
+        while pos < end:
+            if self._string_start is not None:
+                quote = buf.find(b'"', pos)
+                if quote < 0:
+                    pos = end
+                    break
+                pos = quote + 1
+                if self._escaped(quote):
+                    continue
+                self._string_done(self._string_start, quote)
+                self._string_start = None
+                continue
+
+            c = buf[pos]
+            if c == _QUOTE:
+                self._string_start = pos
+            elif c in _OPEN:
+                if len(stack) == self._target_depth and self._item_start is None:
+                    self._item_start = pos
+                stack.append(_Container(c == _LBRACE))
+                if c == _LBRACKET and not self.found and self._at_path():
+                    self.found = True
+                    self._target_depth = len(stack)
+            elif c in _CLOSE:
+                if not stack:
+                    raise CompresrError("Invalid JSON in response: unbalanced brackets")
+                stack.pop()
+                depth = len(stack)
+                if self._item_start is not None and depth == self._target_depth:
+                    items.append(bytes(buf[self._item_start : pos + 1]))
+                    self._item_start = None
+                elif c == _RBRACKET and depth == self._target_depth - 1:
+                    self.done = True
+                    pos += 1
+                    break
+            elif c == _COMMA:
+                if stack and stack[-1].is_object:
+                    stack[-1].expect_key = True
+            elif c == _COLON:
+                if stack:
+                    stack[-1].expect_key = False
+            elif c not in _WHITESPACE and len(stack) == self._target_depth:
+                raise CompresrError("Unexpected scalar in batch results")
+            pos += 1
+        self._pos = pos
+        return items
+
+    def _escaped(self, quote: int) -> bool:
+        """Whether the quote at ``quote`` is preceded by an odd run of backslashes."""
+        backslashes = 0
+        i = quote - 1
+        while self._buf[i] == _BACKSLASH:
+            backslashes += 1
+            i -= 1
+        return backslashes % 2 == 1
+
+    def _string_done(self, start: int, end: int) -> None:
+        stack = self._stack
+        # Only keys on the way to the array matter; others are skipped undecoded
+        if stack and stack[-1].expect_key and len(stack) <= len(self.path):
+            stack[-1].key = json.loads(bytes(self._buf[start : end + 1]))
+
+    def _at_path(self) -> bool:
+        """Whether the array just opened sits at self.path."""
+        parents = self._stack[:-1]
+        return len(parents) == len(self.path) and all(
+            parent.is_object and parent.key == key for parent, key in zip(parents, self.path)
+        )
+
+    def _compact(self) -> None:
+        """Drop consumed bytes that no pending element or string still needs."""
+        keep = self._pos
+        for start in (self._item_start, self._string_start):
+            if start is not None:
+                keep = min(keep, start)
+        if keep == 0:
+            return
+        del self._buf[:keep]
+        self._pos -= keep
+        if self._item_start is not None:
+            self._item_start -= keep
+        if self._string_start is not None:
+            self._string_start -= keep
+
+
+def iter_array_items(chunks: Iterable[bytes], path: Sequence[str]) -> Iterator[bytes]:
+    """Yield the elements of the array at path from a body arriving in chunks."""
+    parser = ArrayItemParser(path)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+async def aiter_array_items(
+    chunks: AsyncIterable[bytes], path: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """Async version of iter_array_items."""
+    parser = ArrayItemParser(path)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    parser.close()
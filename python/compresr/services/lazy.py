@@ -0,0 +1,38 @@
+"""
+Lazy - Deferred imports of heavy optional modules.
+
+Internal module. lazy_import returns a stand-in that imports the real
+module on first attribute access, so ``import compresr`` does not pay for
+httpx until the first request is made.
+"""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """Module stand-in that imports the real module on first attribute access.
+
+    Thread-safe: concurrent first accesses are serialized by the import
+    system's per-module lock. Resolved attributes are cached on the
+    stand-in, so later lookups cost the same as on the real module.
+    """
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(importlib.import_module(self.__name__), attr)
+        setattr(self, attr, value)
+        return value
+
+
+def module_available(name: str) -> bool:
+    """Whether a module can be imported, checked without importing it."""
+    return importlib.util.find_spec(name) is not None
+
+
+def lazy_import(name: str) -> ModuleType:
+    """The module if it is already imported, otherwise a LazyModule for it."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
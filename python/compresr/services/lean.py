@@ -0,0 +1,108 @@
+"""
+Lean - Lightweight compression results.
+
+Internal module. With ``lean=True``, results are slotted named tuples built
+straight from the decoded response, without pydantic validation. The
+server's echo of the input (original_context) is dropped as soon as the
+response is parsed; original_context on a lean result is a reference to
+the caller's own string, so a large context is held in memory once.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from ..exceptions import CompresrError
+from .metrics import BatchMetrics
+
+
+class LeanResult(NamedTuple):
+    """Compression result without validation or a copy of the input."""
+
+    compressed_context: str
+    original_tokens: int
+    compressed_tokens: int
+    actual_compression_ratio: float
+    tokens_saved: int
+    duration_ms: int
+    original_context: str  # the caller's input string, not the server's echo
+    target_compression_ratio: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class LeanBatchResult:
+    """Batch of lean results with aggregate and per-item (columnar) metrics."""
+
+    results: List[LeanResult]
+    total_original_tokens: int
+    total_compressed_tokens: int
+    total_tokens_saved: int
+    average_compression_ratio: float
+    count: int
+    metrics: BatchMetrics = field(default_factory=BatchMetrics, repr=False)
+
+
+def lean_result(
+    item: Dict[str, Any], context: str, target_compression_ratio: Optional[float] = None
+) -> LeanResult:
+    """Build a LeanResult from one decoded result object, referencing context."""
+    return LeanResult(
+        item["compressed_context"],
+        item["original_tokens"],
+        item["compressed_tokens"],
+        item["actual_compression_ratio"],
+        item["tokens_saved"],
+        item["duration_ms"],
+        context,
+        target_compression_ratio,
+    )
+
+
+def passthrough_result(
+    context: str, target_compression_ratio: Optional[float] = None
+) -> LeanResult:
+    """Uncompressed stand-in (ratio 1.0) used while the circuit is open."""
+    return LeanResult(context, 0, 0, 1.0, 0, 0, context, target_compression_ratio)
+
+
+def response_data(body: Dict[str, Any]) -> Any:
+    """The data member of a decoded response, raising if the server sent none."""
+    data = body.get("data")
+    if data is None:
+        raise CompresrError(body.get("message") or "Response contains no result")
+    return data
+
+
+def lean_batch_items(body: Dict[str, Any], contexts: Sequence[str]) -> List[LeanResult]:
+    """Lean results of one decoded batch response, in input order."""
+    items = response_data(body)["results"]
+    if len(items) != len(contexts):
+        raise CompresrError("Batch response does not match the request")
+    return [lean_result(item, context) for item, context in zip(items, contexts)]
+
+
+def build_lean_batch(results: List[LeanResult]) -> LeanBatchResult:
+    """Aggregate lean results like build_batch_result (mean of per-item ratios)."""
+    count = len(results)
+    return LeanBatchResult(
+        results=results,
+        total_original_tokens=sum(r.original_tokens for r in results),
+        total_compressed_tokens=sum(r.compressed_tokens for r in results),
+        total_tokens_saved=sum(r.tokens_saved for r in results),
+        average_compression_ratio=(
+            sum(r.actual_compression_ratio for r in results) / count if count else 0.0
+        ),
+        count=count,
+        metrics=BatchMetrics.from_results(results),
+    )
+
+
+def expand_lean_results(
+    results: List[LeanResult], positions: Optional[List[int]]
+) -> List[LeanResult]:
+    """Map results of unique inputs back onto every original position.
+
+    Lean results are immutable, so repeats share one object.
+    """
+    if positions is None:
+        return results
+    return [results[position] for position in positions]
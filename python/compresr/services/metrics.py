@@ -0,0 +1,154 @@
+"""
+Metrics - Columnar per-item metrics of batch compressions.
+
+Internal module. BatchMetrics stores each numeric field of a batch's
+results as one compact typed array (array.array: 8 bytes per value, no
+per-item Python objects), filled in a single pass. Sums, means,
+percentiles and histograms then run over contiguous buffers - with NumPy
+when it is installed (zero-copy views via to_numpy()), in pure Python
+otherwise. NumPy is only imported by the first aggregate that uses it.
+"""
+
+import bisect
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .lazy import lazy_import, module_available
+
+NUMPY_AVAILABLE = module_available("numpy")
+np = lazy_import("numpy")
+
+# Field name -> array typecode (q: signed 64-bit int, d: double)
+METRIC_FIELDS: Dict[str, str] = {
+    "original_tokens": "q",
+    "compressed_tokens": "q",
+    "tokens_saved": "q",
+    "duration_ms": "q",
+    "actual_compression_ratio": "d",
+}
+
+
+class BatchMetrics:
+    """Per-item metrics of a batch, one typed array per field.
+
+    Built from any iterable of results with the metric attributes
+    (CompressBatchItemResult, LeanResult, ...), including the iterator
+    returned by compress_batch_iter(), so metrics of millions of
+    compressions can be collected without keeping the results::
+
+        metrics = BatchMetrics.from_results(client.compress_batch_iter(docs))
+        metrics.percentile("duration_ms", 99)
+    """
+
+    __slots__ = tuple(METRIC_FIELDS)
+
+    original_tokens: "array[int]"
+    compressed_tokens: "array[int]"
+    tokens_saved: "array[int]"
+    duration_ms: "array[int]"
+    actual_compression_ratio: "array[float]"
+
+    def __init__(self) -> None:
+        for name, typecode in METRIC_FIELDS.items():
+            setattr(self, name, array(typecode))
+
+    @classmethod
+    def from_results(cls, results: Iterable[Any]) -> "BatchMetrics":
+        """Collect the metrics of results in one pass."""
+        metrics = cls()
+        metrics.extend(results)
+        return metrics
+
+    def append(self, result: Any) -> None:
+        """Add the metrics of one result."""
+        self.original_tokens.append(result.original_tokens)
+        self.compressed_tokens.append(result.compressed_tokens)
+        self.tokens_saved.append(result.tokens_saved)
+        self.duration_ms.append(result.duration_ms)
+        self.actual_compression_ratio.append(result.actual_compression_ratio)
+
+    def extend(self, results: Iterable[Any]) -> None:
+        """Add the metrics of results, consuming them one at a time."""
+        append = self.append
+        for result in results:
+            append(result)
+
+    def __len__(self) -> int:
+        return len(self.original_tokens)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BatchMetrics):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in METRIC_FIELDS)
+
+    def column(self, name: str) -> "array[Any]":
+        """The array of one metric field."""
+        if name not in METRIC_FIELDS:
+            raise ValueError(f"Unknown metric {name!r}; expected one of {list(METRIC_FIELDS)}")
+        column: "array[Any]" = getattr(self, name)
+        return column
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Zero-copy NumPy views of every column (requires numpy)."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for to_numpy(); pip install numpy")
+        return {name: _view(getattr(self, name)) for name in METRIC_FIELDS}
+
+    # ==================== Aggregates ====================
+
+    def sum(self, name: str) -> float:
+        """Sum of a metric."""
+        column = self.column(name)
+        total: float = _view(column).sum().item() if NUMPY_AVAILABLE else sum(column)
+        return total
+
+    def mean(self, name: str) -> float:
+        """Mean of a metric (0.0 for an empty batch)."""
+        count = len(self)
+        return self.sum(name) / count if count else 0.0
+
+    def percentile(self, name: str, q: float) -> float:
+        """q-th percentile (0-100) of a metric, linearly interpolated like numpy."""
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100")
+        column = self.column(name)
+        if not column:
+            raise ValueError("percentile of an empty batch")
+        if NUMPY_AVAILABLE:
+            return float(np.percentile(_view(column), q))
+        values = sorted(column)
+        rank = (len(values) - 1) * q / 100
+        low = math.floor(rank)
+        high = min(low + 1, len(values) - 1)
+        return float(values[low] + (values[high] - values[low]) * (rank - low))
+
+    def histogram(self, name: str, bins: int = 10) -> Tuple[List[int], List[float]]:
+        """Counts over bins equal-width bins spanning the metric's range.
+
+        Returns (counts, edges) with len(edges) == bins + 1; the last bin
+        includes its right edge, as in numpy.histogram.
+        """
+        if bins < 1:
+            raise ValueError("bins must be at least 1")
+        column = self.column(name)
+        if NUMPY_AVAILABLE:
+            counts, edges = np.histogram(_view(column), bins)
+            return counts.tolist(), edges.tolist()
+        low, high = (min(column), max(column)) if column else (0.0, 1.0)
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        width = (high - low) / bins
+        edges = [low + i * width for i in range(bins)] + [float(high)]
+        result = [0] * bins
+        for value in column:
+            result[min(bisect.bisect_right(edges, value) - 1, bins - 1)] += 1
+        return result, edges
+
+    def __repr__(self) -> str:
+        return f"BatchMetrics(count={len(self)})"
+
+
+def _view(column: "array[Any]") -> Any:
+    """NumPy array sharing the column's buffer (typecodes q/d are numpy dtypes)."""
+    return np.frombuffer(column, dtype=column.typecode)
@@ -0,0 +1,207 @@
+"""
+Mock - In-process stand-in for the compression API.
+
+Internal module. MockTransport is an httpx transport (sync and async)
+that answers the compress, batch, stream and health endpoints without any
+network, with configurable latency, error rate and compression ratio.
+Pass it as ``transport=`` / ``async_transport=`` to measure the client's
+own overhead and concurrency behaviour deterministically.
+"""
+
+import asyncio
+import gzip
+import json
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from ..config import API_CONFIG, HEADERS
+from .encoding import GZIP, ZSTD, ZSTD_AVAILABLE
+
+if ZSTD_AVAILABLE:
+    import zstandard
+
+
+@dataclass(frozen=True)
+class MockConfig:
+    """Behaviour of the mock API.
+
+    Each request waits latency_ms (plus up to latency_jitter_ms) and then
+    fails with error_status at error_rate, or succeeds keeping
+    compression_ratio of the context's words. Streams emit one word per
+    chunk, stream_chunk_ms apart. A seed makes jitter and errors repeatable.
+    """
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    compression_ratio: float = 0.5
+    stream_chunk_ms: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class MockStats:
+    """Snapshot of mock API traffic."""
+
+    requests: int
+    errors: int
+    in_flight: int
+    max_in_flight: int
+
+
+class MockTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport serving the compression API in-process."""
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    @property
+    def stats(self) -> MockStats:
+        with self._lock:
+            return MockStats(
+                requests=self._requests,
+                errors=self._errors,
+                in_flight=self._in_flight,
+                max_in_flight=self._max_in_flight,
+            )
+
+    # ==================== Transport ====================
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._tracked() as (delay, failed):
+            time.sleep(delay)
+            request.read()
+            if failed:
+                return self._error()
+            if request.url.path.endswith("/stream"):
+                words = self._compress_words(self._payload(request)["context"])
+                return self._sse(self._iter_events(words))
+            return self._respond(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with self._tracked() as (delay, failed):
+            await asyncio.sleep(delay)
+            await request.aread()
+            if failed:
+                return self._error()
+            if request.url.path.endswith("/stream"):
+                words = self._compress_words(self._payload(request)["context"])
+                return self._sse(self._aiter_events(words))
+            return self._respond(request)
+
+    @contextmanager
+    def _tracked(self) -> Iterator[Tuple[float, bool]]:
+        """Count one request and draw its latency and outcome."""
+        config = self.config
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+            jitter = self._random.random() * config.latency_jitter_ms
+            failed = self._random.random() < config.error_rate
+            if failed:
+                self._errors += 1
+        try:
+            yield (config.latency_ms + jitter) / 1000, failed
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    # ==================== Endpoints ====================
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "GET" and path == API_CONFIG.HEALTH_PATH:
+            return httpx.Response(200, json={"status": "ok"})
+        if request.method != "POST" or not path.startswith("/api/compress/"):
+            return httpx.Response(404, json={"error": "Not found"})
+
+        payload = self._payload(request)
+        if path.endswith("/batch"):
+            results = [self._result(item["context"]) for item in payload["inputs"]]
+            return httpx.Response(200, json={"success": True, "data": self._batch(results)})
+        return httpx.Response(200, json={"success": True, "data": self._result(payload["context"])})
+
+    def _error(self) -> httpx.Response:
+        return httpx.Response(
+            self.config.error_status,
+            json={"error": "Injected failure", "detail": "MockTransport error_rate"},
+        )
+
+    @staticmethod
+    def _payload(request: httpx.Request) -> Dict[str, Any]:
+        body = request.content
+        encoding = request.headers.get(HEADERS.CONTENT_ENCODING)
+        if encoding == GZIP:
+            body = gzip.decompress(body)
+        elif encoding == ZSTD and ZSTD_AVAILABLE:
+            body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        data: Dict[str, Any] = json.loads(body or b"{}")
+        return data
+
+    def _compress_words(self, context: str) -> List[str]:
+        words = context.split()
+        return words[: max(1, math.ceil(len(words) * self.config.compression_ratio))]
+
+    def _result(self, context: str) -> Dict[str, Any]:
+        original = len(context.split())
+        kept = self._compress_words(context)
+        return {
+            "original_context": context,
+            "compressed_context": " ".join(kept),
+            "original_tokens": original,
+            "compressed_tokens": len(kept),
+            "actual_compression_ratio": len(kept) / original if original else 1.0,
+            "tokens_saved": original - len(kept),
+            "duration_ms": int(self.config.latency_ms),
+        }
+
+    @staticmethod
+    def _batch(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "results": results,
+            "total_original_tokens": sum(r["original_tokens"] for r in results),
+            "total_compressed_tokens": sum(r["compressed_tokens"] for r in results),
+            "total_tokens_saved": sum(r["tokens_saved"] for r in results),
+            "average_compression_ratio": sum(r["actual_compression_ratio"] for r in results)
+            / len(results),
+            "count": len(results),
+        }
+
+    # ==================== Streaming ====================
+
+    @staticmethod
+    def _sse(content: Any) -> httpx.Response:
+        return httpx.Response(200, headers={HEADERS.CONTENT_TYPE: HEADERS.SSE}, content=content)
+
+    @staticmethod
+    def _event(data: str) -> bytes:
+        return f"data: {data}\n\n".encode("utf-8")
+
+    def _iter_events(self, words: List[str]) -> Iterator[bytes]:
+        for word in words:
+            if self.config.stream_chunk_ms:
+                time.sleep(self.config.stream_chunk_ms / 1000)
+            yield self._event(json.dumps({"content": word + " "}))
+        yield self._event("[DONE]")
+
+    async def _aiter_events(self, words: List[str]) -> AsyncIterator[bytes]:
+        for word in words:
+            if self.config.stream_chunk_ms:
+                await asyncio.sleep(self.config.stream_chunk_ms / 1000)
+            yield self._event(json.dumps({"content": word + " "}))
+        yield self._event("[DONE]")
@@ -5,20 +5,36 @@ Internal module providing HTTP methods for API calls.
 Do not use directly - use CompressionClient or FilterClient.
 """
 
-import json
-import ssl
-from typing import Any, Dict, Generator, NoReturn, Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
-
-try:
-    import httpx
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
 
-from ..config import API_CONFIG, HEADERS, STATUS_CODES
+from ..config import API_CONFIG, HEADERS, STATUS_CODES, sdk_version
 from ..exceptions import (
     ApiKeyBudgetError,
     AuthenticationError,
@@ -37,26 +53,93 @@ from ..exceptions import (
     ServerError,
     ServiceUnavailableError,
     TargetAuthenticationError,
+    TimeoutError,
     ValidationError,
 )
+from .deadline import (
+    Timeouts,
+    bounded,
+    bounded_async,
+    cap,
+    deadline_error,
+    expired,
+)
+from .lazy import lazy_import, module_available
+from .transport import (
+    PoolStats,
+    PoolTracer,
+    StreamTimer,
+    StreamTiming,
+    default_ssl_context,
+    unix_socket_bases,
+)
+
+# httpx and the incremental parser are imported on first use, not with the
+# package, and each opt-in feature when a client enables it
+if TYPE_CHECKING:
+    import httpx
+
+    from . import incremental
+    from .balancer import EndpointStats, LoadBalancer, LoadBalancing
+    from .circuit import CircuitBreaker, CircuitBreakerConfig, CircuitStats
+    from .codec import JsonCodec
+    from .concurrency import AdaptiveConcurrency, AdaptiveConcurrencyLimiter, ConcurrencyStats
+    from .encoding import BodyCompression, BodyEncoder, WireRecord, WireStats
+    from .rate_limit import RateLimit, RateLimiter, RateLimiterStats
+    from .retry import Retrier, RetryPolicy, RetryStats
+else:
+    httpx = lazy_import("httpx")
+    incremental = lazy_import(f"{__package__}.incremental")
+HTTPX_AVAILABLE = module_available("httpx")
+
+# Sentinel returned by _parse_sse_line for the terminating "data: [DONE]" event
+_SSE_DONE = object()
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+@dataclass(frozen=True)
+class BodyReader(Generic[T]):
+    """How a streamed response body becomes items: Accept header and sync/async readers."""
 
-# Get version dynamically
-try:
-    from importlib.metadata import version as get_version
+    accept: str
+    read: Callable[["httpx.Response"], Iterator[T]]
+    read_async: Callable[["httpx.Response"], AsyncIterator[T]]
 
-    SDK_VERSION = get_version("compresr")
-except Exception:
-    SDK_VERSION = "0.0.0-dev"
+
+def _array_reader(path: Sequence[str]) -> BodyReader[bytes]:
+    return BodyReader(
+        HEADERS.JSON,
+        lambda resp: incremental.iter_array_items(resp.iter_bytes(), path),
+        lambda resp: incremental.aiter_array_items(resp.aiter_bytes(), path),
+    )
 
 
 class HTTPClient:
-    """Internal HTTP client for Compresr API."""
+    """Internal HTTP client for Compresr API.
+
+    Sync and async requests each go through one persistent, pooled httpx
+    client (keep-alive connections, shared SSL context). Call close_sync()
+    or ``await close()`` - or use the client as a context manager - to
+    release the connections.
+    """
 
     def __init__(
         self,
         api_key: str,
-        base_url: Optional[str] = None,
-        timeout: Optional[int] = None,
+        base_url: Optional[Union[str, Sequence[str]]] = None,
+        timeout: Optional[Union[float, Timeouts]] = None,
+        pool_size: Optional[int] = None,
+        retry: Optional["RetryPolicy"] = None,
+        rate_limit: Optional["RateLimit"] = None,
+        adaptive_concurrency: Optional["AdaptiveConcurrency"] = None,
+        circuit_breaker: Optional["CircuitBreakerConfig"] = None,
+        load_balancing: Optional["LoadBalancing"] = None,
+        transport: Optional["httpx.BaseTransport"] = None,
+        async_transport: Optional["httpx.AsyncBaseTransport"] = None,
+        body_compression: Optional["BodyCompression"] = None,
+        json_codec: Union[str, "JsonCodec"] = "auto",
     ):
         if not api_key:
             raise AuthenticationError("API key is required")
@@ -66,9 +149,68 @@ class HTTPClient:
             )
 
         self._api_key = api_key
-        self._base_url = (base_url or API_CONFIG.BASE_URL).rstrip("/")
-        self._timeout = timeout or API_CONFIG.DEFAULT_TIMEOUT
+        base_urls = [base_url] if isinstance(base_url, str) else list(base_url or ())
+        base_urls = [url.rstrip("/") for url in base_urls] or [API_CONFIG.BASE_URL.rstrip("/")]
+        self._base_url = base_urls[0]
+        # unix:// base URLs are requested through a per-socket pseudo host
+        self._uds_paths: Dict[str, str] = {}
+        self._http_bases: Dict[str, str] = {}
+        for index, (url, path) in enumerate(unix_socket_bases(base_urls).items()):
+            self._http_bases[url] = f"http://unix-{index}.localhost"
+            self._uds_paths[self._http_bases[url]] = path
+        self._transport = transport
+        self._async_transport = async_transport
+        self._balancer: Optional["LoadBalancer"] = None
+        if len(base_urls) > 1:
+            from .balancer import LoadBalancer, LoadBalancing  # only with several base URLs
+
+            self._balancer = LoadBalancer(
+                base_urls, load_balancing or LoadBalancing(), self._probe_health
+            )
+        timeouts = timeout if isinstance(timeout, Timeouts) else Timeouts()
+        default_timeout = timeout if isinstance(timeout, (int, float)) and timeout else None
+        self._timeouts = timeouts.resolve(
+            default_timeout or API_CONFIG.DEFAULT_TIMEOUT, API_CONFIG.STREAM_TIMEOUT
+        )
+        self._pool_size = pool_size or API_CONFIG.DEFAULT_POOL_SIZE
+        self._keepalive = pool_size or API_CONFIG.DEFAULT_KEEPALIVE_CONNECTIONS
+        self._pool_tracer = PoolTracer(self._pool_size)
+        self._sync_client: Optional["httpx.Client"] = None
+        self._sync_client_lock = threading.Lock()
+        # Requests wait here rather than inside httpcore's pool, whose queueing
+        # is not reliable across threads once every connection is busy.
+        self._sync_slots = threading.BoundedSemaphore(self._pool_size)
         self._async_client: Optional["httpx.AsyncClient"] = None
+        self._async_pool_tracer = PoolTracer(self._pool_size)
+        # Each feature's module is imported only when the feature is enabled
+        self._retrier: Optional["Retrier"] = None
+        if retry is not None:
+            from .retry import Retrier
+
+            self._retrier = Retrier(retry)
+        self._rate_limiter: Optional["RateLimiter"] = None
+        if rate_limit is not None:
+            from .rate_limit import RateLimiter
+
+            self._rate_limiter = RateLimiter(rate_limit)
+        self._concurrency_limiter: Optional["AdaptiveConcurrencyLimiter"] = None
+        if adaptive_concurrency is not None:
+            from .concurrency import AdaptiveConcurrencyLimiter
+
+            self._concurrency_limiter = AdaptiveConcurrencyLimiter(adaptive_concurrency)
+        self._circuit_breaker: Optional["CircuitBreaker"] = None
+        if circuit_breaker is not None:
+            from .circuit import CircuitBreaker
+
+            self._circuit_breaker = CircuitBreaker(circuit_breaker)
+        from .codec import get_codec  # with the first client, not the package
+
+        self._codec = get_codec(json_codec)
+        self._body_encoder: Optional["BodyEncoder"] = None
+        if body_compression is not None:
+            from .encoding import BodyEncoder
+
+            self._body_encoder = BodyEncoder(body_compression)
 
     @property
     def _headers(self) -> Dict[str, str]:
@@ -76,12 +218,41 @@ class HTTPClient:
             HEADERS.API_KEY: self._api_key,
             HEADERS.CONTENT_TYPE: HEADERS.JSON,
             HEADERS.ACCEPT: HEADERS.JSON,
-            "User-Agent": f"compresr-python-sdk/{SDK_VERSION}",
+            "User-Agent": f"compresr-python-sdk/{sdk_version()}",
         }
 
-    def _url(self, endpoint: str) -> str:
+    def _url(self, endpoint: str, base_url: Optional[str] = None) -> str:
         # Ensure proper URL joining (no double slashes)
-        return f"{self._base_url}{endpoint}"
+        base_url = base_url or self._base_url
+        return f"{self._http_bases.get(base_url, base_url)}{endpoint}"
+
+    @contextmanager
+    def _route(self, endpoint: str) -> Iterator[str]:
+        """Yield the full URL for one request, balancing across base URLs if several."""
+        if self._balancer is None:
+            yield self._url(endpoint)
+            return
+        target = self._balancer.acquire()
+        started = time.monotonic()
+        try:
+            yield self._url(endpoint, target.url)
+        except BaseException as e:
+            self._balancer.release(target, started, e)
+            raise
+        self._balancer.release(target, started, None)
+
+    def _probe_health(self, base_url: str) -> bool:
+        """Check an ejected endpoint through /health (run on a background thread)."""
+        client = self._get_sync_client()
+        try:
+            with self._pool_slot():
+                resp = client.get(
+                    self._url(API_CONFIG.HEALTH_PATH, base_url),
+                    timeout=API_CONFIG.HEALTH_PROBE_TIMEOUT,
+                )
+        except (httpx.HTTPError, CompresrError):
+            return False
+        return resp.status_code == STATUS_CODES.OK
 
     def _extract_error_message(self, body: Dict[str, Any]) -> str:
         """Extract user-friendly error message from backend response."""
@@ -221,77 +392,240 @@ class HTTPClient:
         else:
             raise CompresrError(f"Request failed ({status_code}): {msg}", response_data=body)
 
+    # ==================== Connection Pool ====================
+
+    def _limits(self) -> "httpx.Limits":
+        return httpx.Limits(
+            max_connections=self._pool_size, max_keepalive_connections=self._keepalive
+        )
+
+    def _transport_options(self, sync: bool) -> Dict[str, Any]:
+        """transport / mounts arguments for a new httpx client.
+
+        An injected transport handles every request. Otherwise each unix://
+        endpoint gets its own socket transport, mounted on its pseudo host.
+        """
+        transport = self._transport if sync else self._async_transport
+        if transport is not None:
+            return {"transport": transport}
+        if not self._uds_paths:
+            return {}
+        cls = httpx.HTTPTransport if sync else httpx.AsyncHTTPTransport
+        return {
+            "mounts": {
+                base: cls(uds=path, limits=self._limits()) for base, path in self._uds_paths.items()
+            }
+        }
+
+    def _get_sync_client(self) -> "httpx.Client":
+        """Return the pooled sync client, creating it on first use (thread-safe)."""
+        if not HTTPX_AVAILABLE:
+            raise ImportError("HTTP requests require httpx: pip install httpx")
+
+        if self._sync_client is None:
+            with self._sync_client_lock:
+                if self._sync_client is None:
+                    self._sync_client = httpx.Client(
+                        timeout=self._httpx_timeout(),
+                        headers=self._headers,
+                        verify=default_ssl_context(),
+                        limits=self._limits(),
+                        **self._transport_options(sync=True),
+                    )
+        return self._sync_client
+
+    def _httpx_timeout(self) -> "httpx.Timeout":
+        """Per-phase timeouts, each capped at the time left before the deadline."""
+        t = self._timeouts
+        return httpx.Timeout(
+            connect=cap(t.connect), read=cap(t.read), write=cap(t.write), pool=cap(t.pool)
+        )
+
+    @staticmethod
+    def _timeout_error(message: str = "Request timed out") -> CompresrError:
+        """The deadline's error if it caused the timeout, else a plain TimeoutError."""
+        if expired():
+            return deadline_error()
+        return TimeoutError(message)
+
+    @contextmanager
+    def _pool_slot(self) -> Iterator[None]:
+        """Hold one of the pool's connection slots for the duration of a request."""
+        if not self._sync_slots.acquire(timeout=cap(self._timeouts.pool)):
+            raise self._timeout_error("Timed out waiting for a pooled connection")
+        self._pool_tracer.request_started()
+        try:
+            yield
+        finally:
+            self._pool_tracer.request_finished()
+            self._sync_slots.release()
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Connection reuse counters for the sync connection pool."""
+        return self._pool_tracer.snapshot()
+
+    @property
+    def async_pool_stats(self) -> PoolStats:
+        """Connection reuse counters for the async connection pool."""
+        return self._async_pool_tracer.snapshot()
+
+    @property
+    def retry_stats(self) -> Optional["RetryStats"]:
+        """Attempt/retry counters of the retry policy (None if retries are disabled)."""
+        return self._retrier.stats if self._retrier is not None else None
+
+    @property
+    def rate_limit_stats(self) -> Optional["RateLimiterStats"]:
+        """Throttling counters of the client-side rate limiter (None if disabled)."""
+        return self._rate_limiter.stats if self._rate_limiter is not None else None
+
+    @property
+    def concurrency_stats(self) -> Optional["ConcurrencyStats"]:
+        """Current adaptive in-flight limit and observed latency (None if disabled)."""
+        if self._concurrency_limiter is None:
+            return None
+        return self._concurrency_limiter.stats
+
+    @property
+    def endpoint_stats(self) -> Optional[List["EndpointStats"]]:
+        """Per-endpoint health, load and latency (None with a single base_url)."""
+        return self._balancer.stats if self._balancer is not None else None
+
+    @property
+    def wire_stats(self) -> Optional["WireStats"]:
+        """Request/response bytes on the wire and compression CPU time (None if disabled)."""
+        return self._body_encoder.stats if self._body_encoder is not None else None
+
+    @property
+    def circuit_stats(self) -> Optional["CircuitStats"]:
+        """State and counters of the circuit breaker (None if disabled)."""
+        return self._circuit_breaker.stats if self._circuit_breaker is not None else None
+
+    def _body(
+        self, data: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Dict[str, Any], Optional["WireRecord"]]:
+        """httpx arguments carrying data, compressed per the body compression policy."""
+        if data is None:
+            return {"headers": headers}, None
+        content = self._codec.dumps(data)
+        if self._body_encoder is None:
+            return {"content": content, "headers": headers}, None
+        content, extra, record = self._body_encoder.encode(content)
+        return {"content": content, "headers": {**(headers or {}), **extra}}, record
+
+    def _record_wire(
+        self, record: Optional["WireRecord"], resp: "httpx.Response", streamed: bool = False
+    ) -> None:
+        """Account a finished request (streams count raw bytes only)."""
+        if self._body_encoder is None or record is None:
+            return
+        if streamed:
+            received = response_bytes = resp.num_bytes_downloaded
+        else:
+            # Responses materialized in memory (e.g. by a mock transport) count no download
+            response_bytes = len(resp.content)
+            received = resp.num_bytes_downloaded or response_bytes
+        self._body_encoder.record(record, received, response_bytes)
+
+    def _parse_response(self, resp: "httpx.Response") -> Dict[str, Any]:
+        """Decode a JSON response body, raising the mapped error on HTTP >= 400."""
+        try:
+            body: Dict[str, Any] = self._codec.loads(resp.content)
+        except ValueError:
+            if resp.status_code < 400:
+                raise CompresrError(f"Invalid JSON response (HTTP {resp.status_code})")
+            body = {"error": f"HTTP {resp.status_code}", "detail": resp.reason_phrase}
+        if resp.status_code >= 400:
+            self._handle_error(resp.status_code, body)
+        return body
+
+    def _parse_model(self, resp: "httpx.Response", model: Type[M]) -> M:
+        """Validate a successful response straight from its bytes into model."""
+        if resp.status_code >= 400:
+            self._parse_response(resp)
+        try:
+            return model.model_validate_json(resp.content)
+        except PydanticValidationError as e:
+            if e.errors()[0]["type"] == "json_invalid":
+                raise CompresrError(f"Invalid JSON response (HTTP {resp.status_code})") from e
+            raise
+
     # ==================== Sync ====================
 
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Sync POST request."""
-        url = self._url(endpoint)
-        body = json.dumps(data).encode("utf-8")
-        req = Request(url, data=body, headers=self._headers, method="POST")
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        decode: Callable[["httpx.Response"], T],
+    ) -> T:
+        """Send a sync request over the pooled client, decoding the response with decode.
+
+        Layers, outermost first: circuit breaker, retry policy, one attempt.
+        """
+        call = partial(self._request_once, method, endpoint, data, decode)
+        if self._retrier is not None:
+            call = partial(self._retrier.call, call)
+        if self._circuit_breaker is not None:
+            return self._circuit_breaker.call(call)
+        return call()
+
+    def _request_once(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        decode: Callable[["httpx.Response"], T],
+    ) -> T:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(self._rate_limiter.request_bytes(data))
+        with self._route(endpoint) as url:
+            return self._send(method, url, data, decode)
 
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        decode: Callable[["httpx.Response"], T],
+    ) -> T:
+        client = self._get_sync_client()
+        body, record = self._body(data)
         try:
-            ctx = ssl.create_default_context()
-            with urlopen(req, timeout=self._timeout, context=ctx) as resp:
-                result: Dict[str, Any] = json.loads(resp.read().decode("utf-8"))
-                return result
-        except HTTPError as e:
-            try:
-                err = json.loads(e.read().decode("utf-8"))
-            except Exception:
-                err = {"error": str(e), "detail": e.reason}
-            self._handle_error(e.code, err)
-        except URLError as e:
-            raise CompresrConnectionError(f"Connection failed: {e.reason}")
-        except TimeoutError:
-            raise CompresrConnectionError("Request timed out")
-        except Exception as e:
+            with self._pool_slot():
+                resp = client.request(
+                    method,
+                    url,
+                    **body,
+                    timeout=self._httpx_timeout(),
+                    extensions={"trace": self._pool_tracer},
+                )
+        except httpx.TimeoutException:
+            raise self._timeout_error()
+        except httpx.ConnectError as e:
+            raise CompresrConnectionError(f"Connection failed: {str(e)}")
+        except httpx.HTTPError as e:
             raise CompresrError(f"Request failed: {str(e)}")
 
+        self._record_wire(record, resp)
+        return decode(resp)
+
+    def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Sync POST request."""
+        return self._request("POST", endpoint, data, self._parse_response)
+
+    def post_model(self, endpoint: str, data: Dict[str, Any], model: Type[M]) -> M:
+        """Sync POST request whose response is validated from bytes into model."""
+        return self._request("POST", endpoint, data, partial(self._parse_model, model=model))
+
     def get(self, endpoint: str) -> Dict[str, Any]:
         """Sync GET request."""
-        url = self._url(endpoint)
-        req = Request(url, headers=self._headers, method="GET")
-
-        try:
-            ctx = ssl.create_default_context()
-            with urlopen(req, timeout=self._timeout, context=ctx) as resp:
-                result: Dict[str, Any] = json.loads(resp.read().decode("utf-8"))
-                return result
-        except HTTPError as e:
-            try:
-                err = json.loads(e.read().decode("utf-8"))
-            except Exception:
-                err = {"error": str(e), "detail": e.reason}
-            self._handle_error(e.code, err)
-        except URLError as e:
-            raise CompresrConnectionError(f"Connection failed: {e.reason}")
-        except TimeoutError:
-            raise CompresrConnectionError("Request timed out")
-        except Exception as e:
-            raise CompresrError(f"Request failed: {str(e)}")
+        return self._request("GET", endpoint, None, self._parse_response)
 
     def delete(self, endpoint: str) -> Dict[str, Any]:
         """Sync DELETE request."""
-        url = self._url(endpoint)
-        req = Request(url, headers=self._headers, method="DELETE")
-
-        try:
-            ctx = ssl.create_default_context()
-            with urlopen(req, timeout=self._timeout, context=ctx) as resp:
-                result: Dict[str, Any] = json.loads(resp.read().decode("utf-8"))
-                return result
-        except HTTPError as e:
-            try:
-                err = json.loads(e.read().decode("utf-8"))
-            except Exception:
-                err = {"error": str(e), "detail": e.reason}
-            self._handle_error(e.code, err)
-        except URLError as e:
-            raise CompresrConnectionError(f"Connection failed: {e.reason}")
-        except TimeoutError:
-            raise CompresrConnectionError("Request timed out")
-        except Exception as e:
-            raise CompresrError(f"Request failed: {str(e)}")
+        return self._request("DELETE", endpoint, None, self._parse_response)
 
     def post_multipart(self, endpoint: str, files: Dict[str, Any]) -> Dict[str, Any]:
         """Sync multipart POST request (requires httpx)."""
@@ -302,118 +636,479 @@ class HTTPClient:
         # Use only auth + user-agent headers; httpx sets Content-Type for multipart
         mp_headers = {
             "X-API-Key": self._api_key,
-            "User-Agent": f"compresr-python-sdk/{SDK_VERSION}",
+            "User-Agent": f"compresr-python-sdk/{sdk_version()}",
         }
 
+        client = httpx.Client(timeout=self._httpx_timeout(), **self._transport_options(sync=True))
         try:
-            with httpx.Client(timeout=self._timeout) as client:
-                resp = client.post(url, files=files, headers=mp_headers)
-                body: Dict[str, Any] = resp.json()
-                if resp.status_code >= 400:
-                    self._handle_error(resp.status_code, body)
-                return body
+            resp = client.post(url, files=files, headers=mp_headers)
+            body: Dict[str, Any] = resp.json()
+            if resp.status_code >= 400:
+                self._handle_error(resp.status_code, body)
+            return body
         except httpx.TimeoutException:
-            raise CompresrConnectionError("Request timed out")
+            raise self._timeout_error()
         except httpx.ConnectError as e:
             raise CompresrConnectionError(f"Connection failed: {str(e)}")
+        finally:
+            # An injected transport belongs to the caller and outlives this client
+            if self._transport is None:
+                client.close()
 
-    def stream(self, endpoint: str, data: Dict[str, Any]) -> Generator[str, None, None]:
-        """Sync streaming POST request."""
-        if not HTTPX_AVAILABLE:
-            raise ImportError("Streaming requires httpx: pip install httpx")
+    def stream(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> Generator[str, None, None]:
+        """Sync streaming POST request over the pooled client.
 
-        url = self._url(endpoint)
-        # Add Accept header for SSE
-        headers = {**self._headers, "Accept": "text/event-stream"}
+        If given, on_timing is called with the connect/TLS/first-byte timing
+        once the response headers arrive. Failures before the first chunk
+        (connect errors, error statuses) are retried per the retry policy.
+        The circuit breaker judges the stream by whether a first chunk arrives.
+        The whole stream, retries included, is bounded by the stream timeout.
+        """
+        yield from self._stream(endpoint, data, self._sse_reader(), on_timing)
 
-        with httpx.Client(timeout=self._timeout) as client:
-            with client.stream("POST", url, json=data, headers=headers) as resp:
-                if resp.status_code >= 400:
-                    try:
-                        err = resp.json()
-                    except Exception:
-                        err = {"error": f"HTTP {resp.status_code}"}
-                    self._handle_error(resp.status_code, err)
-
-                # Use iter_lines() for proper SSE line-by-line parsing
-                for line in resp.iter_lines():
-                    if line.startswith("data: "):
-                        chunk = line[6:]
-                        if chunk == "[DONE]":
-                            return
-                        try:
-                            parsed = json.loads(chunk)
-                            if "content" in parsed:
-                                yield parsed["content"]
-                        except json.JSONDecodeError:
-                            # Yield raw content if not JSON
-                            if chunk:
-                                yield chunk
+    def stream_array(
+        self, endpoint: str, data: Dict[str, Any], path: Sequence[str]
+    ) -> Generator[bytes, None, None]:
+        """Sync streaming POST yielding each element of the JSON array at path as raw bytes.
 
-    # ==================== Async ====================
+        The response body is parsed incrementally, so elements are available
+        as they arrive and only one is buffered at a time. Retries, the circuit
+        breaker and the stream timeout apply as for stream().
+        """
+        yield from self._stream(endpoint, data, _array_reader(path))
 
-    async def post_async(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Async POST request."""
-        if not HTTPX_AVAILABLE:
-            raise ImportError("Async requires httpx: pip install httpx")
+    def _stream(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        reader: "BodyReader[T]",
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> Generator[T, None, None]:
+        stream = bounded(
+            self._stream_retrying(endpoint, data, reader, on_timing),
+            self._timeouts.stream,
+            is_timeout=True,
+        )
+        breaker = self._circuit_breaker
+        if breaker is None:
+            yield from stream
+            return
 
-        if self._async_client is None:
-            self._async_client = httpx.AsyncClient(timeout=self._timeout, headers=self._headers)
+        breaker.before_call()
+        recorded = False
+        try:
+            for content in stream:
+                if not recorded:
+                    breaker.record(None)
+                    recorded = True
+                yield content
+        except BaseException as e:
+            if not recorded:
+                breaker.record(e)
+            raise
+        if not recorded:
+            breaker.record(None)
+
+    def _stream_retrying(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        reader: "BodyReader[T]",
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> Generator[T, None, None]:
+        if self._retrier is None:
+            yield from self._stream_once(endpoint, data, reader, on_timing)
+            return
+
+        self._retrier.started()
+        attempt = 1
+        while True:
+            started = False
+            try:
+                for content in self._stream_once(endpoint, data, reader, on_timing):
+                    started = True
+                    yield content
+                return
+            except CompresrError as e:
+                delay = None if started else self._retrier.next_delay(attempt, e)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _stream_once(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        reader: "BodyReader[T]",
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> Generator[T, None, None]:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(self._rate_limiter.request_bytes(data))
+        with self._route(endpoint) as url:
+            yield from self._send_stream(url, data, reader, on_timing)
+
+    def _send_stream(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        reader: "BodyReader[T]",
+        on_timing: Optional[Callable[[StreamTiming], None]],
+    ) -> Generator[T, None, None]:
+        client = self._get_sync_client()
+        body, record = self._body(data, {HEADERS.ACCEPT: reader.accept})
+        timer = StreamTimer(self._pool_tracer)
 
-        url = self._url(endpoint)
         try:
-            resp = await self._async_client.post(url, json=data)
-            body: Dict[str, Any] = resp.json()
-            if resp.status_code >= 400:
-                self._handle_error(resp.status_code, body)
-            return body
+            with self._pool_slot():
+                with client.stream(
+                    "POST",
+                    url,
+                    **body,
+                    timeout=self._httpx_timeout(),
+                    extensions={"trace": timer},
+                ) as resp:
+                    if on_timing is not None:
+                        on_timing(timer.timing())
+                    if resp.status_code >= 400:
+                        resp.read()
+                        self._parse_response(resp)
+
+                    yield from reader.read(resp)
+                    self._record_wire(record, resp, streamed=True)
         except httpx.TimeoutException:
-            raise CompresrConnectionError("Request timed out")
+            raise self._timeout_error()
         except httpx.ConnectError as e:
             raise CompresrConnectionError(f"Connection failed: {str(e)}")
 
-    async def get_async(self, endpoint: str) -> Dict[str, Any]:
-        """Async GET request."""
+    def _sse_reader(self) -> "BodyReader[str]":
+        return BodyReader(HEADERS.SSE, self._read_sse, self._read_sse_async)
+
+    def _read_sse(self, resp: "httpx.Response") -> Iterator[str]:
+        # Use iter_lines() for proper SSE line-by-line parsing. Keep reading
+        # to EOF after [DONE] so the connection can return to the pool.
+        done = False
+        for line in resp.iter_lines():
+            content = None if done else self._parse_sse_line(line)
+            if content is _SSE_DONE:
+                done = True
+            elif content is not None:
+                yield content
+
+    async def _read_sse_async(self, resp: "httpx.Response") -> AsyncIterator[str]:
+        # Keep reading to EOF after [DONE] so the connection can be reused
+        done = False
+        async for line in resp.aiter_lines():
+            content = None if done else self._parse_sse_line(line)
+            if content is _SSE_DONE:
+                done = True
+            elif content is not None:
+                yield content
+
+    def _parse_sse_line(self, line: str) -> Any:
+        """Extract content from one SSE line (None to skip, _SSE_DONE at the end)."""
+        if not line.startswith("data: "):
+            return None
+        chunk = line[6:]
+        if chunk == "[DONE]":
+            return _SSE_DONE
+        try:
+            parsed = self._codec.loads(chunk)
+            if "content" in parsed:
+                return parsed["content"]
+            return None
+        except ValueError:
+            # Yield raw content if not JSON
+            return chunk or None
+
+    # ==================== Async ====================
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Return the pooled async client, creating it on first use."""
         if not HTTPX_AVAILABLE:
             raise ImportError("Async requires httpx: pip install httpx")
 
         if self._async_client is None:
-            self._async_client = httpx.AsyncClient(timeout=self._timeout, headers=self._headers)
+            self._async_client = httpx.AsyncClient(
+                timeout=self._httpx_timeout(),
+                headers=self._headers,
+                verify=default_ssl_context(),
+                limits=self._limits(),
+                **self._transport_options(sync=False),
+            )
+        return self._async_client
 
-        url = self._url(endpoint)
+    async def _request_async(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        decode: Callable[["httpx.Response"], T],
+    ) -> T:
+        """Send an async request over the pooled client, decoding the response with decode.
+
+        Layers, outermost first: circuit breaker, retry policy, one attempt.
+        """
+        call = partial(self._attempt_async, method, endpoint, data, decode)
+        if self._retrier is not None:
+            call = partial(self._retrier.call_async, call)
+        if self._circuit_breaker is not None:
+            return await self._circuit_breaker.call_async(call)
+        return await call()
+
+    async def _attempt_async(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        decode: Callable[["httpx.Response"], T],
+    ) -> T:
+        """One attempt: wait for the rate limiter, then for an adaptive concurrency slot."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async(self._rate_limiter.request_bytes(data))
+        if self._concurrency_limiter is None:
+            return await self._request_once_async(method, endpoint, data, decode)
+        return await self._concurrency_limiter.run(
+            lambda: self._request_once_async(method, endpoint, data, decode)
+        )
+
+    async def _request_once_async(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        decode: Callable[["httpx.Response"], T],
+    ) -> T:
+        with self._route(endpoint) as url:
+            return await self._send_async(method, url, data, decode)
+
+    async def _send_async(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        decode: Callable[["httpx.Response"], T],
+    ) -> T:
+        client = self._get_async_client()
+
+        body, record = self._body(data)
+        self._async_pool_tracer.request_started()
         try:
-            resp = await self._async_client.get(url)
-            body: Dict[str, Any] = resp.json()
-            if resp.status_code >= 400:
-                self._handle_error(resp.status_code, body)
-            return body
+            resp = await client.request(
+                method,
+                url,
+                **body,
+                timeout=self._httpx_timeout(),
+                extensions={"trace": self._async_pool_tracer.trace_async},
+            )
         except httpx.TimeoutException:
-            raise CompresrConnectionError("Request timed out")
+            raise self._timeout_error()
         except httpx.ConnectError as e:
             raise CompresrConnectionError(f"Connection failed: {str(e)}")
+        except httpx.HTTPError as e:
+            raise CompresrError(f"Request failed: {str(e)}")
+        finally:
+            self._async_pool_tracer.request_finished()
+
+        self._record_wire(record, resp)
+        return decode(resp)
+
+    async def post_async(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Async POST request."""
+        return await self._request_async("POST", endpoint, data, self._parse_response)
+
+    async def post_model_async(self, endpoint: str, data: Dict[str, Any], model: Type[M]) -> M:
+        """Async POST request whose response is validated from bytes into model."""
+        return await self._request_async(
+            "POST", endpoint, data, partial(self._parse_model, model=model)
+        )
+
+    async def get_async(self, endpoint: str) -> Dict[str, Any]:
+        """Async GET request."""
+        return await self._request_async("GET", endpoint, None, self._parse_response)
 
     async def delete_async(self, endpoint: str) -> Dict[str, Any]:
         """Async DELETE request."""
-        if not HTTPX_AVAILABLE:
-            raise ImportError("Async requires httpx: pip install httpx")
+        return await self._request_async("DELETE", endpoint, None, self._parse_response)
 
-        if self._async_client is None:
-            self._async_client = httpx.AsyncClient(timeout=self._timeout, headers=self._headers)
+    async def stream_async(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Async streaming POST request over the pooled async client.
 
-        url = self._url(endpoint)
+        Closing the generator early (break + aclose, or task cancellation)
+        closes the response immediately and frees its pool connection.
+        Failures before the first chunk are retried per the retry policy, and
+        the whole stream is bounded by the stream timeout.
+        """
+        stream = self._stream_async(endpoint, data, self._sse_reader(), on_timing)
         try:
-            resp = await self._async_client.delete(url)
-            body: Dict[str, Any] = resp.json()
-            if resp.status_code >= 400:
-                self._handle_error(resp.status_code, body)
-            return body
+            async for content in stream:
+                yield content
+        finally:
+            await stream.aclose()
+
+    async def stream_array_async(
+        self, endpoint: str, data: Dict[str, Any], path: Sequence[str]
+    ) -> AsyncGenerator[bytes, None]:
+        """Async streaming POST yielding each element of the JSON array at path as raw bytes."""
+        stream = self._stream_async(endpoint, data, _array_reader(path))
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
+
+    async def _stream_async(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        reader: "BodyReader[T]",
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> AsyncGenerator[T, None]:
+        breaker = self._circuit_breaker
+        stream = bounded_async(
+            self._stream_retrying_async(endpoint, data, reader, on_timing),
+            self._timeouts.stream,
+            is_timeout=True,
+        )
+        try:
+            if breaker is None:
+                async for content in stream:
+                    yield content
+                return
+
+            breaker.before_call()
+            recorded = False
+            try:
+                async for content in stream:
+                    if not recorded:
+                        breaker.record(None)
+                        recorded = True
+                    yield content
+            except BaseException as e:
+                if not recorded:
+                    breaker.record(e)
+                raise
+            if not recorded:
+                breaker.record(None)
+        finally:
+            await stream.aclose()
+
+    async def _stream_retrying_async(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        reader: "BodyReader[T]",
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> AsyncGenerator[T, None]:
+        attempt = 1
+        if self._retrier is not None:
+            self._retrier.started()
+        while True:
+            started = False
+            stream = self._stream_once_async(endpoint, data, reader, on_timing)
+            try:
+                async for content in stream:
+                    started = True
+                    yield content
+                return
+            except CompresrError as e:
+                if started or self._retrier is None:
+                    raise
+                delay = self._retrier.next_delay(attempt, e)
+                if delay is None:
+                    raise
+            finally:
+                await stream.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _stream_once_async(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        reader: "BodyReader[T]",
+        on_timing: Optional[Callable[[StreamTiming], None]] = None,
+    ) -> AsyncGenerator[T, None]:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async(self._rate_limiter.request_bytes(data))
+        with self._route(endpoint) as url:
+            stream = self._send_stream_async(url, data, reader, on_timing)
+            try:
+                async for content in stream:
+                    yield content
+            finally:
+                await stream.aclose()
+
+    async def _send_stream_async(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        reader: "BodyReader[T]",
+        on_timing: Optional[Callable[[StreamTiming], None]],
+    ) -> AsyncGenerator[T, None]:
+        client = self._get_async_client()
+        body, record = self._body(data, {HEADERS.ACCEPT: reader.accept})
+        timer = StreamTimer(self._async_pool_tracer)
+
+        self._async_pool_tracer.request_started()
+        try:
+            async with client.stream(
+                "POST",
+                url,
+                **body,
+                timeout=self._httpx_timeout(),
+                extensions={"trace": timer.trace_async},
+            ) as resp:
+                if on_timing is not None:
+                    on_timing(timer.timing())
+                if resp.status_code >= 400:
+                    await resp.aread()
+                    self._parse_response(resp)
+
+                async for item in reader.read_async(resp):
+                    yield item
+                self._record_wire(record, resp, streamed=True)
         except httpx.TimeoutException:
-            raise CompresrConnectionError("Request timed out")
+            raise self._timeout_error()
         except httpx.ConnectError as e:
             raise CompresrConnectionError(f"Connection failed: {str(e)}")
+        finally:
+            self._async_pool_tracer.request_finished()
+
+    # ==================== Lifecycle ====================
+
+    def close_sync(self) -> None:
+        """Close the pooled sync client."""
+        with self._sync_client_lock:
+            if self._sync_client is not None:
+                self._sync_client.close()
+                self._sync_client = None
 
     async def close(self) -> None:
-        """Close async client."""
+        """Close async client (and the pooled sync client)."""
         if self._async_client:
             await self._async_client.aclose()
             self._async_client = None
+        self.close_sync()
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close_sync()
+
+    async def __aenter__(self) -> "HTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
@@ -0,0 +1,167 @@
+"""
+Rate Limit - Client-side token buckets for requests and context bytes.
+
+Internal module. A RateLimiter is shared by every call on one client and
+smooths bursts before they reach the server. Each acquire reserves its
+tokens immediately (buckets may go into debt) and then sleeps until the
+debt is repaid, so waiters are served in arrival order across threads
+and tasks.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .deadline import deadline_error, has_time_for
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Client-side limits (None = unlimited).
+
+    burst_requests / burst_bytes are the bucket sizes, i.e. how much can be
+    sent at once after an idle period; they default to one second's worth.
+    """
+
+    requests_per_second: Optional[float] = None
+    bytes_per_second: Optional[float] = None
+    burst_requests: Optional[float] = None
+    burst_bytes: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Snapshot of limiter activity.
+
+    Acquires refused by their deadline or cancelled while waiting gave their
+    reservation back and are not counted.
+    """
+
+    acquired: int
+    throttled: int
+    total_wait_seconds: float
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take amount tokens (possibly into debt); return seconds until they are covered."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= amount
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def refund(self, amount: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """Request-rate and byte-rate limiter shared across threads and tasks."""
+
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._requests: Optional[_TokenBucket] = None
+        self._bytes: Optional[_TokenBucket] = None
+        if limit.requests_per_second:
+            self._requests = _TokenBucket(
+                limit.requests_per_second, limit.burst_requests or limit.requests_per_second
+            )
+        if limit.bytes_per_second:
+            self._bytes = _TokenBucket(
+                limit.bytes_per_second, limit.burst_bytes or limit.bytes_per_second
+            )
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            return RateLimiterStats(
+                acquired=self._acquired,
+                throttled=self._throttled,
+                total_wait_seconds=self._total_wait,
+            )
+
+    def _reserve(self, nbytes: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            wait = 0.0
+            if self._requests is not None:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._bytes is not None and nbytes:
+                wait = max(wait, self._bytes.reserve(nbytes, now))
+            self._acquired += 1
+            if wait > 0:
+                self._throttled += 1
+                self._total_wait += wait
+            return wait
+
+    def _refund(self, wait: float, nbytes: int) -> None:
+        """Give a reservation back, along with the stats _reserve counted for it."""
+        with self._lock:
+            if self._requests is not None:
+                self._requests.refund(1)
+            if self._bytes is not None and nbytes:
+                self._bytes.refund(nbytes)
+            self._acquired -= 1
+            self._throttled -= 1
+            self._total_wait -= wait
+
+    def _check_deadline(self, wait: float, nbytes: int) -> None:
+        if not has_time_for(wait):
+            # Give the reservation back so later callers aren't delayed by it
+            self._refund(wait, nbytes)
+            raise deadline_error()
+
+    @staticmethod
+    def request_bytes(data: Optional[Dict[str, Any]]) -> int:
+        """Bytes a request payload counts against bytes_per_second (see context_bytes)."""
+        return context_bytes(data)
+
+    def acquire(self, nbytes: int = 0) -> None:
+        """Block until one request carrying nbytes of context may be sent.
+
+        Raises DeadlineExceededError at once if the wait would overrun the call's deadline.
+        """
+        wait = self._reserve(nbytes)
+        if wait > 0:
+            self._check_deadline(wait, nbytes)
+            time.sleep(wait)
+
+    async def acquire_async(self, nbytes: int = 0) -> None:
+        """Wait (without blocking the loop) until one request may be sent."""
+        wait = self._reserve(nbytes)
+        if wait <= 0:
+            return
+        self._check_deadline(wait, nbytes)
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Give the reservation back so later callers aren't delayed by it
+            self._refund(wait, nbytes)
+            raise
+
+
+def context_bytes(data: Optional[Dict[str, Any]]) -> int:
+    """UTF-8 size of the contexts in a request payload (single or batch)."""
+    if not data:
+        return 0
+    size = 0
+    context = data.get("context")
+    if isinstance(context, str):
+        size += len(context.encode("utf-8"))
+    for item in data.get("inputs") or ():
+        if isinstance(item, dict) and isinstance(item.get("context"), str):
+            size += len(item["context"].encode("utf-8"))
+    return size
@@ -0,0 +1,168 @@
+"""
+Retry - Jittered exponential backoff for transient API failures.
+
+Internal module. A RetryPolicy describes which errors are retried and how
+long to wait; a Retrier applies it to sync and async calls and keeps
+counters of the retry load.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from ..exceptions import (
+    CompresrError,
+)
+from ..exceptions import ConnectionError as CompresrConnectionError
+from ..exceptions import (
+    DeadlineExceededError,
+    RateLimitError,
+    ServerError,
+    ServiceUnavailableError,
+    TimeoutError,
+)
+from .deadline import deadline_error, has_time_for
+
+T = TypeVar("T")
+
+# Failures of the service rather than of the request, worth trying again
+TRANSIENT_ERRORS: Tuple[Type[CompresrError], ...] = (
+    RateLimitError,
+    ServiceUnavailableError,
+    ServerError,
+    CompresrConnectionError,
+    TimeoutError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which errors to retry and how long to back off.
+
+    The wait before retry n (n = 1, 2, ...) is drawn uniformly from
+    [0, min(max_delay, base_delay * 2 ** (n - 1))] ("full jitter"). When the
+    server sends retry_after, the wait is retry_after plus that jitter, so
+    clients released by the same 429 don't come back in lockstep; a
+    retry_after above max_delay is not waited for and the error is raised.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_on: Tuple[Type[CompresrError], ...] = TRANSIENT_ERRORS
+
+    def _retryable(self, error: CompresrError) -> bool:
+        """Whether error is one to retry; the caller's own deadline never is."""
+        return isinstance(error, self.retry_on) and not isinstance(error, DeadlineExceededError)
+
+    def backoff(self, retry: int, error: CompresrError) -> Optional[float]:
+        """Seconds to wait before the given retry, or None to give up."""
+        if retry >= self.max_attempts or not self._retryable(error):
+            return None
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        delay = random.uniform(0, ceiling) if self.jitter else ceiling
+
+        retry_after = getattr(error, "retry_after", None)
+        if self.respect_retry_after and isinstance(retry_after, (int, float)) and retry_after > 0:
+            if retry_after > self.max_delay:
+                return None
+            delay += retry_after
+        return delay
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """Snapshot of retry activity.
+
+    retries_by_error counts retries per exception class name.
+    """
+
+    calls: int
+    attempts: int
+    retries: int
+    exhausted: int
+    retries_by_error: Dict[str, int]
+
+
+class Retrier:
+    """Applies a RetryPolicy to calls and counts attempts."""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._attempts = 0
+        self._retries = 0
+        self._exhausted = 0
+        self._retries_by_error: Dict[str, int] = {}
+
+    @property
+    def stats(self) -> RetryStats:
+        with self._lock:
+            return RetryStats(
+                calls=self._calls,
+                attempts=self._attempts,
+                retries=self._retries,
+                exhausted=self._exhausted,
+                retries_by_error=dict(self._retries_by_error),
+            )
+
+    def started(self) -> None:
+        """Record the first attempt of a call."""
+        with self._lock:
+            self._calls += 1
+            self._attempts += 1
+
+    def next_delay(self, attempt: int, error: CompresrError) -> Optional[float]:
+        """Decide on a retry after a failed attempt, recording it; None means raise.
+
+        Raises DeadlineExceededError if the back-off would overrun the call's deadline.
+        """
+        delay = self.policy.backoff(attempt, error)
+        if delay is not None and not has_time_for(delay):
+            with self._lock:
+                self._exhausted += 1
+            raise deadline_error() from error
+        with self._lock:
+            if delay is None:
+                if self.policy._retryable(error):
+                    self._exhausted += 1
+                return None
+            self._attempts += 1
+            self._retries += 1
+            name = type(error).__name__
+            self._retries_by_error[name] = self._retries_by_error.get(name, 0) + 1
+        return delay
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run fn, retrying retryable errors with backoff (sync)."""
+        self.started()
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except CompresrError as e:
+                delay = self.next_delay(attempt, e)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn, retrying retryable errors with backoff (async)."""
+        self.started()
+        attempt = 1
+        while True:
+            try:
+                return await fn()
+            except CompresrError as e:
+                delay = self.next_delay(attempt, e)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,134 @@
+"""
+Single Flight - De-duplication of identical in-flight compression requests.
+
+Internal module. While a request is in flight, identical requests (same
+request hash) wait for it instead of issuing their own HTTP call, and all
+of them receive its result or exception.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Tuple
+
+from ..schemas import CompressResponse
+from .deadline import deadline_error, no_deadline, remaining, result_within
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Snapshot of single-flight activity."""
+
+    calls: int
+    shared: int
+
+    @property
+    def requests_saved(self) -> int:
+        return self.shared
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[str, "Future[CompressResponse]"] = {}
+        self._async_flights: Dict[Tuple[int, str], "asyncio.Future[CompressResponse]"] = {}
+        self._calls = 0
+        self._shared = 0
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(calls=self._calls, shared=self._shared)
+
+    # ==================== Sync ====================
+
+    def do(self, key: str, fn: Callable[[], CompressResponse]) -> CompressResponse:
+        """Run fn, or wait for the identical call already running in another thread."""
+        with self._lock:
+            self._calls += 1
+            future = self._flights.get(key)
+            leader = future is None
+            if future is None:
+                future = self._flights[key] = Future()
+            else:
+                self._shared += 1
+
+        if not leader:
+            # Waiters get their own copy so nobody sees another caller's mutations
+            return result_within(future).model_copy(deep=True)
+
+        if remaining() is None:
+            self._run(key, fn, future)
+        else:
+            # The call serves every caller that joins it: run it unbounded on its
+            # own thread (new threads start without a deadline) and only bound the wait
+            threading.Thread(
+                target=self._run,
+                args=(key, fn, future),
+                name="compresr-single-flight",
+                daemon=True,
+            ).start()
+        return result_within(future)
+
+    def _run(
+        self,
+        key: str,
+        fn: Callable[[], CompressResponse],
+        future: "Future[CompressResponse]",
+    ) -> None:
+        try:
+            response = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            return
+        finally:
+            with self._lock:
+                del self._flights[key]
+        future.set_result(response)
+
+    # ==================== Async ====================
+
+    async def do_async(
+        self, key: str, fn: Callable[[], Awaitable[CompressResponse]]
+    ) -> CompressResponse:
+        """Await fn, or join the identical call already running on this loop.
+
+        The call runs as its own task without a deadline, so cancelling any one
+        waiter (including the one that started it) or running out of its
+        deadline never fails the others.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            self._calls += 1
+        task = self._async_flights.get(flight_key)
+        leader = task is None
+        if task is None:
+            with no_deadline():
+                # The task copies this context, so the shared call runs unbounded
+                task = self._async_flights[flight_key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish_async(flight_key, done))
+        else:
+            with self._lock:
+                self._shared += 1
+
+        left = remaining()
+        if left is None:
+            response = await asyncio.shield(task)
+        else:
+            try:
+                response = await asyncio.wait_for(asyncio.shield(task), timeout=max(left, 0.0))
+            except asyncio.TimeoutError:
+                raise deadline_error() from None
+        return response if leader else response.model_copy(deep=True)
+
+    def _finish_async(
+        self, flight_key: Tuple[int, str], task: "asyncio.Future[CompressResponse]"
+    ) -> None:
+        if self._async_flights.get(flight_key) is task:
+            del self._async_flights[flight_key]
+        if not task.cancelled():
+            task.exception()  # every waiter may have gone; mark the outcome retrieved
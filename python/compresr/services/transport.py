@@ -0,0 +1,189 @@
+"""
+Transport - Connection pool helpers for the HTTP client.
+
+Internal module. Provides the shared SSL context, connection reuse
+counters and unix:// socket addressing for the pooled httpx clients owned
+by HTTPClient.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    import ssl
+
+# httpcore trace events emitted when a brand new connection is established
+_CONNECT_EVENTS = frozenset(
+    {
+        "connection.connect_tcp.complete",
+        "connection.connect_unix_socket.complete",
+    }
+)
+_CONNECT_STARTED_EVENTS = frozenset(
+    {
+        "connection.connect_tcp.started",
+        "connection.connect_unix_socket.started",
+    }
+)
+_TLS_EVENT = "connection.start_tls.complete"
+_HEADERS_EVENTS = frozenset(
+    {
+        "http11.receive_response_headers.complete",
+        "http2.receive_response_headers.complete",
+    }
+)
+_SEND_EVENTS = frozenset(
+    {
+        "http11.send_request_headers.started",
+        "http2.send_request_headers.started",
+    }
+)
+
+
+UNIX_SCHEME = "unix://"
+
+
+def unix_socket_bases(urls: Sequence[str]) -> Dict[str, str]:
+    """Map each unix:// base URL to the socket path it names.
+
+    ``unix:///run/compresr.sock`` names the socket ``/run/compresr.sock``.
+    Requests to it are sent over that socket as plain HTTP/1.1, with no TCP
+    or TLS.
+    """
+    return {url: url[len(UNIX_SCHEME) :] for url in urls if url.startswith(UNIX_SCHEME)}
+
+
+@lru_cache(maxsize=1)
+def default_ssl_context() -> "ssl.SSLContext":
+    """Process-wide SSL context (loading the CA store is expensive, do it once)."""
+    import ssl
+
+    return ssl.create_default_context()
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of connection pool usage."""
+
+    pool_size: int
+    requests: int
+    in_flight: int
+    connections_opened: int
+    tls_handshakes: int
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests served over an already-open keep-alive connection."""
+        return max(self.requests - self.connections_opened, 0)
+
+
+class PoolTracer:
+    """Thread-safe pool counters fed by httpcore's ``trace`` request extension."""
+
+    def __init__(self, pool_size: int):
+        self._pool_size = pool_size
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._in_flight = 0
+        self._connections_opened = 0
+        self._tls_handshakes = 0
+
+    def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        """Sync trace callback."""
+        if event in _CONNECT_EVENTS:
+            with self._lock:
+                self._connections_opened += 1
+        elif event == _TLS_EVENT:
+            with self._lock:
+                self._tls_handshakes += 1
+
+    async def trace_async(self, event: str, info: Dict[str, Any]) -> None:
+        """Async trace callback (httpcore awaits the callback on async pools)."""
+        self(event, info)
+
+    def request_started(self) -> None:
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+
+    def request_finished(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def snapshot(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                pool_size=self._pool_size,
+                requests=self._requests,
+                in_flight=self._in_flight,
+                connections_opened=self._connections_opened,
+                tls_handshakes=self._tls_handshakes,
+            )
+
+
+@dataclass(frozen=True)
+class StreamTiming:
+    """Connection setup and first-byte timing for one streaming request.
+
+    connect_ms and tls_ms are None when the stream reused a pooled
+    keep-alive connection (no TCP connect / TLS handshake happened).
+    first_byte_ms runs from sending the request to its response headers;
+    queue_ms is the time spent waiting for a pool slot or connection first.
+    """
+
+    connect_ms: Optional[float]
+    tls_ms: Optional[float]
+    first_byte_ms: float
+    queue_ms: float = 0.0
+
+    @property
+    def reused_connection(self) -> bool:
+        return self.connect_ms is None
+
+
+class StreamTimer:
+    """Per-request trace callback measuring connect, TLS and first-byte time.
+
+    Forwards every event to the pool tracer so pool statistics stay accurate.
+    """
+
+    def __init__(self, pool_tracer: PoolTracer):
+        self._pool_tracer = pool_tracer
+        self._start = time.perf_counter()
+        self._marks: Dict[str, float] = {}
+
+    def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        self._marks.setdefault(event, time.perf_counter())
+        self._pool_tracer(event, info)
+
+    async def trace_async(self, event: str, info: Dict[str, Any]) -> None:
+        self(event, info)
+
+    def _span_ms(self, name: str) -> Optional[float]:
+        started = self._marks.get(f"{name}.started")
+        completed = self._marks.get(f"{name}.complete")
+        if started is None or completed is None:
+            return None
+        return (completed - started) * 1000
+
+    def _first_mark(self, events: Iterable[str], default: float) -> float:
+        return min((self._marks[e] for e in events if e in self._marks), default=default)
+
+    def timing(self) -> StreamTiming:
+        """Timing so far; call once the response headers have arrived."""
+        headers_at = self._first_mark(_HEADERS_EVENTS, time.perf_counter())
+        sent_at = self._first_mark(_SEND_EVENTS, self._start)
+        # Queueing ends when a connection is being opened or the request goes out
+        ready_at = self._first_mark(_CONNECT_STARTED_EVENTS, sent_at)
+        connect_ms = self._span_ms("connection.connect_tcp")
+        if connect_ms is None:
+            connect_ms = self._span_ms("connection.connect_unix_socket")
+        return StreamTiming(
+            connect_ms=connect_ms,
+            tls_ms=self._span_ms("connection.start_tls"),
+            first_byte_ms=(headers_at - sent_at) * 1000,
+            queue_ms=(min(ready_at, sent_at) - self._start) * 1000,
+        )
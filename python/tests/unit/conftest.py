@@ -0,0 +1,224 @@
+"""
+Fixtures for unit tests.
+
+Provides a local, keep-alive HTTP/1.1 stand-in for the compression API so
+client behaviour can be tested without a backend.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+
+TEST_API_KEY = "cmp_test_key_12345"
+
+
+def fake_compress(context: str) -> Dict[str, Any]:
+    """Deterministic fake compression: keep the first half of the words."""
+    words = context.split()
+    kept = words[: max(1, len(words) // 2)]
+    original_tokens = len(words)
+    compressed_tokens = len(kept)
+    return {
+        "original_context": context,
+        "compressed_context": " ".join(kept),
+        "original_tokens": original_tokens,
+        "compressed_tokens": compressed_tokens,
+        "actual_compression_ratio": compressed_tokens / original_tokens,
+        "tokens_saved": original_tokens - compressed_tokens,
+        "duration_ms": 1,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_chunked(self, events: List[str]) -> None:
+        """Send SSE events with chunked encoding, pausing stream_delay between them."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for event in events:
+                payload = event.encode("utf-8")
+                self.wfile.write(f"{len(payload):x}\r\n".encode() + payload + b"\r\n")
+                self.wfile.flush()
+                time.sleep(self.server.stream_delay)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        self._send(status, json.dumps(body).encode("utf-8"))
+
+    def do_GET(self) -> None:
+        self.server.record(self, None)
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self) -> None:
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        data = json.loads(raw) if raw else {}
+        self.server.record(self, data)
+        with self.server.track_active():
+            with self.server._lock:
+                delay = self.server.queued_delays.pop(0) if self.server.queued_delays else None
+            if delay is None:
+                delay = self.server.delays.get(data.get("context"), self.server.response_delay)
+            time.sleep(delay)
+            self._respond(data)
+
+    def _respond(self, data: Dict[str, Any]) -> None:
+        with self.server._lock:
+            queued = self.server.queued.pop(0) if self.server.queued else None
+        if queued:
+            status, body = queued
+            self._send_json(status, body)
+            return
+
+        if self.path.endswith("/stream"):
+            result = fake_compress(data["context"])
+            events = [
+                f"data: {json.dumps({'content': word + ' '})}\n\n"
+                for word in result["compressed_context"].split()
+            ]
+            self._send_chunked(events + ["data: [DONE]\n\n"])
+        elif self.path.endswith("/batch"):
+            results = [fake_compress(item["context"]) for item in data["inputs"]]
+            self._send_json(
+                200,
+                {
+                    "success": True,
+                    "data": {
+                        "results": results,
+                        "total_original_tokens": sum(r["original_tokens"] for r in results),
+                        "total_compressed_tokens": sum(r["compressed_tokens"] for r in results),
+                        "total_tokens_saved": sum(r["tokens_saved"] for r in results),
+                        "average_compression_ratio": sum(
+                            r["actual_compression_ratio"] for r in results
+                        )
+                        / len(results),
+                        "count": len(results),
+                    },
+                },
+            )
+        else:
+            self._send_json(200, {"success": True, "data": fake_compress(data["context"])})
+
+
+class FakeServer(ThreadingHTTPServer):
+    """Threaded fake API server recording every request it receives."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Any = ("127.0.0.1", 0)) -> None:
+        super().__init__(address, _Handler)
+        self.requests: List[Tuple[str, str, Any]] = []
+        self.queued: List[Tuple[int, Dict[str, Any]]] = []
+        self.queued_delays: List[float] = []
+        self.stream_delay = 0.0
+        self.response_delay = 0.0
+        self.delays: Dict[str, float] = {}
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, handler: BaseHTTPRequestHandler, data: Any) -> None:
+        with self._lock:
+            self.requests.append((handler.command, handler.path, data))
+
+    @contextmanager
+    def track_active(self) -> Iterator[None]:
+        """Count concurrently handled POSTs (max_active is the high-water mark)."""
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def queue_response(self, status: int, body: Dict[str, Any]) -> None:
+        """Serve ``body`` with ``status`` for the next POST instead of the fake result."""
+        self.queued.append((status, body))
+
+    def queue_delay(self, seconds: float) -> None:
+        """Delay the next POST by ``seconds`` (overrides response_delay / delays)."""
+        self.queued_delays.append(seconds)
+
+
+class UnixFakeServer(FakeServer):
+    """FakeServer listening on a Unix domain socket instead of TCP."""
+
+    address_family = socket.AF_UNIX
+
+    def server_bind(self) -> None:
+        socketserver.TCPServer.server_bind(self)
+        self.server_name, self.server_port = "localhost", 0
+
+    @property
+    def url(self) -> str:
+        return f"unix://{self.server_address}"
+
+
+def _serve(server: FakeServer) -> Iterator[FakeServer]:
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_server():
+    """Run a FakeServer on a random local port for the duration of a test."""
+    yield from _serve(FakeServer())
+
+
+@pytest.fixture
+def unix_server():
+    """Run a FakeServer on a Unix domain socket for the duration of a test."""
+    # Short directory: socket paths are limited to ~100 bytes
+    directory = tempfile.mkdtemp(prefix="cmp")
+    path = os.path.join(directory, "api.sock")
+    yield from _serve(UnixFakeServer(path))
+    os.unlink(path)
+    os.rmdir(directory)
+
+
+@pytest.fixture
+def client(fake_server):
+    """CompressionClient pointed at the fake server."""
+    from compresr import CompressionClient
+
+    c = CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url)
+    yield c
+    c.close_sync()
@@ -0,0 +1,171 @@
+"""
+Unit Tests for multi-endpoint load balancing
+
+Tests endpoint selection, ejection on failures and re-admission via /health.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from compresr import BalancingStrategy, CompressionClient, LoadBalancing, RetryPolicy
+from compresr.exceptions import ServerError, ValidationError
+from compresr.services.balancer import LoadBalancer
+
+from .conftest import TEST_API_KEY, FakeServer, _serve
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def second_server():
+    """A second FakeServer replica."""
+    yield from _serve(FakeServer())
+
+
+@pytest.fixture
+def balanced(fake_server, second_server):
+    """CompressionClient balancing across both fake servers."""
+    c = CompressionClient(
+        api_key=TEST_API_KEY,
+        base_url=[fake_server.url, second_server.url],
+        load_balancing=LoadBalancing(ejection_seconds=0.05),
+    )
+    yield c
+    c.close_sync()
+
+
+class TestLoadBalancer:
+    """Test LoadBalancer routing and health tracking."""
+
+    def test_least_outstanding(self):
+        """Test requests go to the endpoint with the fewest requests in flight."""
+        balancer = LoadBalancer(["a", "b", "c"], LoadBalancing(), probe=lambda url: True)
+        picked = [balancer.acquire() for _ in range(3)]
+        assert sorted(ep.url for ep in picked) == ["a", "b", "c"]
+
+        balancer.release(picked[1], time.monotonic(), None)
+        assert balancer.acquire() is picked[1]
+
+    def test_power_of_two_prefers_less_loaded(self):
+        """Test P2C never picks the busiest of three endpoints over an idle one."""
+        config = LoadBalancing(strategy=BalancingStrategy.POWER_OF_TWO)
+        balancer = LoadBalancer(["a", "b", "c"], config, probe=lambda url: True)
+        busy = balancer.acquire()
+        busy.outstanding += 10
+        for _ in range(50):
+            ep = balancer.acquire()
+            assert ep is not busy
+            balancer.release(ep, time.monotonic(), None)
+
+    def test_server_error_ejects(self):
+        """Test 5xx ejects an endpoint while request errors do not."""
+        balancer = LoadBalancer(["a", "b"], LoadBalancing(), probe=lambda url: True)
+        ep = balancer.acquire()
+        balancer.release(ep, time.monotonic(), ValidationError("bad input"))
+        assert all(s.healthy for s in balancer.stats)
+
+        ep = balancer.acquire()
+        balancer.release(ep, time.monotonic(), ServerError("down"))
+        stats = {s.url: s for s in balancer.stats}
+        assert not stats[ep.url].healthy
+        assert stats[ep.url].failures == 1
+        for _ in range(5):
+            assert balancer.acquire() is not ep
+
+    def test_all_ejected_fails_open(self):
+        """Test requests still go out when every endpoint is ejected."""
+        balancer = LoadBalancer(["a"], LoadBalancing(), probe=lambda url: False)
+        ep = balancer.acquire()
+        balancer.release(ep, time.monotonic(), ServerError("down"))
+        assert balancer.acquire() is ep
+
+    def test_failed_probe_backs_off(self):
+        """Test a failed probe keeps the endpoint out and doubles its ejection."""
+        probed = threading.Event()
+
+        def probe(url):
+            probed.set()
+            return False
+
+        config = LoadBalancing(ejection_seconds=0.01, max_ejection_seconds=1.0)
+        balancer = LoadBalancer(["a", "b"], config, probe=probe)
+        ep = balancer.acquire()
+        balancer.release(ep, time.monotonic(), ServerError("down"))
+        time.sleep(0.02)
+        balancer.acquire()
+        assert probed.wait(1.0)
+        _wait_for(lambda: ep.ejection_seconds == 0.02)
+        assert not ep.probing
+        assert ep.ejections == 1
+
+    def test_latency_tracked(self):
+        """Test successful requests feed the per-endpoint latency average."""
+        balancer = LoadBalancer(["a"], LoadBalancing(), probe=lambda url: True)
+        ep = balancer.acquire()
+        balancer.release(ep, time.monotonic() - 0.1, None)
+        assert balancer.stats[0].latency_ms == pytest.approx(100, abs=20)
+        assert balancer.stats[0].outstanding == 0
+
+
+class TestBalancedClient:
+    """Test CompressionClient with several base URLs."""
+
+    def test_single_url_has_no_endpoint_stats(self, client):
+        """Test endpoint_stats is None without load balancing."""
+        assert client.endpoint_stats is None
+
+    def test_spreads_requests(self, balanced, fake_server, second_server):
+        """Test sequential requests are spread over both replicas."""
+        for i in range(10):
+            balanced.compress(context=f"request number {i} here")
+        assert fake_server.requests and second_server.requests
+        assert sum(s.requests for s in balanced.endpoint_stats) == 10
+        assert all(s.latency_ms is not None for s in balanced.endpoint_stats)
+
+    def test_ejects_and_readmits_via_health(self, balanced, fake_server, second_server):
+        """Test a 5xx ejects a replica and a passing /health probe brings it back."""
+        fake_server.queue_response(500, {"error": "down"})
+        second_server.queue_response(500, {"error": "down"})
+        with pytest.raises(ServerError):
+            balanced.compress(context="first request fails")
+        ejected = [s for s in balanced.endpoint_stats if not s.healthy]
+        assert len(ejected) == 1
+        fake_server.queued.clear()
+        second_server.queued.clear()
+
+        time.sleep(0.06)
+        balanced.compress(context="goes to the healthy replica")
+        _wait_for(lambda: all(s.healthy for s in balanced.endpoint_stats))
+        probed = fake_server if ejected[0].url == fake_server.url else second_server
+        assert ("GET", "/health", None) in probed.requests
+
+    def test_retry_moves_to_other_replica(self, fake_server, second_server):
+        """Test a retried request is routed away from the replica that failed."""
+        with CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=[fake_server.url, second_server.url],
+            retry=RetryPolicy(max_attempts=2, base_delay=0.001, max_delay=0.01),
+        ) as c:
+            fake_server.queue_response(500, {"error": "down"})
+            second_server.queue_response(500, {"error": "down"})
+            with pytest.raises(ServerError):
+                c.compress(context="both replicas fail once")
+            assert len(fake_server.requests) == len(second_server.requests) == 1
+            assert sum(s.failures for s in c.endpoint_stats) == 2
+
+    async def test_async_spreads_requests(self, balanced, fake_server, second_server):
+        """Test concurrent async requests use both replicas."""
+        fake_server.response_delay = second_server.response_delay = 0.05
+        await asyncio.gather(
+            *(balanced.compress_async(context=f"async request {i} here") for i in range(4))
+        )
+        assert len(fake_server.requests) == len(second_server.requests) == 2
+        await balanced.close()
@@ -0,0 +1,168 @@
+"""
+Unit Tests for batch sharding
+
+Tests splitting large batches into server-sized shards and merging results.
+"""
+
+import pytest
+
+from compresr.exceptions import ServerError, ValidationError
+from compresr.schemas import CompressBatchItemResult, CompressBatchResponse, CompressBatchResult
+from compresr.services.batching import (
+    build_batch_result,
+    deduplicate_inputs,
+    merge_batch_responses,
+    shard,
+)
+
+
+def _item(original: int, compressed: int) -> CompressBatchItemResult:
+    return CompressBatchItemResult(
+        original_context="x",
+        compressed_context="y",
+        original_tokens=original,
+        compressed_tokens=compressed,
+        actual_compression_ratio=compressed / original,
+        tokens_saved=original - compressed,
+        duration_ms=1,
+    )
+
+
+class TestShard:
+    """Test shard() helper."""
+
+    def test_exact_multiple(self):
+        """Test a list splits into equal shards."""
+        assert shard([1, 2, 3, 4], 2) == [[1, 2], [3, 4]]
+
+    def test_remainder(self):
+        """Test the last shard holds the remainder."""
+        assert shard(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+
+    def test_empty(self):
+        """Test an empty list has no shards."""
+        assert shard([], 100) == []
+
+
+class TestMerge:
+    """Test merging shard responses."""
+
+    def test_aggregates_recomputed(self):
+        """Test totals and average ratio are recomputed over all items."""
+        first = CompressBatchResponse(data=build_batch_result([_item(10, 5), _item(10, 5)]))
+        second = CompressBatchResponse(data=build_batch_result([_item(100, 10)]))
+
+        merged = merge_batch_responses([first, second])
+        assert merged.success is True
+        assert merged.data.count == 3
+        assert merged.data.total_original_tokens == 120
+        assert merged.data.total_compressed_tokens == 20
+        assert merged.data.total_tokens_saved == 100
+        assert merged.data.average_compression_ratio == pytest.approx((0.5 + 0.5 + 0.1) / 3)
+
+    def test_single_response_passthrough(self):
+        """Test a single shard is returned unchanged."""
+        response = CompressBatchResponse(data=CompressBatchResult())
+        assert merge_batch_responses([response]) is response
+
+
+class TestShardedBatch:
+    """Test compress_batch() beyond the 100-item server limit."""
+
+    def test_large_batch_is_sharded_in_order(self, client, fake_server):
+        """Test 250 contexts go out as 3 shards and come back in input order."""
+        contexts = [f"doc {i} " + "word " * (i % 7 + 1) for i in range(250)]
+        response = client.compress_batch(contexts=contexts)
+
+        batch_calls = [r for r in fake_server.requests if r[1].endswith("/batch")]
+        assert sorted(len(r[2]["inputs"]) for r in batch_calls) == [50, 100, 100]
+        assert response.data.count == 250
+        assert [r.original_context for r in response.data.results] == contexts
+        assert response.data.total_tokens_saved == sum(
+            r.tokens_saved for r in response.data.results
+        )
+
+    def test_large_qs_batch_keeps_query_pairs(self, client, fake_server):
+        """Test per-context queries stay aligned across shards."""
+        contexts = [f"context number {i}" for i in range(150)]
+        queries = [f"query {i}?" for i in range(150)]
+        client.compress_batch(contexts=contexts, queries=queries, compression_model_name="latte_v1")
+
+        sent = [inp for r in fake_server.requests for inp in r[2]["inputs"]]
+        assert sorted((inp["context"], inp["query"]) for inp in sent) == sorted(
+            zip(contexts, queries)
+        )
+
+    async def test_large_batch_async(self, client, fake_server):
+        """Test the async batch shards and merges the same way."""
+        contexts = [f"async doc {i}" for i in range(201)]
+        response = await client.compress_batch_async(contexts=contexts, max_concurrency=2)
+
+        assert len(fake_server.requests) == 3
+        assert [r.original_context for r in response.data.results] == contexts
+        await client.close()
+
+    def test_shard_failure_fails_batch(self, client, fake_server):
+        """Test an error on any shard raises for the whole batch."""
+        fake_server.queue_response(500, {"error": "boom"})
+        with pytest.raises(ServerError):
+            client.compress_batch(contexts=["a b"] * 150, max_concurrency=1)
+
+    def test_empty_batch_rejected(self, client):
+        """Test an empty context list raises ValidationError."""
+        with pytest.raises(ValidationError):
+            client.compress_batch(contexts=[])
+
+    def test_mismatched_queries_rejected(self, client):
+        """Test a query list of the wrong length raises ValidationError."""
+        with pytest.raises(ValidationError):
+            client.compress_batch(contexts=["a", "b"], queries=["q"])
+
+
+class TestDeduplication:
+    """Test intra-batch de-duplication of (context, query) pairs."""
+
+    def test_deduplicate_inputs(self):
+        """Test duplicates collapse in first-seen order with positions back."""
+        contexts, queries, positions = deduplicate_inputs(["a", "b", "a", "c", "b"], None)
+        assert contexts == ["a", "b", "c"]
+        assert queries is None
+        assert positions == [0, 1, 0, 2, 1]
+
+    def test_same_context_different_query_kept(self):
+        """Test pairs only collapse when both context and query match."""
+        contexts, queries, positions = deduplicate_inputs(["a", "a", "a"], ["q1", "q2", "q1"])
+        assert list(zip(contexts, queries)) == [("a", "q1"), ("a", "q2")]
+        assert positions == [0, 1, 0]
+
+    def test_no_duplicates_passthrough(self):
+        """Test unique inputs are returned as-is with no positions."""
+        contexts = ["a", "b"]
+        assert deduplicate_inputs(contexts, None) == (contexts, None, None)
+
+    def test_batch_sends_unique_pairs(self, client, fake_server):
+        """Test only unique contexts are sent and results expand to every position."""
+        contexts = ["chunk one here", "chunk two here", "chunk one here", "chunk one here"]
+        response = client.compress_batch(contexts=contexts)
+
+        sent = [inp["context"] for r in fake_server.requests for inp in r[2]["inputs"]]
+        assert sent == ["chunk one here", "chunk two here"]
+        assert [r.original_context for r in response.data.results] == contexts
+        assert response.data.count == 4
+        assert response.data.total_original_tokens == sum(
+            r.original_tokens for r in response.data.results
+        )
+        assert response.data.results[0] is not response.data.results[2]
+
+    async def test_batch_async_sends_unique_pairs(self, client, fake_server):
+        """Test the async batch de-duplicates the same way."""
+        response = await client.compress_batch_async(contexts=["x y", "x y", "z w"])
+
+        assert len(fake_server.requests[0][2]["inputs"]) == 2
+        assert response.data.count == 3
+        await client.close()
+
+    def test_deduplicate_disabled(self, client, fake_server):
+        """Test deduplicate=False sends every copy."""
+        client.compress_batch(contexts=["same", "same"], deduplicate=False)
+        assert len(fake_server.requests[0][2]["inputs"]) == 2
@@ -0,0 +1,158 @@
+"""
+Unit Tests for the result cache
+
+Tests content-addressed keys, LRU/TTL eviction and the client cache hook.
+"""
+
+import time
+
+from compresr import CompressionClient, ResultCache
+from compresr.schemas import CompressRequest, CompressResponse, CompressResult
+from compresr.services.cache import request_cache_key
+
+from .conftest import TEST_API_KEY
+
+
+def _response(context: str) -> CompressResponse:
+    return CompressResponse(
+        data=CompressResult(
+            original_context=context,
+            compressed_context=context[: len(context) // 2],
+            original_tokens=10,
+            compressed_tokens=5,
+            actual_compression_ratio=0.5,
+            tokens_saved=5,
+            duration_ms=1,
+        )
+    )
+
+
+class TestCacheKey:
+    """Test request_cache_key()."""
+
+    def test_identical_requests_share_key(self):
+        """Test equal requests hash to the same key."""
+        a = CompressRequest(context="hello world", compression_model_name="espresso_v1")
+        b = CompressRequest(context="hello world", compression_model_name="espresso_v1")
+        assert request_cache_key(a) == request_cache_key(b)
+
+    def test_every_option_is_part_of_key(self):
+        """Test changing any result-affecting field changes the key."""
+        base = dict(context="hello world", compression_model_name="latte_v1", query="q?")
+        keys = {
+            request_cache_key(CompressRequest(**base)),
+            request_cache_key(CompressRequest(**{**base, "context": "hello there"})),
+            request_cache_key(CompressRequest(**{**base, "query": "other?"})),
+            request_cache_key(CompressRequest(**{**base, "target_compression_ratio": 0.3})),
+            request_cache_key(CompressRequest(**base, coarse=True)),
+            request_cache_key(CompressRequest(**base, heuristic_chunking=True)),
+            request_cache_key(CompressRequest(**base, disable_placeholders=True)),
+        }
+        assert len(keys) == 7
+
+
+class TestResultCache:
+    """Test ResultCache eviction and counters."""
+
+    def test_hit_and_miss_counters(self):
+        """Test lookups are counted as hits or misses."""
+        cache = ResultCache()
+        assert cache.get("k") is None
+        cache.set("k", _response("some text"))
+        assert cache.get("k").data.original_context == "some text"
+
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_lru_eviction_by_entries(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ResultCache(max_entries=2)
+        cache.set("a", _response("a"))
+        cache.set("b", _response("b"))
+        cache.get("a")
+        cache.set("c", _response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats.evictions == 1
+
+    def test_eviction_by_bytes(self):
+        """Test entries are evicted to stay under max_bytes."""
+        cache = ResultCache(max_bytes=3000)
+        for i in range(5):
+            cache.set(str(i), _response(str(i) * 500))
+
+        stats = cache.stats
+        assert stats.bytes <= 3000
+        assert stats.entries < 5
+        assert stats.evictions == 5 - stats.entries
+
+    def test_ttl_expiry(self):
+        """Test expired entries are dropped on lookup."""
+        cache = ResultCache(ttl=0.01)
+        cache.set("k", _response("text"))
+        time.sleep(0.02)
+
+        assert cache.get("k") is None
+        assert cache.stats.expirations == 1
+        assert cache.stats.entries == 0
+
+    def test_failed_response_not_cached(self):
+        """Test unsuccessful responses are never stored."""
+        cache = ResultCache()
+        cache.set("k", CompressResponse(success=False, data=None))
+        assert cache.stats.entries == 0
+
+    def test_returned_copy_is_isolated(self):
+        """Test mutating a returned response does not alter the cache."""
+        cache = ResultCache()
+        cache.set("k", _response("text"))
+        cache.get("k").data.compressed_context = "mutated"
+        assert cache.get("k").data.compressed_context == "te"
+
+
+class TestClientCache:
+    """Test the cache hook in compress() / compress_async()."""
+
+    def test_repeat_served_from_cache(self, fake_server):
+        """Test an identical second call does not reach the server."""
+        client = CompressionClient(
+            api_key=TEST_API_KEY, base_url=fake_server.url, cache=ResultCache()
+        )
+        first = client.compress(context="the quick brown fox")
+        second = client.compress(context="the quick brown fox")
+        client.close_sync()
+
+        assert len(fake_server.requests) == 1
+        assert second.data.compressed_context == first.data.compressed_context
+        assert client.cache_stats.hits == 1
+
+    def test_different_options_miss(self, fake_server):
+        """Test a changed option is a separate cache entry."""
+        client = CompressionClient(
+            api_key=TEST_API_KEY, base_url=fake_server.url, cache=ResultCache()
+        )
+        client.compress(context="the quick brown fox")
+        client.compress(context="the quick brown fox", target_compression_ratio=0.3)
+        client.close_sync()
+
+        assert len(fake_server.requests) == 2
+
+    async def test_async_repeat_served_from_cache(self, fake_server):
+        """Test the async path shares the same cache."""
+        client = CompressionClient(
+            api_key=TEST_API_KEY, base_url=fake_server.url, cache=ResultCache()
+        )
+        client.compress(context="jumps over the lazy dog")
+        await client.compress_async(context="jumps over the lazy dog")
+        await client.close()
+
+        assert len(fake_server.requests) == 1
+
+    def test_disabled_by_default(self, client, fake_server):
+        """Test no caching happens without a cache."""
+        client.compress(context="a b c d")
+        client.compress(context="a b c d")
+        assert len(fake_server.requests) == 2
+        assert client.cache_stats is None
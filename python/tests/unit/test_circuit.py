@@ -0,0 +1,161 @@
+"""
+Unit Tests for the circuit breaker
+
+Tests state transitions, fast-fail and the uncompressed passthrough fallback.
+"""
+
+import time
+
+import pytest
+
+from compresr import CircuitBreakerConfig, CompressionClient
+from compresr.exceptions import (
+    CircuitOpenError,
+    ServerError,
+    ServiceUnavailableError,
+    ValidationError,
+)
+from compresr.services.circuit import CircuitBreaker, CircuitState
+
+from .conftest import TEST_API_KEY
+
+
+def _fail():
+    raise ServerError("boom")
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state machine."""
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the circuit and further calls fail fast."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=3))
+        for _ in range(3):
+            with pytest.raises(ServerError):
+                breaker.call(_fail)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc:
+            breaker.call(lambda: "never called")
+        assert isinstance(exc.value, ServiceUnavailableError)
+        assert exc.value.retry_after >= 1
+        assert breaker.stats.rejected == 1
+
+    def test_success_resets_count(self):
+        """Test a success between failures keeps the circuit closed."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=2))
+        with pytest.raises(ServerError):
+            breaker.call(_fail)
+        breaker.call(lambda: None)
+        with pytest.raises(ServerError):
+            breaker.call(_fail)
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_client_errors_are_not_failures(self):
+        """Test 4xx-type errors do not count toward opening."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1))
+
+        def invalid():
+            raise ValidationError("bad")
+
+        with pytest.raises(ValidationError):
+            breaker.call(invalid)
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_probe_closes(self):
+        """Test a successful probe after reset_timeout closes the circuit."""
+        changes = []
+        breaker = CircuitBreaker(
+            CircuitBreakerConfig(
+                failure_threshold=1,
+                reset_timeout=0.01,
+                on_state_change=lambda old, new: changes.append(new),
+            )
+        )
+        with pytest.raises(ServerError):
+            breaker.call(_fail)
+        time.sleep(0.02)
+        breaker.call(lambda: None)
+
+        assert breaker.state is CircuitState.CLOSED
+        assert changes == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test a failed probe re-opens the circuit."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, reset_timeout=0.01))
+        with pytest.raises(ServerError):
+            breaker.call(_fail)
+        time.sleep(0.02)
+        with pytest.raises(ServerError):
+            breaker.call(_fail)
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.stats.times_opened == 2
+
+    def test_half_open_limits_probes(self):
+        """Test only half_open_max_calls probes are admitted at once."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, reset_timeout=0.01))
+        with pytest.raises(ServerError):
+            breaker.call(_fail)
+        time.sleep(0.02)
+        breaker.before_call()  # first probe admitted, still in flight
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+
+class TestClientCircuitBreaker:
+    """Test the breaker on client calls."""
+
+    def _client(self, fake_server, **config):
+        return CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=2, **config),
+        )
+
+    def test_fails_fast_when_open(self, fake_server):
+        """Test calls stop reaching the server once the circuit opens."""
+        client = self._client(fake_server)
+        for _ in range(2):
+            fake_server.queue_response(500, {"error": "down"})
+            with pytest.raises(ServerError):
+                client.compress(context="a b")
+        with pytest.raises(CircuitOpenError):
+            client.compress(context="a b")
+        client.close_sync()
+
+        assert len(fake_server.requests) == 2
+        assert client.circuit_stats.state is CircuitState.OPEN
+
+    def test_passthrough_returns_original(self, fake_server):
+        """Test passthrough returns the context uncompressed while open."""
+        client = self._client(fake_server, passthrough=True)
+        for _ in range(2):
+            fake_server.queue_response(503, {"error": "down"})
+            with pytest.raises(ServiceUnavailableError):
+                client.compress(context="a b")
+
+        response = client.compress(context="keep this text")
+        batch = client.compress_batch(contexts=["one", "two"])
+        chunks = [c.content for c in client.compress_stream(context="stream text")]
+        client.close_sync()
+
+        assert response.data.compressed_context == "keep this text"
+        assert response.data.actual_compression_ratio == 1.0
+        assert [r.compressed_context for r in batch.data.results] == ["one", "two"]
+        assert "".join(chunks) == "stream text"
+        assert len(fake_server.requests) == 2
+
+    async def test_async_passthrough(self, fake_server):
+        """Test the async path falls back the same way."""
+        client = self._client(fake_server, passthrough=True)
+        for _ in range(2):
+            fake_server.queue_response(500, {"error": "down"})
+            with pytest.raises(ServerError):
+                await client.compress_async(context="a b")
+
+        response = await client.compress_async(context="still here")
+        await client.close()
+
+        assert response.data.compressed_context == "still here"
+        assert len(fake_server.requests) == 2
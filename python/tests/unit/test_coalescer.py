@@ -0,0 +1,176 @@
+"""
+Unit Tests for the micro-batching coalescer
+
+Tests that concurrent single compress() calls are sent as batch requests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pytest
+
+from compresr import CoalescingConfig, CompressionClient
+from compresr.exceptions import ServerError
+
+from .conftest import TEST_API_KEY
+
+
+@pytest.fixture
+def coalescing_client(fake_server):
+    client = CompressionClient(
+        api_key=TEST_API_KEY,
+        base_url=fake_server.url,
+        coalescing=CoalescingConfig(max_wait_ms=100, max_batch_size=8),
+    )
+    yield client
+    client.close_sync()
+
+
+def _batch_sizes(fake_server):
+    return sorted(len(data["inputs"]) for _, path, data in fake_server.requests if "batch" in path)
+
+
+def _single_contexts(fake_server):
+    return sorted(data["context"] for _, path, data in fake_server.requests if "batch" not in path)
+
+
+@contextmanager
+def _occupied(client, fake_server):
+    """Keep one slow call in flight, so the calls made meanwhile are grouped."""
+    fake_server.delays["occupier"] = 0.5
+    thread = threading.Thread(target=client.compress, kwargs={"context": "occupier"})
+    thread.start()
+    while not fake_server.active:
+        time.sleep(0.001)
+    yield
+    thread.join()
+
+
+class TestSyncCoalescing:
+    """Test coalescing of concurrent sync calls."""
+
+    def test_concurrent_calls_share_one_batch(self, coalescing_client, fake_server):
+        """Test concurrent calls go out as one batch and each gets its own result."""
+        contexts = [f"thread context {i} words" for i in range(6)]
+        with _occupied(coalescing_client, fake_server):
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                responses = list(
+                    pool.map(lambda c: coalescing_client.compress(context=c), contexts)
+                )
+
+        assert _batch_sizes(fake_server) == [6]
+        assert [r.data.original_context for r in responses] == contexts
+        stats = coalescing_client.coalescing_stats
+        assert stats.calls == 7
+        assert stats.dispatches == 2  # the occupier and the batch
+
+    def test_full_group_flushes_early(self, coalescing_client, fake_server):
+        """Test a group is sent as soon as it reaches max_batch_size."""
+        with _occupied(coalescing_client, fake_server):
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                list(pool.map(lambda i: coalescing_client.compress(context=f"c {i}"), range(16)))
+
+        assert sum(_batch_sizes(fake_server)) == 16
+        assert max(_batch_sizes(fake_server)) == 8
+
+    def test_lone_call_sent_at_once(self, fake_server):
+        """Test a call with no other call in progress skips the window and the batch."""
+        config = CoalescingConfig(max_wait_ms=2000)
+        with CompressionClient(
+            api_key=TEST_API_KEY, base_url=fake_server.url, coalescing=config
+        ) as client:
+            started = time.monotonic()
+            response = client.compress(context="alone here")
+            assert time.monotonic() - started < 1.0
+        assert response.data.compressed_context == "alone"
+        assert [path for _, path, _ in fake_server.requests] == ["/api/compress/question-agnostic/"]
+
+    def test_different_options_not_mixed(self, coalescing_client, fake_server):
+        """Test calls with different options are batched separately."""
+        calls = [{"context": f"c {i}", "target_compression_ratio": 0.5 * (i % 2)} for i in range(4)]
+        with _occupied(coalescing_client, fake_server):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                responses = list(pool.map(lambda kw: coalescing_client.compress(**kw), calls))
+
+        assert _batch_sizes(fake_server) == [2, 2]
+        assert [r.data.target_compression_ratio for r in responses] == [0.0, 0.5, 0.0, 0.5]
+
+    def test_request_error_resent_alone(self, coalescing_client, fake_server):
+        """Test a batch rejected for its input is re-sent per caller, not shared."""
+        contexts = [f"c {i}" for i in range(3)]
+        with _occupied(coalescing_client, fake_server):
+            fake_server.queue_response(422, {"error": "one input is invalid"})
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                responses = list(
+                    pool.map(lambda c: coalescing_client.compress(context=c), contexts)
+                )
+
+        assert [r.data.original_context for r in responses] == contexts
+        assert _batch_sizes(fake_server) == [3]
+        assert _single_contexts(fake_server) == contexts + ["occupier"]
+
+    def test_transient_error_fans_out(self, coalescing_client, fake_server):
+        """Test a batch failed by the service raises in every caller without re-sending."""
+
+        def call(i):
+            with pytest.raises(ServerError):
+                coalescing_client.compress(context=f"c {i}")
+
+        with _occupied(coalescing_client, fake_server):
+            fake_server.queue_response(500, {"error": "boom"})
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                list(pool.map(call, range(3)))
+
+        assert _batch_sizes(fake_server) == [3]
+        assert _single_contexts(fake_server) == ["occupier"]
+
+
+class TestAsyncCoalescing:
+    """Test coalescing of concurrent async calls."""
+
+    async def test_gathered_calls_share_one_batch(self, coalescing_client, fake_server):
+        """Test gathered compress_async calls are sent as one batch."""
+        contexts = [f"async context {i}" for i in range(5)]
+        with _occupied(coalescing_client, fake_server):
+            responses = await asyncio.gather(
+                *(coalescing_client.compress_async(context=c) for c in contexts)
+            )
+
+        assert _batch_sizes(fake_server) == [5]
+        assert [r.data.original_context for r in responses] == contexts
+        await coalescing_client.close()
+
+    async def test_query_specific_calls(self, coalescing_client, fake_server):
+        """Test query-specific calls keep their own queries in the batch."""
+        with _occupied(coalescing_client, fake_server):
+            await asyncio.gather(
+                *(
+                    coalescing_client.compress_async(
+                        context=f"ctx {i}", query=f"q {i}?", compression_model_name="latte_v1"
+                    )
+                    for i in range(3)
+                )
+            )
+
+        ((_, path, data),) = [r for r in fake_server.requests if "batch" in r[1]]
+        assert path == "/api/compress/question-specific/batch"
+        assert [inp["query"] for inp in data["inputs"]] == ["q 0?", "q 1?", "q 2?"]
+        await coalescing_client.close()
+
+    async def test_cancelled_caller_does_not_strand_others(self, coalescing_client, fake_server):
+        """Test cancelling one waiting caller leaves the rest of the batch intact."""
+        with _occupied(coalescing_client, fake_server):
+            tasks = [
+                asyncio.ensure_future(coalescing_client.compress_async(context=f"c {i}"))
+                for i in range(3)
+            ]
+            await asyncio.sleep(0)
+            tasks[0].cancel()
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert [r.data.original_context for r in results[1:]] == ["c 1", "c 2"]
+        await coalescing_client.close()
@@ -0,0 +1,129 @@
+"""
+Unit Tests for the JSON codec layer
+
+Tests codec selection, round-trips and typed decoding of responses.
+"""
+
+import httpx
+import pytest
+
+from compresr import CompressionClient, JsonCodec
+from compresr.config import ENDPOINTS
+from compresr.exceptions import CompresrError, ServiceUnavailableError
+from compresr.schemas import CompressResponse
+from compresr.services.codec import CODECS, ORJSON_AVAILABLE, get_codec
+from compresr.services.mock import MockTransport
+
+from .conftest import TEST_API_KEY
+
+PAYLOAD = {"context": "héllo wörld ☃", "ratio": 0.5, "coarse": True, "items": [1, None]}
+
+
+def _available(name):
+    try:
+        return CODECS[name]()
+    except ImportError:
+        pytest.skip(f"{name} not installed")
+
+
+class CountingCodec(JsonCodec):
+    name = "counting"
+
+    def __init__(self):
+        self.dumped = 0
+        self.loaded = 0
+
+    def dumps(self, data):
+        self.dumped += 1
+        return super().dumps(data)
+
+    def loads(self, data):
+        self.loaded += 1
+        return super().loads(data)
+
+
+class TestCodecs:
+    """Test the codecs themselves."""
+
+    @pytest.mark.parametrize("name", sorted(CODECS))
+    def test_round_trip(self, name):
+        """Test every codec encodes to UTF-8 bytes and decodes back."""
+        codec = _available(name)
+        encoded = codec.dumps(PAYLOAD)
+        assert isinstance(encoded, bytes)
+        assert "héllo".encode("utf-8") in encoded
+        assert codec.loads(encoded) == PAYLOAD
+        assert codec.loads(encoded.decode("utf-8")) == PAYLOAD
+
+    @pytest.mark.parametrize("name", sorted(CODECS))
+    def test_invalid_json_raises_value_error(self, name):
+        """Test every codec reports bad input as ValueError."""
+        with pytest.raises(ValueError):
+            _available(name).loads(b"{not json")
+
+    def test_auto_prefers_fastest(self):
+        """Test "auto" picks orjson when it is installed."""
+        expected = ["orjson"] if ORJSON_AVAILABLE else ["msgspec", "json"]
+        assert get_codec().name in expected
+        assert get_codec("json").name == "json"
+
+    def test_unknown_codec(self):
+        """Test an unknown codec name is rejected up front."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+        with pytest.raises(ValueError):
+            CompressionClient(api_key=TEST_API_KEY, json_codec="yaml")
+
+
+class TestClientCodec:
+    """Test the codec through the client."""
+
+    def test_custom_codec_encodes_requests(self):
+        """Test a plugged-in codec serializes every request body."""
+        codec = CountingCodec()
+        transport = MockTransport()
+        with CompressionClient(api_key=TEST_API_KEY, transport=transport, json_codec=codec) as c:
+            result = c.compress(context="one two three four").data
+            chunks = [chunk.content for chunk in c.compress_stream(context="a b")]
+        assert result.compressed_context == "one two"
+        assert "".join(chunks).split() == ["a"]
+        assert codec.dumped == 2
+        # The one SSE event is parsed with the codec; typed responses skip it
+        assert codec.loaded == 1
+
+    @pytest.mark.parametrize("name", sorted(CODECS))
+    def test_compress_with_each_codec(self, name):
+        """Test compress and batch work end to end with every codec."""
+        _available(name)
+        transport = MockTransport()
+        with CompressionClient(api_key=TEST_API_KEY, transport=transport, json_codec=name) as c:
+            assert c.compress(context="one two three four").data.tokens_saved == 2
+            assert c.compress_batch(["a b", "c d"]).data.count == 2
+
+    def test_invalid_json_response(self):
+        """Test a non-JSON success body raises CompresrError, not a validation error."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"<html>"))
+        with CompressionClient(api_key=TEST_API_KEY, transport=transport) as c:
+            with pytest.raises(CompresrError, match="Invalid JSON"):
+                c.compress(context="some context here")
+
+    def test_error_response_still_mapped(self):
+        """Test HTTP errors are mapped before typed validation."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(503, json={"error": "Service busy"})
+        )
+        with CompressionClient(api_key=TEST_API_KEY, transport=transport) as c:
+            with pytest.raises(ServiceUnavailableError):
+                c.compress(context="some context here")
+
+    async def test_post_model_async(self):
+        """Test async typed requests validate straight into the model."""
+        transport = MockTransport()
+        async with CompressionClient(api_key=TEST_API_KEY, async_transport=transport) as c:
+            response = await c.post_model_async(
+                ENDPOINTS.COMPRESS_AGNOSTIC,
+                {"context": "one two", "compression_model_name": "espresso_v1"},
+                CompressResponse,
+            )
+        assert isinstance(response, CompressResponse)
+        assert response.data.compressed_context == "one"
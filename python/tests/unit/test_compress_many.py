@@ -0,0 +1,134 @@
+"""
+Unit Tests for compress_many / compress_many_async
+
+Tests bounded concurrency and as-completed result streaming.
+"""
+
+import asyncio
+
+import pytest
+
+from compresr.exceptions import RateLimitError, ValidationError
+from compresr.schemas import CompressResponse
+
+
+class TestCompressMany:
+    """Test sync compress_many()."""
+
+    def test_results_cover_every_input(self, client):
+        """Test every input index is yielded exactly once with its result."""
+        contexts = [f"document number {i} body" for i in range(20)]
+        results = dict(client.compress_many(contexts, max_concurrency=4))
+
+        assert sorted(results) == list(range(20))
+        for index, response in results.items():
+            assert isinstance(response, CompressResponse)
+            assert response.data.original_context == contexts[index]
+
+    def test_in_flight_bounded(self, client, fake_server):
+        """Test no more than max_concurrency requests run at once."""
+        fake_server.response_delay = 0.02
+        list(client.compress_many((f"doc {i}" for i in range(12)), max_concurrency=3))
+        assert fake_server.max_active == 3
+
+    def test_yields_as_completed(self, client, fake_server):
+        """Test a slow first input does not hold back faster ones."""
+        fake_server.delays["slow one"] = 0.3
+        order = [index for index, _ in client.compress_many(["slow one", "fast", "fast too"])]
+        assert order[-1] == 0
+
+    def test_errors_are_yielded_per_item(self, client, fake_server):
+        """Test a failing input yields its error without stopping the rest."""
+        fake_server.queue_response(429, {"error": "slow down"})
+        results = dict(client.compress_many(["a b", "c d"], max_concurrency=1))
+
+        assert isinstance(results[0], RateLimitError)
+        assert isinstance(results[1], CompressResponse)
+
+    def test_per_item_options(self, client, fake_server):
+        """Test mapping inputs pass their own compress() options."""
+        inputs = [
+            "plain context",
+            {"context": "qs context", "query": "what?", "compression_model_name": "latte_v1"},
+        ]
+        list(client.compress_many(inputs))
+
+        paths = sorted(path for _, path, _ in fake_server.requests)
+        assert paths == ["/api/compress/question-agnostic/", "/api/compress/question-specific/"]
+
+    def test_unknown_option_is_item_error(self, client):
+        """Test an input with unknown options yields ValidationError for that item."""
+        results = dict(client.compress_many([{"context": "a b", "bogus": 1}]))
+        assert isinstance(results[0], ValidationError)
+
+
+class TestCompressManyAsync:
+    """Test compress_many_async()."""
+
+    async def test_async_iterable_input(self, client):
+        """Test inputs may come from an async generator."""
+
+        async def produce():
+            for i in range(10):
+                yield f"async document {i}"
+
+        results = {i: r async for i, r in client.compress_many_async(produce())}
+        assert sorted(results) == list(range(10))
+        assert results[3].data.original_context == "async document 3"
+        await client.close()
+
+    async def test_in_flight_bounded(self, client, fake_server):
+        """Test no more than max_concurrency requests run at once."""
+        fake_server.response_delay = 0.02
+        async for _ in client.compress_many_async([f"d {i}" for i in range(12)], 4):
+            pass
+        assert fake_server.max_active == 4
+        await client.close()
+
+    async def test_yields_as_completed(self, client, fake_server):
+        """Test early results arrive before the slowest input finishes."""
+        fake_server.delays["slow one"] = 0.3
+        order = [i async for i, _ in client.compress_many_async(["slow one", "fast", "fast 2"])]
+        assert order[-1] == 0
+        await client.close()
+
+    async def test_early_exit_cancels_pending(self, client, fake_server):
+        """Test breaking out of the loop stops issuing new requests."""
+        fake_server.response_delay = 0.02
+        stream = client.compress_many_async([f"d {i}" for i in range(50)], max_concurrency=2)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert len(fake_server.requests) <= 4
+        await client.close()
+
+    async def test_early_exit_cleans_up(self, client, fake_server):
+        """Test an early exit waits for cancelled requests and closes the input generator."""
+        fake_server.response_delay = 0.2
+        closed = []
+
+        async def produce():
+            try:
+                for i in range(50):
+                    yield f"document {i}"
+            finally:
+                closed.append(True)
+
+        stream = client.compress_many_async(produce(), max_concurrency=3)
+        tasks_before = asyncio.all_tasks()
+        fake_server.delays["document 0"] = 0.0
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert closed == [True]
+        assert asyncio.all_tasks() <= tasks_before
+        await client.close()
+
+    @pytest.mark.parametrize("bad", [{"query": "no context"}])
+    async def test_missing_context_is_item_error(self, client, bad):
+        """Test an input without context yields ValidationError."""
+        results = {i: r async for i, r in client.compress_many_async([bad])}
+        assert isinstance(results[0], ValidationError)
+        await client.close()
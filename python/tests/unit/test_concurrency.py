@@ -0,0 +1,179 @@
+"""
+Unit Tests for adaptive (AIMD) concurrency control
+
+Tests limit growth, multiplicative decrease and gating of async requests.
+"""
+
+import asyncio
+
+import pytest
+
+from compresr import AdaptiveConcurrency, CompressionClient
+from compresr.exceptions import RateLimitError, ValidationError
+from compresr.services import concurrency
+from compresr.services.concurrency import AdaptiveConcurrencyLimiter
+
+from .conftest import TEST_API_KEY
+
+
+class _Clock:
+    """Stand-in for the limiter's time module; only moves when a test advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(concurrency, "time", fake)
+    return fake
+
+
+async def _ok():
+    await asyncio.sleep(0)
+    return "ok"
+
+
+async def _fail(error):
+    await asyncio.sleep(0)
+    raise error
+
+
+@pytest.mark.usefixtures("clock")
+class TestAdaptiveLimiter:
+    """Test the AIMD limit itself (on a fake clock, so latencies are exact)."""
+
+    async def test_limit_grows_under_load(self):
+        """Test the limit increases while requests succeed at full utilisation."""
+        limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=4))
+        for _ in range(5):
+            await asyncio.gather(*(limiter.run(_ok) for _ in range(limiter.limit)))
+        assert limiter.limit > 4
+
+    async def test_no_growth_when_underused(self):
+        """Test sequential calls far below the limit do not inflate it."""
+        limiter = AdaptiveConcurrencyLimiter(
+            AdaptiveConcurrency(initial_limit=8, target_latency_ms=1000)
+        )
+        for _ in range(50):
+            await limiter.run(_ok)
+        assert limiter.limit == 8
+
+    async def test_overload_halves_limit_once_per_burst(self):
+        """Test concurrent 429s from one burst cut the limit once."""
+        limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=16))
+        results = await asyncio.gather(
+            *(limiter.run(lambda: _fail(RateLimitError("slow"))) for _ in range(8)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RateLimitError) for r in results)
+        assert limiter.limit == 8
+        assert limiter.stats.decreases == 1
+
+    async def test_request_errors_do_not_cut(self):
+        """Test errors about the request itself leave the limit alone."""
+        limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=4))
+        with pytest.raises(ValidationError):
+            await limiter.run(lambda: _fail(ValidationError("bad")))
+        assert limiter.limit == 4
+        assert limiter.stats.in_flight == 0
+
+    async def test_slow_response_cuts(self, clock):
+        """Test latency above target_latency_ms counts as overload."""
+        limiter = AdaptiveConcurrencyLimiter(
+            AdaptiveConcurrency(initial_limit=4, target_latency_ms=5)
+        )
+
+        async def slow():
+            clock.now += 0.02
+
+        await limiter.run(slow)
+        assert limiter.limit == 2
+        assert limiter.stats.latency_ms == pytest.approx(20)
+
+    async def test_in_flight_never_exceeds_limit(self):
+        """Test waiters are admitted only as slots free up."""
+        limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=3, max_limit=3))
+        peak = 0
+
+        async def tracked():
+            nonlocal peak
+            peak = max(peak, limiter.stats.in_flight)
+            await asyncio.sleep(0.005)
+
+        await asyncio.gather(*(limiter.run(tracked) for _ in range(20)))
+        assert peak == 3
+        assert limiter.stats.in_flight == 0
+
+    async def test_cancelled_waiter_frees_nothing(self):
+        """Test cancelling a queued call keeps the accounting consistent."""
+        limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=1))
+        first = asyncio.ensure_future(limiter.run(lambda: asyncio.sleep(0.02)))
+        await asyncio.sleep(0)
+        queued = asyncio.ensure_future(limiter.run(_ok))
+        await asyncio.sleep(0)
+        queued.cancel()
+        await first
+
+        assert limiter.stats.in_flight == 0
+        assert await limiter.run(_ok) == "ok"
+
+    @pytest.mark.parametrize("granted", [False, True])
+    async def test_cancel_racing_release(self, granted):
+        """Test a waiter cancelled in the same step its slot frees passes the slot on."""
+        limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrency(initial_limit=1))
+        gate = asyncio.Event()
+        holder = asyncio.ensure_future(limiter.run(gate.wait))
+        await asyncio.sleep(0)
+        racing = asyncio.ensure_future(limiter.run(_ok))
+        after = asyncio.ensure_future(limiter.run(_ok))
+        await asyncio.sleep(0)
+
+        gate.set()
+        if granted:
+            await asyncio.sleep(0)  # holder finishes and hands its slot to racing
+        # Otherwise the holder's release runs first and skips the cancelled waiter
+        racing.cancel()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await racing
+
+        assert await asyncio.wait_for(after, 1) == "ok"
+        assert limiter.stats.in_flight == 0
+
+
+class TestClientAdaptiveConcurrency:
+    """Test the limiter on the async request path."""
+
+    async def test_caps_in_flight_requests(self, fake_server):
+        """Test the server never sees more than the limit at once."""
+        fake_server.response_delay = 0.02
+        client = CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            adaptive_concurrency=AdaptiveConcurrency(initial_limit=3, max_limit=3),
+        )
+        await asyncio.gather(*(client.compress_async(context=f"doc {i}") for i in range(12)))
+        await client.close()
+
+        assert fake_server.max_active == 3
+        assert client.concurrency_stats.latency_percentile_ms is not None
+
+    async def test_rate_limit_response_cuts_limit(self, fake_server):
+        """Test a 429 from the server lowers the limit."""
+        client = CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            adaptive_concurrency=AdaptiveConcurrency(initial_limit=8),
+        )
+        fake_server.queue_response(429, {"error": "slow down"})
+        with pytest.raises(RateLimitError):
+            await client.compress_async(context="a b")
+        await client.close()
+
+        assert client.concurrency_stats.limit == 4
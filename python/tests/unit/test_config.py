@@ -28,6 +28,8 @@ class TestAPIConfig:
         assert config.API_KEY_PREFIX == "cmp_"
         assert config.DEFAULT_TIMEOUT == 60
         assert config.STREAM_TIMEOUT == 300
+        assert config.DEFAULT_POOL_SIZE == 100
+        assert config.DEFAULT_KEEPALIVE_CONNECTIONS == 20
 
     def test_frozen_dataclass(self):
         """Test that APIConfig is frozen (immutable)."""
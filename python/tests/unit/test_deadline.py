@@ -0,0 +1,217 @@
+"""
+Unit Tests for timeouts and deadlines
+
+Tests per-phase timeouts and per-call deadlines across retries, rate-limiter
+waits, batch shards and streams.
+"""
+
+import time
+
+import pytest
+
+from compresr import (
+    AdaptiveConcurrency,
+    CircuitBreakerConfig,
+    CompressionClient,
+    RateLimit,
+    RetryPolicy,
+    Timeouts,
+)
+from compresr.config import API_CONFIG
+from compresr.exceptions import ConnectionError as CompresrConnectionError
+from compresr.exceptions import DeadlineExceededError, TimeoutError
+from compresr.services.deadline import deadline_scope, remaining
+
+from .conftest import TEST_API_KEY
+
+
+class TestDeadlineScope:
+    """Test the deadline context."""
+
+    def test_no_deadline_by_default(self):
+        """Test nothing is bounded outside a scope."""
+        assert remaining() is None
+        with deadline_scope(None):
+            assert remaining() is None
+
+    def test_nested_scope_keeps_earliest(self):
+        """Test an inner scope can shorten but not extend the deadline."""
+        with deadline_scope(0.5):
+            with deadline_scope(10):
+                assert remaining() <= 0.5
+            with deadline_scope(0.1):
+                assert remaining() <= 0.1
+        assert remaining() is None
+
+
+class TestTimeouts:
+    """Test per-phase timeouts."""
+
+    def test_resolve_defaults(self):
+        """Test unset phases fall back to the single timeout and STREAM_TIMEOUT."""
+        with CompressionClient(api_key=TEST_API_KEY, timeout=Timeouts(read=2)) as c:
+            assert c._timeouts.read == 2
+            assert c._timeouts.connect == API_CONFIG.DEFAULT_TIMEOUT
+            assert c._timeouts.stream == API_CONFIG.STREAM_TIMEOUT
+        with CompressionClient(api_key=TEST_API_KEY, timeout=5) as c:
+            assert c._timeouts.connect == c._timeouts.pool == 5
+
+    def test_read_timeout_raises_timeout_error(self, fake_server):
+        """Test an HTTP read timeout surfaces as TimeoutError."""
+        fake_server.response_delay = 0.5
+        with CompressionClient(
+            api_key=TEST_API_KEY, base_url=fake_server.url, timeout=Timeouts(read=0.05)
+        ) as c:
+            with pytest.raises(TimeoutError) as exc_info:
+                c.compress(context="slow response here")
+        # Callers catching ConnectionError for timeouts keep working
+        assert isinstance(exc_info.value, CompresrConnectionError)
+
+    def test_stream_timeout_bounds_whole_stream(self, fake_server):
+        """Test the stream timeout caps total duration even while chunks flow."""
+        fake_server.stream_delay = 0.05
+        with CompressionClient(
+            api_key=TEST_API_KEY, base_url=fake_server.url, timeout=Timeouts(stream=0.15)
+        ) as c:
+            chunks = []
+            with pytest.raises(TimeoutError):
+                for chunk in c.compress_stream(context="word " * 40):
+                    chunks.append(chunk)
+            assert 0 < len(chunks) < 20
+
+
+class TestDeadline:
+    """Test per-call deadlines."""
+
+    def test_compress_deadline(self, client, fake_server):
+        """Test a slow response is cut off at the deadline."""
+        fake_server.response_delay = 0.5
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError, match="Deadline") as exc_info:
+            client.compress(context="slow response here", deadline=0.1)
+        assert time.monotonic() - started < 0.4
+        # Callers catching TimeoutError for timeouts keep working
+        assert isinstance(exc_info.value, TimeoutError)
+        assert exc_info.value.code == "deadline_exceeded"
+
+    def test_deadline_covers_retries(self, fake_server):
+        """Test retries stop once the next back-off would overrun the deadline."""
+        with CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            retry=RetryPolicy(max_attempts=10, base_delay=0.05, max_delay=0.05, jitter=False),
+        ) as c:
+            for _ in range(10):
+                fake_server.queue_response(503, {"error": "busy"})
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                c.compress(context="keeps failing", deadline=0.12)
+            assert time.monotonic() - started < 0.3
+            assert len(fake_server.requests) < 5
+            assert c.retry_stats.exhausted == 1
+
+    def test_deadline_covers_rate_limiter(self, fake_server):
+        """Test a rate-limiter wait longer than the deadline fails immediately."""
+        with CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            rate_limit=RateLimit(requests_per_second=1),
+        ) as c:
+            c.compress(context="uses the only token")
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                c.compress(context="would wait a second", deadline=0.1)
+            assert time.monotonic() - started < 0.1
+            assert len(fake_server.requests) == 1
+
+    def test_deadline_covers_batch_shards(self, client, fake_server):
+        """Test the deadline reaches shards sent from worker threads."""
+        fake_server.response_delay = 0.5
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            client.compress_batch([f"document {i}" for i in range(150)], deadline=0.1)
+        assert time.monotonic() - started < 0.4
+
+    def test_stream_deadline(self, client, fake_server):
+        """Test a stream is cut off at the deadline."""
+        fake_server.stream_delay = 0.05
+        with pytest.raises(DeadlineExceededError):
+            for _ in client.compress_stream(context="word " * 40, deadline=0.1):
+                pass
+
+    def test_compress_many_item_deadline(self, client, fake_server):
+        """Test compress_many inputs may carry their own deadline."""
+        fake_server.delays["slow one here"] = 0.5
+        outcomes = dict(
+            client.compress_many([{"context": "slow one here", "deadline": 0.1}, "fast one here"])
+        )
+        assert isinstance(outcomes[0], DeadlineExceededError)
+        assert not isinstance(outcomes[1], DeadlineExceededError)
+
+    async def test_async_deadline(self, client, fake_server):
+        """Test compress_async is cancelled at the deadline."""
+        fake_server.response_delay = 0.5
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            await client.compress_async(context="slow response here", deadline=0.1)
+        assert time.monotonic() - started < 0.4
+        await client.close()
+
+    async def test_async_stream_deadline(self, client, fake_server):
+        """Test compress_stream_async is cut off at the deadline."""
+        fake_server.stream_delay = 0.05
+        with pytest.raises(DeadlineExceededError):
+            async for _ in client.compress_stream_async(context="word " * 40, deadline=0.1):
+                pass
+        await client.close()
+
+
+class TestDeadlineIsNotAFailure:
+    """Test a spent deadline is not held against the service."""
+
+    def test_deadline_does_not_open_circuit(self, fake_server):
+        """Test deadlines shorter than the server's latency leave the circuit closed."""
+        fake_server.response_delay = 0.3
+        with CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=3),
+            retry=RetryPolicy(max_attempts=3, base_delay=0.01),
+        ) as c:
+            for i in range(3):
+                with pytest.raises(DeadlineExceededError):
+                    c.compress(context=f"slow call {i}", deadline=0.1)
+            assert c.circuit_stats.consecutive_failures == 0
+            assert c.circuit_stats.times_opened == 0
+            assert c.retry_stats.retries == 0
+            assert len(fake_server.requests) == 3
+
+    def test_rate_limited_deadline_does_not_open_circuit(self, fake_server):
+        """Test deadlines refused by the rate limiter, with nothing sent, keep the circuit closed."""
+        with CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            rate_limit=RateLimit(requests_per_second=1),
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=3),
+        ) as c:
+            c.compress(context="uses the only token")
+            for i in range(3):
+                with pytest.raises(DeadlineExceededError):
+                    c.compress(context=f"would wait {i}", deadline=0.1)
+            assert c.circuit_stats.times_opened == 0
+            assert len(fake_server.requests) == 1
+
+    async def test_deadline_does_not_cut_concurrency(self, fake_server):
+        """Test async deadlines leave the adaptive concurrency limit alone."""
+        fake_server.response_delay = 0.3
+        client = CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            adaptive_concurrency=AdaptiveConcurrency(initial_limit=8),
+        )
+        for i in range(3):
+            with pytest.raises(DeadlineExceededError):
+                await client.compress_async(context=f"slow call {i}", deadline=0.1)
+        await client.close()
+        assert client.concurrency_stats.decreases == 0
+        assert client.concurrency_stats.limit == 8
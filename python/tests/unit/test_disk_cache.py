@@ -0,0 +1,186 @@
+"""
+Unit Tests for the on-disk result cache
+
+Tests persistence, sharing between instances, LRU eviction and compaction.
+"""
+
+import multiprocessing
+import sqlite3
+import threading
+import time
+
+from compresr import CompressionClient, DiskCache
+from compresr.schemas import CompressResponse, CompressResult
+from compresr.services import disk_cache
+
+from .conftest import TEST_API_KEY
+
+
+def _response(context: str) -> CompressResponse:
+    return CompressResponse(
+        data=CompressResult(
+            original_context=context,
+            compressed_context=context[: len(context) // 2],
+            original_tokens=10,
+            compressed_tokens=5,
+            actual_compression_ratio=0.5,
+            tokens_saved=5,
+            duration_ms=1,
+        )
+    )
+
+
+def _write_entries(path: str, prefix: str) -> None:
+    """Worker process body: write 25 entries through its own DiskCache."""
+    cache = DiskCache(path)
+    for i in range(25):
+        cache.set(f"{prefix}{i}", _response(f"{prefix} {i}"))
+    cache.close()
+
+
+class TestDiskCache:
+    """Test DiskCache storage behaviour."""
+
+    def test_round_trip(self, tmp_path):
+        """Test a stored response is returned intact."""
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        cache.set("k", _response("some text"))
+        assert cache.get("k") == _response("some text")
+        assert cache.get("missing") is None
+
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        cache.close()
+
+    def test_survives_reopen(self, tmp_path):
+        """Test entries persist across cache instances (warm restart)."""
+        path = tmp_path / "cache.sqlite"
+        first = DiskCache(path)
+        first.set("k", _response("persisted"))
+        first.close()
+
+        second = DiskCache(path)
+        assert second.get("k").data.original_context == "persisted"
+        second.close()
+
+    def test_concurrent_writers_share_file(self, tmp_path):
+        """Test two processes writing one file at once see each other's writes."""
+        path = str(tmp_path / "cache.sqlite")
+        DiskCache(path).close()  # create the schema before the writers race
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_write_entries, args=(path, p)) for p in "ab"]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+        assert [w.exitcode for w in workers] == [0, 0]
+
+        cache = DiskCache(path)
+        assert cache.get("b7").data.original_context == "b 7"
+        assert cache.get("a7").data.original_context == "a 7"
+        assert cache.stats.entries == 50
+        cache.close()
+
+    def test_totals_track_writes(self, tmp_path):
+        """Test the running entry/byte totals match the table after overwrites and deletes."""
+        path = tmp_path / "cache.sqlite"
+        cache = DiskCache(path)
+        cache.set("a", _response("a" * 10))
+        cache.set("b", _response("b" * 10))
+        cache.set("a", _response("a" * 50))
+        cache.clear()
+        cache.set("c", _response("c" * 30))
+        stats = cache.stats
+        cache.close()
+
+        with sqlite3.connect(path) as conn:
+            actual = conn.execute("SELECT COUNT(*), SUM(size) FROM results").fetchone()
+        assert (
+            (stats.entries, stats.bytes)
+            == actual
+            == (1, len(_response("c" * 30).model_dump_json()))
+        )
+
+    def test_hits_update_access_time_in_batches(self, tmp_path, monkeypatch):
+        """Test hits take the write lock once per batch rather than on every lookup."""
+        monkeypatch.setattr(disk_cache, "_ACCESS_FLUSH_SIZE", 3)
+        path = tmp_path / "cache.sqlite"
+        cache = DiskCache(path)
+        for key in "abcde":
+            cache.set(key, _response(key))
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+
+        for key in "aabcde":
+            cache.get(key)
+        updates = [s for s in statements if s.startswith("UPDATE results")]
+        assert len(updates) == 3  # a, b and c flushed together; d and e still buffered
+        cache.close()
+
+    def test_lru_eviction_by_bytes(self, tmp_path):
+        """Test least recently accessed entries are evicted to fit max_bytes."""
+        size = len(_response("x" * 100).model_dump_json())
+        cache = DiskCache(tmp_path / "cache.sqlite", max_bytes=size * 2)
+        cache.set("a", _response("a" * 100))
+        time.sleep(0.01)
+        cache.set("b", _response("b" * 100))
+        time.sleep(0.01)
+        cache.get("a")
+        cache.set("c", _response("c" * 100))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats.evictions == 1
+        assert cache.stats.bytes <= size * 2
+        cache.close()
+
+    def test_ttl_expiry_and_compact(self, tmp_path):
+        """Test expired entries miss and compact() removes them."""
+        cache = DiskCache(tmp_path / "cache.sqlite", ttl=0.01)
+        cache.set("a", _response("a"))
+        cache.set("b", _response("b"))
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        cache.compact()
+        assert cache.stats.entries == 0
+        cache.close()
+
+
+class TestClientDiskCache:
+    """Test DiskCache as the client's result cache."""
+
+    def test_warm_restart_skips_api(self, fake_server, tmp_path):
+        """Test a new client on an existing cache file does not call the API."""
+        path = tmp_path / "cache.sqlite"
+        for _ in range(2):
+            cache = DiskCache(path)
+            client = CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url, cache=cache)
+            client.compress(context="the quick brown fox")
+            client.close_sync()
+            cache.close()
+
+        assert len(fake_server.requests) == 1
+
+    async def test_async_lookups_run_off_the_loop(self, fake_server, tmp_path):
+        """Test compress_async() reads and writes the disk cache in a worker thread."""
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        threads = set()
+        for method in ("get", "set"):
+            original = getattr(cache, method)
+
+            def traced(*args, _original=original):
+                threads.add(threading.get_ident())
+                return _original(*args)
+
+            setattr(cache, method, traced)
+
+        client = CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url, cache=cache)
+        for _ in range(2):
+            await client.compress_async(context="the quick brown fox")
+        await client.close()
+        cache.close()
+
+        assert threading.get_ident() not in threads
+        assert len(fake_server.requests) == 1
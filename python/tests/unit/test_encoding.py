@@ -0,0 +1,117 @@
+"""
+Unit Tests for request body compression
+
+Tests the size threshold, gzip/zstd encoding and wire accounting.
+"""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from compresr import BodyCompression, CompressionClient
+from compresr.services.encoding import BodyEncoder
+from compresr.services.mock import MockTransport
+
+from .conftest import TEST_API_KEY
+
+LARGE = "word " * 10_000
+
+
+def _client(transport, **options) -> CompressionClient:
+    return CompressionClient(
+        api_key=TEST_API_KEY, transport=transport, async_transport=transport, **options
+    )
+
+
+class TestBodyEncoder:
+    """Test the encoder in isolation."""
+
+    def test_small_body_sent_as_is(self):
+        """Test bodies under min_bytes are plain JSON without Content-Encoding."""
+        content, headers, record = BodyEncoder(BodyCompression()).encode(b'{"context":"hi"}')
+        assert json.loads(content) == {"context": "hi"}
+        assert headers == {}
+        assert record.encoding is None
+        assert record.sent_bytes == record.body_bytes
+
+    def test_large_body_gzipped(self):
+        """Test bodies over min_bytes are gzip-compressed and much smaller."""
+        content, headers, record = BodyEncoder(BodyCompression(min_bytes=1024)).encode(
+            json.dumps({"context": LARGE}).encode()
+        )
+        assert headers == {"Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(content)) == {"context": LARGE}
+        assert record.sent_bytes == len(content) < record.body_bytes / 10
+        assert record.compress_ms >= 0
+
+    def test_invalid_algorithm(self):
+        """Test an unknown algorithm is rejected up front."""
+        with pytest.raises(ValueError):
+            BodyEncoder(BodyCompression(algorithm="brotli"))
+
+    def test_zstd(self):
+        """Test zstd bodies round-trip when zstandard is installed."""
+        zstandard = pytest.importorskip("zstandard")
+        content, headers, _ = BodyEncoder(BodyCompression(algorithm="zstd", min_bytes=0)).encode(
+            json.dumps({"context": LARGE}).encode()
+        )
+        assert headers == {"Content-Encoding": "zstd"}
+        decoded = zstandard.ZstdDecompressor().decompressobj().decompress(content)
+        assert json.loads(decoded) == {"context": LARGE}
+
+
+class TestClientBodyCompression:
+    """Test body compression through the client."""
+
+    def test_disabled_by_default(self):
+        """Test wire_stats is None and bodies are plain without body_compression."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("Content-Encoding"))
+            return MockTransport().handle_request(request)
+
+        with _client(httpx.MockTransport(handler)) as c:
+            c.compress(context=LARGE)
+            assert c.wire_stats is None
+        assert seen == [None]
+
+    def test_compressed_request_round_trip(self):
+        """Test a large context is uploaded gzipped and compressed by the mock API."""
+        records = []
+        transport = MockTransport()
+        with _client(
+            transport,
+            body_compression=BodyCompression(min_bytes=1024, on_request=records.append),
+        ) as c:
+            result = c.compress(context=LARGE).data
+            c.compress(context="small one")
+            stats = c.wire_stats
+
+        assert result.original_tokens == 10_000
+        assert stats.requests == 2
+        assert stats.compressed_requests == 1
+        assert stats.sent_bytes < stats.body_bytes / 5
+        assert stats.received_bytes > 0
+        assert stats.bytes_saved > 0
+        assert [r.encoding for r in records] == ["gzip", None]
+        assert records[0].received_bytes > 0
+
+    def test_stream_and_batch(self):
+        """Test streams and batch requests are compressed and accounted too."""
+        with _client(MockTransport(), body_compression=BodyCompression(min_bytes=1024)) as c:
+            chunks = list(c.compress_stream(context=LARGE))
+            batch = c.compress_batch([LARGE, LARGE]).data
+            stats = c.wire_stats
+        assert "".join(chunk.content or "" for chunk in chunks).split() == ["word"] * 5_000
+        assert batch.count == 2
+        assert stats.compressed_requests == 2
+
+    async def test_async(self):
+        """Test async requests are compressed and accounted."""
+        async with _client(MockTransport(), body_compression=BodyCompression(min_bytes=1024)) as c:
+            result = await c.compress_async(context=LARGE)
+            assert c.wire_stats.compressed_requests == 1
+        assert result.data.original_tokens == 10_000
@@ -0,0 +1,114 @@
+"""
+Unit Tests for hedged requests
+
+Tests that slow requests are duplicated within budget and the first success wins.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from compresr import CompressionClient, HedgingPolicy
+from compresr.exceptions import ServerError
+from compresr.services.hedging import Hedger
+
+from .conftest import TEST_API_KEY
+
+POLICY = HedgingPolicy(percentile=0.9, min_delay_ms=20, max_extra_ratio=0.5, min_samples=3)
+
+
+@pytest.fixture
+def hedged_client(fake_server):
+    client = CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url, hedging=POLICY)
+    # Warm up the latency history
+    for i in range(3):
+        client.compress(context=f"warm up {i}")
+    fake_server.requests.clear()
+    yield client
+    client.close_sync()
+
+
+class TestHedger:
+    """Test Hedger decisions."""
+
+    def test_no_hedge_before_min_samples(self):
+        """Test nothing is duplicated until enough latencies are known."""
+        hedger = Hedger(POLICY, max_workers=4)
+        calls = []
+        assert hedger.run(lambda: calls.append(1) or "ok") == "ok"
+        assert len(calls) == 1
+        assert hedger.stats.hedges_sent == 0
+
+    def test_budget_caps_hedges(self):
+        """Test hedges never exceed max_extra_ratio of requests."""
+        hedger = Hedger(
+            HedgingPolicy(min_delay_ms=1, max_extra_ratio=0.25, min_samples=1), max_workers=8
+        )
+        hedger.run(lambda: None)
+        for _ in range(11):
+            hedger.run(lambda: time.sleep(0.01))
+        hedger.close()
+
+        stats = hedger.stats
+        assert stats.requests == 12
+        assert stats.hedges_sent <= 3
+
+    async def test_async_failure_falls_back_to_other(self):
+        """Test a failed first response does not win over a later success."""
+        hedger = Hedger(HedgingPolicy(min_delay_ms=5, max_extra_ratio=1, min_samples=1), 4)
+        await hedger.run_async(lambda: asyncio.sleep(0))
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                await asyncio.sleep(0.02)
+                raise ServerError("boom")
+            await asyncio.sleep(0.03)
+            return "ok"
+
+        assert await hedger.run_async(flaky) == "ok"
+        assert len(attempts) == 2
+
+
+class TestClientHedging:
+    """Test hedging on compress() / compress_async()."""
+
+    def test_slow_request_hedged_and_hedge_wins(self, hedged_client, fake_server):
+        """Test a stuck request is duplicated and the fast copy's result is returned."""
+        fake_server.queue_delay(1.0)
+        start = time.monotonic()
+        response = hedged_client.compress(context="interactive request body")
+
+        assert time.monotonic() - start < 0.5
+        assert response.data.original_context == "interactive request body"
+        assert len(fake_server.requests) == 2
+        stats = hedged_client.hedging_stats
+        assert (stats.hedges_sent, stats.hedges_won) == (1, 1)
+
+    def test_fast_request_not_hedged(self, fake_server):
+        """Test requests faster than the hedge delay are sent once."""
+        # A floor far above loopback latency, so a slow warm-up or a busy
+        # machine cannot pull the hedge delay under this request's latency
+        policy = HedgingPolicy(percentile=0.9, min_delay_ms=500, min_samples=3)
+        with CompressionClient(
+            api_key=TEST_API_KEY, base_url=fake_server.url, hedging=policy
+        ) as client:
+            for i in range(3):
+                client.compress(context=f"warm up {i}")
+            client.compress(context="quick one")
+            assert len(fake_server.requests) == 4
+            assert client.hedging_stats.hedges_sent == 0
+
+    async def test_async_loser_cancelled(self, hedged_client, fake_server):
+        """Test the async hedge wins and the slow primary is cancelled."""
+        fake_server.queue_delay(1.0)
+        start = time.monotonic()
+        response = await hedged_client.compress_async(context="async interactive")
+
+        assert time.monotonic() - start < 0.5
+        assert response.success
+        assert hedged_client.hedging_stats.hedges_won == 1
+        assert hedged_client.async_pool_stats.in_flight == 0
+        await hedged_client.close()
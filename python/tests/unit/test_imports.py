@@ -0,0 +1,115 @@
+"""
+Unit Tests for import-time behaviour
+
+Tests that heavy and rarely used modules are deferred until first use and
+that the lazily exposed names still resolve.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import compresr
+from compresr.config import sdk_version
+from compresr.services.lazy import LazyModule, lazy_import
+
+BENCHMARK = Path(__file__).parents[2] / "benchmarks" / "import_time.py"
+DEFERRED = [
+    "httpx",
+    "sqlite3",
+    "numpy",
+    "orjson",
+    "msgspec",
+    "zstandard",
+    "compresr.services.balancer",
+    "compresr.services.batching",
+    "compresr.services.cache",
+    "compresr.services.circuit",
+    "compresr.services.coalescer",
+    "compresr.services.codec",
+    "compresr.services.concurrency",
+    "compresr.services.disk_cache",
+    "compresr.services.encoding",
+    "compresr.services.hedging",
+    "compresr.services.incremental",
+    "compresr.services.lean",
+    "compresr.services.metrics",
+    "compresr.services.rate_limit",
+    "compresr.services.retry",
+    "compresr.services.single_flight",
+    "compresr.schemas.tool_discovery",
+    "compresr.schemas.usage",
+    "compresr.exceptions.responses",
+]
+
+
+def _run(code: str) -> str:
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return out.stdout
+
+
+class TestDeferredImports:
+    """Test what ``import compresr`` leaves for later."""
+
+    def test_deferred_modules_not_imported(self):
+        """Test httpx, sqlite3, optional libraries and opt-in features load on first use only."""
+        code = (
+            "import sys, json, compresr\n"
+            f"print(json.dumps([m for m in {DEFERRED!r} if m in sys.modules]))"
+        )
+        assert json.loads(_run(code)) == []
+
+    def test_first_request_imports_httpx(self):
+        """Test a client works when httpx is only imported by its first request."""
+        code = (
+            "from compresr import CompressionClient\n"
+            "from compresr.services import proxy\n"
+            "from compresr.services.lazy import LazyModule\n"
+            "assert isinstance(proxy.httpx, LazyModule)\n"
+            "from compresr.services.mock import MockTransport\n"
+            "client = CompressionClient(api_key='cmp_test', transport=MockTransport())\n"
+            "print(client.compress(context='one two three four').data.compressed_context)"
+        )
+        assert _run(code).strip() == "one two"
+
+    def test_lazy_names_resolve(self):
+        """Test lazily exposed schemas and __version__ resolve on access."""
+        from compresr.exceptions import ErrorResponse
+        from compresr.exceptions.responses import ErrorResponse as Direct
+        from compresr.schemas import DeferredTool, MoneyBalanceResult, ValidationErrorResponse
+
+        assert ErrorResponse is Direct
+        assert DeferredTool.__module__ == "compresr.schemas.tool_discovery"
+        assert MoneyBalanceResult.__module__ == "compresr.schemas.usage"
+        assert ValidationErrorResponse.__module__ == "compresr.exceptions.responses"
+        assert compresr.__version__ == sdk_version()
+        assert compresr.DiskCache.__module__ == "compresr.services.disk_cache"
+        assert compresr.services.HedgingStats.__module__ == "compresr.services.hedging"
+        assert compresr.RetryPolicy.__module__ == "compresr.services.retry"
+        for module in (compresr, compresr.services):
+            for name in module.__all__:
+                getattr(module, name)
+        with pytest.raises(AttributeError):
+            compresr.schemas.NoSuchSchema
+        with pytest.raises(ImportError):
+            from compresr import NoSuchName  # noqa: F401
+
+    def test_lazy_module(self):
+        """Test LazyModule imports on first access and caches attributes."""
+        module = LazyModule("colorsys")
+        assert module.rgb_to_hsv(0, 0, 0) == (0, 0, 0)
+        assert "rgb_to_hsv" in vars(module)
+        assert lazy_import("json") is json
+
+    @pytest.mark.slow
+    def test_import_time_budget(self):
+        """Test the import-time benchmark passes within its default budget."""
+        result = subprocess.run(
+            [sys.executable, str(BENCHMARK)],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout
@@ -0,0 +1,163 @@
+"""
+Unit Tests for incremental batch parsing
+
+Tests the streaming JSON array parser and compress_batch_iter().
+"""
+
+import json
+
+import httpx
+import pytest
+
+from compresr import CircuitBreakerConfig, CompressionClient, RetryPolicy
+from compresr.exceptions import CompresrError
+from compresr.schemas import CompressBatchItemResult
+from compresr.services.incremental import ArrayItemParser, iter_array_items
+from compresr.services.mock import MockConfig, MockTransport
+
+from .conftest import TEST_API_KEY
+
+PATH = ("data", "results")
+
+DOCUMENT = {
+    "success": True,
+    "message": 'decoy "results": [ {',
+    "data": {
+        "meta": {"results": [{"wrong": True}]},
+        "results": [
+            {"text": 'brackets } ] { [ and \\" escaped \\\\', "nested": [1, {"k": "}"}]},
+            {"text": "unicode é ☃", "results": []},
+            {},
+        ],
+        "count": 3,
+    },
+}
+
+
+def _items(raw: bytes, chunk_size: int):
+    chunks = (raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size))
+    return [json.loads(item) for item in iter_array_items(chunks, PATH)]
+
+
+def _item(i: int) -> dict:
+    return {
+        "original_context": f"document {i}",
+        "compressed_context": f"doc {i}",
+        "original_tokens": 2,
+        "compressed_tokens": 2,
+        "actual_compression_ratio": 1.0,
+        "tokens_saved": 0,
+        "duration_ms": 1,
+    }
+
+
+class TestArrayItemParser:
+    """Test incremental extraction of array elements."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 1 << 20])
+    def test_any_chunking(self, chunk_size):
+        """Test elements are extracted exactly whatever the chunk boundaries."""
+        raw = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+        assert _items(raw, chunk_size) == DOCUMENT["data"]["results"]
+
+    def test_items_emitted_as_completed(self):
+        """Test an element is returned by the feed() that completes it."""
+        parser = ArrayItemParser(PATH)
+        assert parser.feed(b'{"data": {"results": [{"a": 1}, {"b"') == [b'{"a": 1}']
+        assert parser.feed(b": 2}]}}") == [b'{"b": 2}']
+        parser.close()
+
+    def test_buffer_bounded_by_one_item(self):
+        """Test consumed elements are not kept in the buffer."""
+        parser = ArrayItemParser(PATH)
+        parser.feed(b'{"data": {"results": [')
+        for _ in range(100):
+            parser.feed(json.dumps({"text": "x" * 1000}).encode() + b",")
+            assert len(parser._buf) < 1100
+
+    def test_missing_array(self):
+        """Test a body without the array is an error, e.g. success=false."""
+        with pytest.raises(CompresrError, match="data.results"):
+            _items(b'{"success": false, "data": null}', 8)
+
+    def test_truncated(self):
+        """Test a body cut off inside the array is an error."""
+        with pytest.raises(CompresrError, match="ended"):
+            _items(b'{"data": {"results": [{"a": 1}, {"b": ', 8)
+
+
+class TestCompressBatchIter:
+    """Test the iterator batch API."""
+
+    def test_matches_compress_batch(self):
+        """Test results equal compress_batch(), in order, across shards."""
+        contexts = [f"document number {i} here" for i in range(150)]
+        with CompressionClient(api_key=TEST_API_KEY, transport=MockTransport()) as c:
+            items = list(c.compress_batch_iter(contexts))
+            full = c.compress_batch(contexts).data.results
+        assert all(isinstance(item, CompressBatchItemResult) for item in items)
+        assert items == full
+
+    def test_yields_before_body_complete(self):
+        """Test the first result is available while the body is still arriving."""
+        sent = []
+        body = json.dumps({"success": True, "data": {"results": [_item(0), _item(1)]}}).encode()
+
+        def chunks():
+            for i in range(0, len(body), 16):
+                sent.append(i)
+                yield body[i : i + 16]
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))
+        with CompressionClient(api_key=TEST_API_KEY, transport=transport) as c:
+            stream = c.compress_batch_iter(["document 0", "document 1"])
+            first = next(stream)
+            assert first.compressed_context == "doc 0"
+            assert len(sent) < len(body) / 16
+            assert next(stream).compressed_context == "doc 1"
+            stream.close()
+
+    def test_retries_before_first_item(self):
+        """Test a failed shard is retried before any of its results is yielded."""
+        statuses = [503, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            if status != 200:
+                return httpx.Response(status, json={"error": "busy"})
+            return httpx.Response(200, json={"success": True, "data": {"results": [_item(0)]}})
+
+        retry = RetryPolicy(max_attempts=2, base_delay=0.001, max_delay=0.001)
+        transport = httpx.MockTransport(handler)
+        with CompressionClient(api_key=TEST_API_KEY, transport=transport, retry=retry) as c:
+            assert [i.compressed_context for i in c.compress_batch_iter(["doc"])] == ["doc 0"]
+
+    def test_count_mismatch(self):
+        """Test a shard returning the wrong number of results is an error."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, json={"success": True, "data": {"results": [_item(0)]}}
+            )
+        )
+        with CompressionClient(api_key=TEST_API_KEY, transport=transport) as c:
+            with pytest.raises(CompresrError, match="does not match"):
+                list(c.compress_batch_iter(["one", "two"]))
+
+    def test_passthrough_when_open(self):
+        """Test an open circuit yields uncompressed stand-ins when passthrough is set."""
+        breaker = CircuitBreakerConfig(failure_threshold=1, passthrough=True)
+        transport = MockTransport(MockConfig(error_rate=1.0))
+        with CompressionClient(
+            api_key=TEST_API_KEY, transport=transport, circuit_breaker=breaker
+        ) as c:
+            with pytest.raises(CompresrError):
+                list(c.compress_batch_iter(["fails"]))
+            items = list(c.compress_batch_iter(["a b", "c d"]))
+        assert [item.compressed_context for item in items] == ["a b", "c d"]
+
+    async def test_async(self):
+        """Test compress_batch_iter_async across shards."""
+        contexts = [f"document number {i}" for i in range(120)]
+        async with CompressionClient(api_key=TEST_API_KEY, async_transport=MockTransport()) as c:
+            items = [item async for item in c.compress_batch_iter_async(contexts)]
+        assert [item.original_context for item in items] == contexts
@@ -0,0 +1,115 @@
+"""
+Unit Tests for lean results
+
+Tests lean=True results for single and batch compression: fields, input
+references, aggregates, sharding and the circuit-breaker passthrough.
+"""
+
+import httpx
+import pytest
+
+from compresr import CircuitBreakerConfig, CompressionClient, ResultCache
+from compresr.exceptions import CompresrError
+from compresr.services.lean import LeanBatchResult, LeanResult
+from compresr.services.mock import MockConfig, MockTransport
+
+from .conftest import TEST_API_KEY
+
+
+def _client(transport=None, **options) -> CompressionClient:
+    transport = transport or MockTransport()
+    return CompressionClient(
+        api_key=TEST_API_KEY, transport=transport, async_transport=transport, **options
+    )
+
+
+class TestLeanCompress:
+    """Test lean single compression."""
+
+    def test_lean_result(self):
+        """Test lean compress returns a LeanResult referencing the caller's string."""
+        context = "one two three four " * 100
+        with _client() as c:
+            result = c.compress(context=context, target_compression_ratio=0.5, lean=True)
+            full = c.compress(context=context, target_compression_ratio=0.5).data
+
+        assert isinstance(result, LeanResult)
+        assert result.original_context is context
+        assert result.compressed_context == full.compressed_context
+        assert result.tokens_saved == full.tokens_saved
+        assert result.target_compression_ratio == 0.5
+        assert not hasattr(result, "__dict__")
+
+    def test_missing_data_raises(self):
+        """Test a response without a result raises instead of returning None."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"success": False, "message": "No credit"})
+        )
+        with _client(transport) as c:
+            with pytest.raises(CompresrError, match="No credit"):
+                c.compress(context="some context here", lean=True)
+
+    def test_bypasses_cache(self):
+        """Test lean calls neither read nor fill the result cache."""
+        with _client(cache=ResultCache()) as c:
+            c.compress(context="cached context here", lean=True)
+            assert c.cache_stats.hits == c.cache_stats.misses == 0
+
+    def test_passthrough_when_open(self):
+        """Test the circuit-breaker passthrough yields lean stand-ins."""
+        transport = MockTransport(MockConfig(error_rate=1.0))
+        breaker = CircuitBreakerConfig(failure_threshold=1, passthrough=True)
+        with _client(transport, circuit_breaker=breaker) as c:
+            with pytest.raises(CompresrError):
+                c.compress(context="fails once", lean=True)
+            context = "passed through as is"
+            result = c.compress(context=context, lean=True)
+            batch = c.compress_batch(["a b", "c d"], lean=True)
+        assert result.compressed_context is context
+        assert result.actual_compression_ratio == 1.0
+        assert [r.compressed_context for r in batch.results] == ["a b", "c d"]
+
+    async def test_async(self):
+        """Test compress_async(lean=True)."""
+        context = "one two three four"
+        async with _client() as c:
+            result = await c.compress_async(context=context, lean=True)
+        assert result.original_context is context
+        assert result.compressed_context == "one two"
+
+
+class TestLeanBatch:
+    """Test lean batch compression."""
+
+    def test_matches_full_batch(self):
+        """Test lean results and aggregates agree with the validated batch."""
+        contexts = [f"doc {i} " + "word " * (i + 1) for i in range(5)]
+        with _client() as c:
+            lean = c.compress_batch(contexts, lean=True)
+            full = c.compress_batch(contexts).data
+
+        assert isinstance(lean, LeanBatchResult)
+        assert [r.compressed_context for r in lean.results] == [
+            r.compressed_context for r in full.results
+        ]
+        assert all(r.original_context is ctx for r, ctx in zip(lean.results, contexts))
+        assert lean.total_tokens_saved == full.total_tokens_saved
+        assert lean.average_compression_ratio == full.average_compression_ratio
+        assert lean.count == full.count == 5
+
+    def test_sharded_and_deduplicated(self):
+        """Test shards are merged in order and duplicates share one result."""
+        contexts = [f"document number {i}" for i in range(150)] + ["document number 0"]
+        with _client() as c:
+            batch = c.compress_batch(contexts, max_concurrency=2, lean=True)
+        assert batch.count == 151
+        assert [r.original_context for r in batch.results] == contexts
+        assert batch.results[-1] is batch.results[0]
+
+    async def test_async(self):
+        """Test compress_batch_async(lean=True) across shards."""
+        contexts = [f"document number {i}" for i in range(120)]
+        async with _client() as c:
+            batch = await c.compress_batch_async(contexts, lean=True)
+        assert [r.original_context for r in batch.results] == contexts
+        assert batch.total_original_tokens == 360
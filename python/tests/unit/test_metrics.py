@@ -0,0 +1,128 @@
+"""
+Unit Tests for columnar batch metrics
+
+Tests BatchMetrics columns and aggregates, and the metrics of batch results.
+"""
+
+import pytest
+
+from compresr import CompressionClient
+from compresr.schemas import CompressBatchResult
+from compresr.services import MeasuredBatchResult
+from compresr.services import metrics as metrics_module
+from compresr.services.lean import passthrough_result
+from compresr.services.metrics import NUMPY_AVAILABLE, BatchMetrics
+from compresr.services.mock import MockTransport
+
+from .conftest import TEST_API_KEY
+
+
+@pytest.fixture(params=[True, False] if NUMPY_AVAILABLE else [False])
+def numpy_available(request, monkeypatch):
+    monkeypatch.setattr(metrics_module, "NUMPY_AVAILABLE", request.param)
+    return request.param
+
+
+def _metrics(durations):
+    return BatchMetrics.from_results(
+        passthrough_result("x")._replace(duration_ms=d, original_tokens=2 * d) for d in durations
+    )
+
+
+class TestBatchMetrics:
+    """Test the columnar metrics container."""
+
+    def test_columns(self):
+        """Test each field is one typed array filled in input order."""
+        metrics = _metrics([5, 1, 3])
+        assert len(metrics) == 3
+        assert metrics.duration_ms.typecode == "q"
+        assert metrics.actual_compression_ratio.typecode == "d"
+        assert list(metrics.duration_ms) == [5, 1, 3]
+        assert list(metrics.column("original_tokens")) == [10, 2, 6]
+        with pytest.raises(ValueError):
+            metrics.column("original_context")
+
+    def test_aggregates(self, numpy_available):
+        """Test sums, means and percentiles (linear interpolation, like numpy)."""
+        metrics = _metrics([4, 1, 3, 2])
+        assert metrics.sum("duration_ms") == 10
+        assert metrics.mean("duration_ms") == 2.5
+        assert metrics.percentile("duration_ms", 50) == 2.5
+        assert metrics.percentile("duration_ms", 90) == pytest.approx(3.7)
+        assert metrics.percentile("duration_ms", 100) == 4.0
+        assert BatchMetrics().mean("duration_ms") == 0.0
+        with pytest.raises(ValueError):
+            BatchMetrics().percentile("duration_ms", 50)
+
+    def test_histogram(self, numpy_available):
+        """Test equal-width bins with the maximum counted in the last bin."""
+        counts, edges = _metrics([0, 1, 2, 3, 4]).histogram("duration_ms", bins=2)
+        assert counts == [2, 3]
+        assert edges == [0.0, 2.0, 4.0]
+        counts, edges = _metrics([7, 7]).histogram("duration_ms", bins=1)
+        assert counts == [2]
+        assert edges == [6.5, 7.5]
+
+    def test_to_numpy(self):
+        """Test NumPy views share the arrays' buffers."""
+        metrics = _metrics([1, 2])
+        if not NUMPY_AVAILABLE:
+            with pytest.raises(ImportError):
+                metrics.to_numpy()
+            return
+        view = metrics.to_numpy()["duration_ms"]
+        metrics.duration_ms[0] = 9
+        assert view.tolist() == [9, 2]
+
+
+class TestBatchResultMetrics:
+    """Test the metrics of batch results."""
+
+    def test_compress_batch_metrics(self):
+        """Test batch results carry metrics built at parse time, outside serialization."""
+        contexts = [f"doc {i} " + "word " * i for i in range(10)]
+        with CompressionClient(api_key=TEST_API_KEY, transport=MockTransport()) as c:
+            result = c.compress_batch(contexts).data
+            lean = c.compress_batch(contexts, lean=True)
+            again = c.compress_batch(contexts).data
+
+        metrics = result.metrics
+        assert isinstance(result, CompressBatchResult)
+        assert isinstance(result, MeasuredBatchResult)
+        assert list(metrics.tokens_saved) == [r.tokens_saved for r in result.results]
+        assert metrics.sum("tokens_saved") == result.total_tokens_saved
+        assert metrics.mean("actual_compression_ratio") == result.average_compression_ratio
+        assert lean.metrics == metrics
+        assert result == again
+        assert "metrics" not in result.model_dump()
+
+    def test_sharded_batch_metrics(self):
+        """Test merged shards and expanded duplicates get metrics for every position."""
+        contexts = [f"document number {i}" for i in range(150)] + ["document number 0"]
+        with CompressionClient(api_key=TEST_API_KEY, transport=MockTransport()) as c:
+            result = c.compress_batch(contexts).data
+        assert len(result.metrics) == 151
+        assert result.metrics.sum("original_tokens") == result.total_original_tokens
+
+    def test_batch_measured_once(self, monkeypatch):
+        """Test metrics are computed once for the final result, not per shard."""
+        calls = []
+        from_results = BatchMetrics.from_results.__func__
+        monkeypatch.setattr(
+            BatchMetrics,
+            "from_results",
+            classmethod(lambda cls, results: calls.append(1) or from_results(cls, results)),
+        )
+        contexts = [f"document number {i}" for i in range(250)] + ["document number 0"]
+        with CompressionClient(api_key=TEST_API_KEY, transport=MockTransport()) as c:
+            c.compress_batch(contexts)
+        assert len(calls) == 1
+
+    def test_from_batch_iterator(self):
+        """Test metrics can be collected straight from compress_batch_iter()."""
+        contexts = [f"document number {i}" for i in range(150)]
+        with CompressionClient(api_key=TEST_API_KEY, transport=MockTransport()) as c:
+            metrics = BatchMetrics.from_results(c.compress_batch_iter(contexts))
+        assert len(metrics) == 150
+        assert metrics.sum("original_tokens") == 450
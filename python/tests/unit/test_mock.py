@@ -0,0 +1,111 @@
+"""
+Unit Tests for the in-process mock transport
+
+Tests the mocked endpoints, injected latency/errors and traffic stats.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from compresr import CompressionClient, RetryPolicy
+from compresr.exceptions import ServerError, ServiceUnavailableError
+from compresr.services.mock import MockConfig, MockTransport
+
+from .conftest import TEST_API_KEY
+
+
+def _client(transport: MockTransport, **options) -> CompressionClient:
+    return CompressionClient(
+        api_key=TEST_API_KEY, transport=transport, async_transport=transport, **options
+    )
+
+
+class TestMockEndpoints:
+    """Test the mocked API surface."""
+
+    def test_compress_ratio(self):
+        """Test compress keeps compression_ratio of the words."""
+        with _client(MockTransport(MockConfig(compression_ratio=0.25))) as c:
+            result = c.compress(context="a b c d e f g h").data
+        assert result.compressed_context == "a b"
+        assert result.actual_compression_ratio == 0.25
+        assert result.tokens_saved == 6
+
+    def test_batch_and_stream(self):
+        """Test batch and stream endpoints answer like the real API."""
+        with _client(MockTransport()) as c:
+            batch = c.compress_batch(["one two", "three four five six"]).data
+            assert [r.compressed_context for r in batch.results] == ["one", "three four"]
+            assert batch.total_original_tokens == 6
+
+            chunks = [chunk.content for chunk in c.compress_stream(context="one two three four")]
+            assert "".join(chunks).split() == ["one", "two"]
+
+    def test_health(self):
+        """Test the health endpoint used for load-balancer probes."""
+        with _client(MockTransport()) as c:
+            assert c._probe_health(c._base_url)
+
+    async def test_async(self):
+        """Test async compress and stream go through the same transport."""
+        transport = MockTransport()
+        async with _client(transport) as c:
+            result = await c.compress_async(context="one two three four")
+            chunks = [chunk.content async for chunk in c.compress_stream_async(context="x y")]
+        assert result.data.compressed_context == "one two"
+        assert "".join(chunks).split() == ["x"]
+        assert transport.stats.requests == 2
+
+
+class TestMockBehaviour:
+    """Test injected latency and failures."""
+
+    def test_error_rate(self):
+        """Test error_rate=1 fails every request with error_status."""
+        with _client(MockTransport(MockConfig(error_rate=1.0))) as c:
+            with pytest.raises(ServiceUnavailableError):
+                c.compress(context="always fails")
+        with _client(MockTransport(MockConfig(error_rate=1.0, error_status=500))) as c:
+            with pytest.raises(ServerError):
+                c.compress(context="always fails")
+
+    def test_seeded_errors_are_repeatable(self):
+        """Test the same seed injects the same failures."""
+
+        def outcomes(seed):
+            transport = MockTransport(MockConfig(error_rate=0.5, seed=seed))
+            with _client(transport) as c:
+                return [
+                    isinstance(result, ServiceUnavailableError)
+                    for _, result in sorted(c.compress_many([f"doc {i}" for i in range(20)]))
+                ]
+
+        assert outcomes(7) == outcomes(7)
+        assert any(outcomes(7)) and not all(outcomes(7))
+
+    def test_retries_absorb_errors(self):
+        """Test a retry policy hides a moderate error rate."""
+        transport = MockTransport(MockConfig(error_rate=0.3, seed=1))
+        retry = RetryPolicy(max_attempts=10, base_delay=0.001, max_delay=0.001)
+        with _client(transport, retry=retry) as c:
+            for i in range(10):
+                c.compress(context=f"document {i} here")
+        assert transport.stats.errors > 0
+        assert transport.stats.requests == 10 + transport.stats.errors
+
+    def test_latency(self):
+        """Test latency_ms delays each response."""
+        with _client(MockTransport(MockConfig(latency_ms=50))) as c:
+            started = time.monotonic()
+            c.compress(context="slow one")
+        assert time.monotonic() - started >= 0.05
+
+    async def test_concurrency_observed(self):
+        """Test max_in_flight reflects how many requests overlapped."""
+        transport = MockTransport(MockConfig(latency_ms=30))
+        async with _client(transport) as c:
+            await asyncio.gather(*(c.compress_async(context=f"doc {i}") for i in range(5)))
+        assert transport.stats.max_in_flight == 5
+        assert transport.stats.in_flight == 0
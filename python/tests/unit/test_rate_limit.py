@@ -0,0 +1,126 @@
+"""
+Unit Tests for the client-side rate limiter
+
+Tests token-bucket pacing of requests and context bytes on sync and async paths.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from compresr import CompressionClient, RateLimit
+from compresr.exceptions import DeadlineExceededError
+from compresr.services.deadline import deadline_scope
+from compresr.services.rate_limit import RateLimiter, context_bytes
+
+from .conftest import TEST_API_KEY
+
+
+class TestRateLimiter:
+    """Test RateLimiter pacing."""
+
+    def test_burst_then_paced(self):
+        """Test the burst passes immediately and the rest is paced at the rate."""
+        limiter = RateLimiter(RateLimit(requests_per_second=100, burst_requests=5))
+        start = time.monotonic()
+        for _ in range(10):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert 0.04 <= elapsed < 0.2
+        assert limiter.stats.acquired == 10
+        assert limiter.stats.throttled == 5
+
+    def test_byte_budget(self):
+        """Test large payloads wait for byte tokens."""
+        limiter = RateLimiter(RateLimit(bytes_per_second=10_000))
+        start = time.monotonic()
+        limiter.acquire(10_000)
+        limiter.acquire(1_000)
+        assert time.monotonic() - start >= 0.09
+
+    def test_shared_across_threads(self):
+        """Test concurrent threads share one budget."""
+        limiter = RateLimiter(RateLimit(requests_per_second=200, burst_requests=1))
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(11)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert time.monotonic() - start >= 0.045
+
+    async def test_async_acquire_paced(self):
+        """Test concurrent tasks are paced without blocking the loop."""
+        limiter = RateLimiter(RateLimit(requests_per_second=200, burst_requests=1))
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(11)))
+        assert time.monotonic() - start >= 0.045
+
+    async def test_cancelled_waiter_refunds(self):
+        """Test a cancelled acquire gives its reservation back."""
+        limiter = RateLimiter(RateLimit(requests_per_second=10, burst_requests=1))
+        await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        start = time.monotonic()
+        await limiter.acquire_async()
+        assert time.monotonic() - start < 0.15
+        assert limiter.stats.acquired == 2
+
+    def test_deadline_refusal_not_counted(self):
+        """Test a wait refused by the deadline is left out of the stats."""
+        limiter = RateLimiter(RateLimit(requests_per_second=1, burst_requests=1))
+        limiter.acquire()
+        with deadline_scope(0.1):
+            with pytest.raises(DeadlineExceededError):
+                limiter.acquire()
+
+        stats = limiter.stats
+        assert (stats.acquired, stats.throttled, stats.total_wait_seconds) == (1, 0, 0.0)
+
+    def test_context_bytes(self):
+        """Test context bytes cover single and batch payloads."""
+        assert context_bytes({"context": "héllo"}) == 6
+        assert context_bytes({"inputs": [{"context": "ab"}, {"context": "cde"}]}) == 5
+        assert context_bytes(None) == 0
+
+
+class TestClientRateLimit:
+    """Test the limiter on client calls."""
+
+    def test_requests_paced(self, fake_server):
+        """Test sync compress() calls respect requests_per_second."""
+        client = CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            rate_limit=RateLimit(requests_per_second=100, burst_requests=1),
+        )
+        start = time.monotonic()
+        for i in range(6):
+            client.compress(context=f"doc {i}")
+        client.close_sync()
+
+        assert time.monotonic() - start >= 0.045
+        assert client.rate_limit_stats.acquired == 6
+
+    async def test_async_requests_paced(self, fake_server):
+        """Test async calls share the same limiter."""
+        client = CompressionClient(
+            api_key=TEST_API_KEY,
+            base_url=fake_server.url,
+            rate_limit=RateLimit(requests_per_second=100, burst_requests=1),
+        )
+        start = time.monotonic()
+        await asyncio.gather(*(client.compress_async(context=f"doc {i}") for i in range(6)))
+        await client.close()
+
+        assert time.monotonic() - start >= 0.045
+        # The first request may find part of a token refilled by scheduling delays
+        assert client.rate_limit_stats.throttled >= 4
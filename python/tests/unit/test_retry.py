@@ -0,0 +1,145 @@
+"""
+Unit Tests for the retry policy
+
+Tests backoff computation, retry_after handling and retries on the
+sync, async and stream paths.
+"""
+
+import pytest
+
+from compresr import CompressionClient, RetryPolicy
+from compresr.exceptions import (
+    AuthenticationError,
+    DeadlineExceededError,
+    RateLimitError,
+    ServerError,
+    ServiceUnavailableError,
+    TimeoutError,
+    ValidationError,
+)
+
+from .conftest import TEST_API_KEY
+
+FAST = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01)
+
+
+@pytest.fixture
+def retry_client(fake_server):
+    client = CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url, retry=FAST)
+    yield client
+    client.close_sync()
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy.backoff()."""
+
+    def test_full_jitter_within_exponential_ceiling(self):
+        """Test delays are drawn from [0, base * 2**(n-1)] capped at max_delay."""
+        policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=4.0)
+        for retry, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (5, 4.0)]:
+            for _ in range(20):
+                assert 0 <= policy.backoff(retry, ServerError("x")) <= ceiling
+
+    def test_no_jitter_uses_ceiling(self):
+        """Test jitter=False waits the full exponential delay."""
+        policy = RetryPolicy(max_attempts=5, base_delay=0.5, jitter=False)
+        assert [policy.backoff(n, ServerError("x")) for n in (1, 2, 3)] == [0.5, 1.0, 2.0]
+
+    def test_retry_after_is_floor(self):
+        """Test server retry_after is waited plus jitter."""
+        policy = RetryPolicy(base_delay=1.0)
+        delay = policy.backoff(1, RateLimitError("slow", retry_after=2))
+        assert 2 <= delay <= 3
+
+    def test_retry_after_beyond_max_delay_gives_up(self):
+        """Test a retry_after longer than max_delay is not waited for."""
+        policy = RetryPolicy(max_delay=5)
+        assert policy.backoff(1, ServiceUnavailableError("down", retry_after=60)) is None
+
+    def test_non_retryable_and_exhausted(self):
+        """Test non-retryable errors and the last attempt give up."""
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.backoff(1, AuthenticationError("bad key")) is None
+        assert policy.backoff(2, ServerError("x")) is None
+
+    def test_deadline_not_retried(self):
+        """Test the caller's deadline is never retried, though it is a TimeoutError."""
+        policy = RetryPolicy(max_attempts=5)
+        assert policy.backoff(1, TimeoutError("slow")) is not None
+        assert policy.backoff(1, DeadlineExceededError("out of time")) is None
+
+
+class TestClientRetries:
+    """Test retries through the client."""
+
+    def test_sync_retries_then_succeeds(self, retry_client, fake_server):
+        """Test a transient 503 and 500 are retried until success."""
+        fake_server.queue_response(503, {"error": "down"})
+        fake_server.queue_response(500, {"error": "boom"})
+        response = retry_client.compress(context="a b c d")
+
+        assert response.data.compressed_context == "a b"
+        assert len(fake_server.requests) == 3
+        stats = retry_client.retry_stats
+        assert (stats.calls, stats.attempts, stats.retries) == (1, 3, 2)
+        assert stats.retries_by_error == {"ServiceUnavailableError": 1, "ServerError": 1}
+
+    def test_gives_up_after_max_attempts(self, retry_client, fake_server):
+        """Test the last error is raised once attempts are exhausted."""
+        for _ in range(3):
+            fake_server.queue_response(429, {"error": "slow down"})
+        with pytest.raises(RateLimitError):
+            retry_client.compress(context="a b")
+
+        assert len(fake_server.requests) == 3
+        assert retry_client.retry_stats.exhausted == 1
+
+    def test_non_retryable_raised_immediately(self, retry_client, fake_server):
+        """Test a 422 is not retried."""
+        fake_server.queue_response(422, {"detail": "bad"})
+        with pytest.raises(ValidationError):
+            retry_client.compress(context="a b")
+        assert len(fake_server.requests) == 1
+
+    async def test_async_retries(self, retry_client, fake_server):
+        """Test the async path retries the same way."""
+        fake_server.queue_response(429, {"error": "slow down"})
+        response = await retry_client.compress_async(context="a b c d")
+
+        assert response.success
+        assert len(fake_server.requests) == 2
+        await retry_client.close()
+
+    def test_batch_shard_retried(self, retry_client, fake_server):
+        """Test a failed batch request is retried."""
+        fake_server.queue_response(500, {"error": "boom"})
+        response = retry_client.compress_batch(contexts=["a b", "c d"])
+        assert response.data.count == 2
+        assert len(fake_server.requests) == 2
+
+    def test_stream_connect_retried(self, retry_client, fake_server):
+        """Test a stream failing before its first chunk is retried."""
+        fake_server.queue_response(503, {"error": "down"})
+        chunks = [c.content for c in retry_client.compress_stream(context="one two three four")]
+
+        assert "".join(chunks) == "one two "
+        assert len(fake_server.requests) == 2
+
+    async def test_stream_async_connect_retried(self, retry_client, fake_server):
+        """Test the async stream retries before its first chunk."""
+        fake_server.queue_response(500, {"error": "boom"})
+        chunks = [
+            c.content
+            async for c in retry_client.compress_stream_async(context="one two three four")
+        ]
+
+        assert "".join(chunks) == "one two "
+        assert len(fake_server.requests) == 2
+        await retry_client.close()
+
+    def test_disabled_by_default(self, client, fake_server):
+        """Test no retries happen without a policy."""
+        fake_server.queue_response(503, {"error": "down"})
+        with pytest.raises(ServiceUnavailableError):
+            client.compress(context="a b")
+        assert client.retry_stats is None
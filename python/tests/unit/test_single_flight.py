@@ -0,0 +1,146 @@
+"""
+Unit Tests for single-flight de-duplication
+
+Tests that identical in-flight requests share one HTTP call and its outcome.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from compresr import CompressionClient
+from compresr.exceptions import DeadlineExceededError, ServerError
+
+from .conftest import TEST_API_KEY
+
+
+@pytest.fixture
+def sf_client(fake_server):
+    client = CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url, single_flight=True)
+    yield client
+    client.close_sync()
+
+
+class TestSingleFlightAsync:
+    """Test compress_async() de-duplication."""
+
+    async def test_identical_calls_share_request(self, sf_client, fake_server):
+        """Test concurrent identical calls issue a single HTTP request."""
+        fake_server.response_delay = 0.05
+        results = await asyncio.gather(
+            *(sf_client.compress_async(context="popular document body") for _ in range(20))
+        )
+
+        assert len(fake_server.requests) == 1
+        assert {r.data.compressed_context for r in results} == {"popular"}
+        assert sf_client.single_flight_stats.shared == 19
+        await sf_client.close()
+
+    async def test_distinct_requests_not_merged(self, sf_client, fake_server):
+        """Test different contexts or queries each get their own request."""
+        fake_server.response_delay = 0.02
+        await asyncio.gather(
+            sf_client.compress_async(context="doc one"),
+            sf_client.compress_async(context="doc two"),
+            sf_client.compress_async(
+                context="doc one", query="q?", compression_model_name="latte_v1"
+            ),
+        )
+        assert len(fake_server.requests) == 3
+        await sf_client.close()
+
+    async def test_exception_shared(self, sf_client, fake_server):
+        """Test every waiter receives the leader's exception."""
+        fake_server.response_delay = 0.05
+        fake_server.queue_response(500, {"error": "boom"})
+        results = await asyncio.gather(
+            *(sf_client.compress_async(context="failing doc") for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        assert len(fake_server.requests) == 1
+        assert all(isinstance(r, ServerError) for r in results)
+        await sf_client.close()
+
+    async def test_leader_cancellation_spares_waiters(self, sf_client, fake_server):
+        """Test cancelling the caller that started the request does not fail the others."""
+        fake_server.response_delay = 0.05
+        leader = asyncio.ensure_future(sf_client.compress_async(context="shared doc"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(sf_client.compress_async(context="shared doc"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        response = await follower
+        assert response.data.original_context == "shared doc"
+        assert len(fake_server.requests) == 1
+        await sf_client.close()
+
+    async def test_leader_deadline_spares_waiters(self, sf_client, fake_server):
+        """Test the leader's deadline bounds only its own wait, not the shared call."""
+        fake_server.response_delay = 0.3
+        leader = asyncio.ensure_future(sf_client.compress_async(context="shared doc", deadline=0.1))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(sf_client.compress_async(context="shared doc"))
+
+        with pytest.raises(DeadlineExceededError):
+            await leader
+        response = await follower
+        assert response.data.original_context == "shared doc"
+        assert len(fake_server.requests) == 1
+        await sf_client.close()
+
+
+class TestSingleFlightSync:
+    """Test compress() de-duplication across threads."""
+
+    def test_threads_share_request(self, sf_client, fake_server):
+        """Test identical calls from many threads issue a single HTTP request."""
+        fake_server.response_delay = 0.1
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(sf_client.compress(context="hot document"))
+            )
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 8
+        assert len(fake_server.requests) == 1
+        assert sf_client.single_flight_stats.calls == 8
+
+    def test_leader_deadline_spares_waiters(self, sf_client, fake_server):
+        """Test the leader's deadline bounds only its own wait, not the shared call."""
+        fake_server.response_delay = 0.3
+        outcomes = {}
+
+        def call(name, **kwargs):
+            try:
+                outcomes[name] = sf_client.compress(context="shared doc", **kwargs)
+            except Exception as e:
+                outcomes[name] = e
+
+        leader = threading.Thread(target=call, args=("leader",), kwargs={"deadline": 0.1})
+        leader.start()
+        time.sleep(0.02)
+        follower = threading.Thread(target=call, args=("follower",))
+        follower.start()
+        leader.join()
+        follower.join()
+
+        assert isinstance(outcomes["leader"], DeadlineExceededError)
+        assert outcomes["follower"].data.original_context == "shared doc"
+        assert len(fake_server.requests) == 1
+
+    def test_sequential_calls_not_shared(self, sf_client, fake_server):
+        """Test a call after the first completes sends again (no caching)."""
+        sf_client.compress(context="a b c d")
+        sf_client.compress(context="a b c d")
+        assert len(fake_server.requests) == 2
+        assert sf_client.single_flight_stats.shared == 0
@@ -0,0 +1,276 @@
+"""
+Unit Tests for the pooled HTTP transport
+
+Tests connection reuse, pool statistics and lifecycle of the sync client.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from compresr import CompressionClient
+from compresr.exceptions import ConnectionError as CompresrConnectionError
+from compresr.exceptions import RateLimitError, ServerError
+from compresr.services.mock import MockConfig, MockTransport
+from compresr.services.transport import default_ssl_context
+
+from .conftest import TEST_API_KEY, fake_compress
+
+
+class TestConnectionReuse:
+    """Test keep-alive connection reuse on the sync path."""
+
+    def test_sequential_calls_reuse_one_connection(self, client):
+        """Test sequential compress() calls share a single keep-alive connection."""
+        for _ in range(5):
+            response = client.compress(context="one two three four")
+            assert response.data.compressed_context == "one two"
+
+        stats = client.pool_stats
+        assert stats.requests == 5
+        assert stats.connections_opened == 1
+        assert stats.connections_reused == 4
+        assert stats.in_flight == 0
+
+    def test_concurrent_calls_bounded_by_pool_size(self, fake_server):
+        """Test concurrent threads never open more connections than the pool size."""
+        client = CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url, pool_size=2)
+        with client:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: client.compress(context="a b c d"), range(32)))
+
+            stats = client.pool_stats
+            assert stats.pool_size == 2
+            assert stats.requests == 32
+            assert stats.connections_opened <= 2
+
+    def test_default_pool_does_not_cap_concurrency(self):
+        """Test without pool_size, 40 threads run at once and httpx's limits apply."""
+        transport = MockTransport(MockConfig(latency_ms=100))
+        with CompressionClient(api_key=TEST_API_KEY, transport=transport) as client:
+            with ThreadPoolExecutor(max_workers=40) as pool:
+                list(pool.map(lambda _: client.compress(context="a b c d"), range(40)))
+            limits = client._limits()
+        assert transport.stats.max_in_flight > 10
+        assert (limits.max_connections, limits.max_keepalive_connections) == (100, 20)
+
+    def test_ssl_context_is_shared(self):
+        """Test the SSL context is created once per process."""
+        assert default_ssl_context() is default_ssl_context()
+
+
+class TestLifecycle:
+    """Test closing the pooled client."""
+
+    def test_close_sync_reopens_lazily(self, client):
+        """Test a closed client transparently opens a new pool on next use."""
+        client.compress(context="a b")
+        client.close_sync()
+        assert client._sync_client is None
+
+        client.compress(context="a b")
+        assert client.pool_stats.connections_opened == 2
+
+    def test_context_manager_closes_pool(self, fake_server):
+        """Test leaving the with-block releases the pool."""
+        with CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url) as client:
+            client.compress(context="a b")
+            assert client._sync_client is not None
+        assert client._sync_client is None
+
+    async def test_async_close_also_closes_sync_pool(self, client):
+        """Test await close() releases the sync pool too."""
+        client.compress(context="a b")
+        await client.close()
+        assert client._sync_client is None
+
+
+class TestErrorMapping:
+    """Test HTTP errors are still mapped to SDK exceptions."""
+
+    def test_rate_limit_error(self, client, fake_server):
+        """Test 429 maps to RateLimitError with retry_after."""
+        fake_server.queue_response(429, {"error": "slow down", "retry_after": 3})
+        with pytest.raises(RateLimitError) as exc_info:
+            client.compress(context="a b")
+        assert exc_info.value.retry_after == 3
+
+    def test_server_error(self, client, fake_server):
+        """Test 500 maps to ServerError."""
+        fake_server.queue_response(500, {"error": "boom"})
+        with pytest.raises(ServerError):
+            client.compress(context="a b")
+
+    def test_connection_refused(self):
+        """Test an unreachable host raises ConnectionError."""
+        client = CompressionClient(api_key=TEST_API_KEY, base_url="http://127.0.0.1:9")
+        with pytest.raises(CompresrConnectionError):
+            client.compress(context="a b")
+
+
+class TestPooledStreaming:
+    """Test compress_stream() on the shared pooled client."""
+
+    def test_stream_yields_chunks(self, client):
+        """Test streamed chunks reassemble the compressed context."""
+        chunks = list(client.compress_stream(context="one two three four"))
+        assert chunks[-1].done is True
+        assert "".join(c.content for c in chunks).split() == ["one", "two"]
+
+    def test_streams_reuse_connection(self, client):
+        """Test consecutive streams and requests share one keep-alive connection."""
+        timings = []
+        for _ in range(3):
+            list(client.compress_stream(context="a b c d", on_timing=timings.append))
+        client.compress(context="a b c d")
+
+        assert client.pool_stats.connections_opened == 1
+        assert timings[0].reused_connection is False
+        assert timings[0].connect_ms is not None
+        assert timings[0].tls_ms is None  # plain HTTP
+        assert all(t.reused_connection for t in timings[1:])
+        assert all(t.first_byte_ms > 0 for t in timings)
+
+    def test_queue_wait_reported_apart_from_first_byte(self, fake_server):
+        """Test waiting for a pool slot counts as queue_ms, not first_byte_ms."""
+        fake_server.delays["occupier"] = 0.3
+        timings = []
+        with CompressionClient(api_key=TEST_API_KEY, base_url=fake_server.url, pool_size=1) as c:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                occupier = pool.submit(c.compress, context="occupier")
+                while not fake_server.active:
+                    time.sleep(0.005)
+                list(c.compress_stream(context="a b c d", on_timing=timings.append))
+                occupier.result()
+
+        assert timings[0].queue_ms >= 150
+        assert timings[0].first_byte_ms < 150
+
+    def test_stream_error_status(self, client, fake_server):
+        """Test an error status on the stream endpoint raises the mapped error."""
+        fake_server.queue_response(429, {"error": "slow down"})
+        with pytest.raises(RateLimitError):
+            list(client.compress_stream(context="a b"))
+        assert client.pool_stats.in_flight == 0
+
+
+class TestAsyncStreaming:
+    """Test compress_stream_async() on the shared async client."""
+
+    async def test_async_stream_yields_chunks(self, client):
+        """Test async streamed chunks reassemble the compressed context."""
+        chunks = [c async for c in client.compress_stream_async(context="one two three four")]
+        assert chunks[-1].done is True
+        assert "".join(c.content for c in chunks).split() == ["one", "two"]
+        await client.close()
+
+    async def test_async_streams_share_async_pool(self, client):
+        """Test async streams and compress_async share keep-alive connections."""
+        timings = []
+        for _ in range(3):
+            async for _chunk in client.compress_stream_async(
+                context="a b c d", on_timing=timings.append
+            ):
+                pass
+        await client.compress_async(context="a b c d")
+
+        stats = client.async_pool_stats
+        assert stats.requests == 4
+        assert stats.connections_opened == 1
+        assert [t.reused_connection for t in timings] == [False, True, True]
+        await client.close()
+
+    async def test_early_close_releases_connection(self, client, fake_server):
+        """Test closing the generator mid-stream frees the pool slot immediately."""
+        fake_server.stream_delay = 0.05
+        stream = client.compress_stream_async(context=" ".join(["w"] * 40))
+        async for chunk in stream:
+            assert chunk.content
+            break
+        await stream.aclose()
+
+        assert client.async_pool_stats.in_flight == 0
+        await client.close()
+
+    async def test_cancellation_releases_connection(self, client, fake_server):
+        """Test cancelling the consuming task frees the pool slot."""
+        fake_server.stream_delay = 0.05
+        received = []
+
+        async def consume():
+            async for chunk in client.compress_stream_async(context=" ".join(["w"] * 40)):
+                received.append(chunk)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert 0 < len(received) < 20
+        assert client.async_pool_stats.in_flight == 0
+        await client.close()
+
+
+class TestUnixSocket:
+    """Test unix:// base URLs and injected transports."""
+
+    def test_compress_over_unix_socket(self, unix_server):
+        """Test requests reach a sidecar listening on a Unix socket."""
+        with CompressionClient(api_key=TEST_API_KEY, base_url=unix_server.url) as c:
+            for _ in range(3):
+                response = c.compress(context="one two three four")
+                assert response.data.compressed_context == "one two"
+            chunks = [chunk.content for chunk in c.compress_stream(context="one two three four")]
+            assert "".join(chunks).split() == ["one", "two"]
+            assert c.pool_stats.connections_opened == 1
+            assert c.pool_stats.tls_handshakes == 0
+        assert unix_server.requests[0][1] == "/api/compress/question-agnostic/"
+
+    async def test_async_over_unix_socket(self, unix_server):
+        """Test the async client also uses the socket."""
+        async with CompressionClient(api_key=TEST_API_KEY, base_url=unix_server.url) as c:
+            responses = await asyncio.gather(
+                *(c.compress_async(context=f"async call {i} here") for i in range(3))
+            )
+        assert len(responses) == len(unix_server.requests) == 3
+
+    def test_balances_across_sockets_and_tcp(self, unix_server, fake_server):
+        """Test unix:// and http:// endpoints can be mixed in one balanced client."""
+        # Concurrent calls go to the least-busy endpoint, so they are split
+        # deterministically (sequential ones would pick at random)
+        unix_server.response_delay = fake_server.response_delay = 0.2
+        with CompressionClient(
+            api_key=TEST_API_KEY, base_url=[unix_server.url, fake_server.url]
+        ) as c:
+            threads = [
+                threading.Thread(target=c.compress, args=(f"request number {i} here",))
+                for i in range(2)
+            ]
+            for t in threads:
+                t.start()
+                time.sleep(0.05)
+            for t in threads:
+                t.join()
+            assert {s.url for s in c.endpoint_stats} == {unix_server.url, fake_server.url}
+        assert len(unix_server.requests) == len(fake_server.requests) == 1
+
+    def test_injected_transport(self):
+        """Test an injected transport serves every request, sync and async."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"success": True, "data": fake_compress("a b")})
+
+        transport = httpx.MockTransport(handler)
+        with CompressionClient(
+            api_key=TEST_API_KEY, transport=transport, async_transport=transport
+        ) as c:
+            assert c.compress(context="a b").data.compressed_context == "a"
+            asyncio.run(c.compress_async(context="a b"))
+        assert seen == ["/api/compress/question-agnostic/"] * 2